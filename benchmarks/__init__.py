@@ -0,0 +1,7 @@
+# benchmarks/__init__.py
+"""
+Banco de pruebas de rendimiento de los métodos de optimization_methods.
+
+    python -m benchmarks -o resultados.json
+    python -m benchmarks --compare baseline.json
+"""
@@ -0,0 +1,37 @@
+# benchmarks/__main__.py
+import argparse
+import sys
+
+from benchmarks.runner import METHODS, run_suite, compare, format_results, format_comparison, load, save
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks",
+                                     description="Mide los métodos sobre el corpus de funciones de prueba.")
+    parser.add_argument("-m", "--method", action="append", choices=list(METHODS),
+                        help="método a medir (repetible; por defecto todos)")
+    parser.add_argument("-r", "--repeats", type=int, default=5, help="repeticiones por medición")
+    parser.add_argument("--trace", default="dataframe", choices=["none", "arrays", "dataframe"],
+                        help="modo de registro de iteraciones de los métodos")
+    parser.add_argument("-o", "--output", help="guardar los resultados en JSON")
+    parser.add_argument("--compare", metavar="BASELINE", help="comparar contra un JSON guardado")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="aumento relativo de tiempo considerado regresión (0.2 = 20 %%)")
+    args = parser.parse_args(argv)
+
+    report = run_suite(args.method, repeats=max(1, args.repeats), trace=args.trace)
+    print(format_results(report))
+    if args.output:
+        save(report, args.output)
+
+    if args.compare:
+        rows = compare(report, load(args.compare), threshold=args.threshold)
+        print()
+        print(format_comparison(rows))
+        if any(r["regression"] for r in rows):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,33 @@
+# benchmarks/corpus.py
+from dataclasses import dataclass
+from typing import Tuple
+
+@dataclass(frozen=True)
+class TestProblem:
+    name: str
+    expr: str
+    bracket: Tuple[float, float]   # intervalo con cambio de signo (raíces) o que contiene el óptimo
+    x0: float                      # punto inicial para los métodos tipo Newton
+    solution: float                # raíz o máximo conocido
+
+
+# Raíces: f(x) = 0 con cambio de signo en el intervalo
+ROOT_PROBLEMS = (
+    TestProblem("cubic", "x**3 - x - 2", (1.0, 2.0), 1.5, 1.5213797068045676),
+    TestProblem("sqrt2", "x**2 - 2", (0.0, 2.0), 1.0, 1.4142135623730951),
+    TestProblem("dottie", "cos(x) - x", (0.0, 1.0), 0.5, 0.7390851332151607),
+    TestProblem("omega", "x*exp(x) - 1", (0.0, 1.0), 0.5, 0.5671432904097838),
+    TestProblem("log_plus_x", "log(x) + x", (0.1, 1.0), 0.5, 0.5671432904097838),
+    TestProblem("exp_minus_3x", "exp(x) - 3*x", (0.0, 1.0), 0.0, 0.6190612867359451),
+    TestProblem("x10", "x**10 - 1", (0.0, 1.3), 1.2, 1.0),
+    TestProblem("parabola_gui", "3*x**2 - 120*x + 100", (-10.0, 20.0), 0.0, 0.851457844873238),
+)
+
+# Máximos (los métodos del proyecto maximizan)
+OPTIMUM_PROBLEMS = (
+    TestProblem("chapra", "2*sin(x) - x**2/10", (0.0, 4.0), 2.5, 1.4275517787645941),
+    TestProblem("parabola", "-(x - 2)**2 + 1", (0.0, 5.0), 1.0, 2.0),
+    TestProblem("x_exp", "x*exp(-x)", (0.0, 4.0), 0.5, 1.0),
+    TestProblem("quartic", "-x**4 + 2*x**2", (0.2, 3.0), 0.8, 1.0),
+    TestProblem("sin_sum", "-(sin(x) + sin(10*x/3))", (2.7, 7.5), 5.0, 5.145735290256128),
+)
@@ -0,0 +1,214 @@
+# benchmarks/runner.py
+import json
+import platform
+import statistics
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+from optimization_methods.utils import compile_expression, compile_fused, clear_expression_cache
+from optimization_methods.bisection import bisection
+from optimization_methods.brent_optimize import brent_optimize
+from optimization_methods.brent_root import brent_root
+from optimization_methods.false_position import false_position
+from optimization_methods.golden_ratio import golden_ratio
+from optimization_methods.newton import newton_optimize
+from optimization_methods.newton_raphson import newton_raphson
+from optimization_methods.quadratic_interpolation import quadratic_interpolation_method
+from optimization_methods.random_search import random_search
+from benchmarks.corpus import ROOT_PROBLEMS, OPTIMUM_PROBLEMS, TestProblem
+
+TOL = 1e-8
+MAX_ITER = 200
+RANDOM_SAMPLES = 10_000
+
+
+def _n_evals(r) -> int:
+    return r.n_f_evals + r.n_df_evals + r.n_d2f_evals
+
+
+# Cada adaptador: (compilar(problema), iterar(problema, trace) -> (x, iteraciones, evaluaciones))
+def _compile_f(p: TestProblem):
+    compile_expression(p.expr, 0)
+
+def _compile_newton(p: TestProblem):
+    compile_fused(p.expr, (1, 2))
+
+def _compile_newton_raphson(p: TestProblem):
+    compile_fused(p.expr, (0, 1))
+
+def _iter_callable(method, attr, **options):
+    def run(p: TestProblem, trace: str):
+        f = compile_expression(p.expr, 0)[2]
+        r = method(f, *p.bracket, max_iter=MAX_ITER, tol=TOL, trace=trace, **options)
+        return getattr(r, attr), r.iterations, _n_evals(r)
+    return run
+
+def _iter_newton(p: TestProblem, trace: str):
+    r = newton_optimize(p.expr, p.x0, tol=TOL, max_iter=MAX_ITER, trace=trace)
+    return r.x_opt, r.iterations, _n_evals(r)
+
+def _iter_newton_raphson(p: TestProblem, trace: str):
+    r = newton_raphson(p.expr, p.x0, tol=TOL, max_iter=MAX_ITER, trace=trace)
+    return r.root, r.iterations, _n_evals(r)
+
+def _iter_newton_raphson_safeguarded(p: TestProblem, trace: str):
+    r = newton_raphson(p.expr, p.x0, tol=TOL, max_iter=MAX_ITER, trace=trace, bracket=p.bracket)
+    return r.root, r.iterations, _n_evals(r)
+
+def _iter_quadratic(p: TestProblem, trace: str):
+    a, b = p.bracket
+    r = quadratic_interpolation_method(p.expr, a, (a + b) / 2, b, tol=TOL, max_iter=MAX_ITER, trace=trace)
+    return r.point, r.iterations, _n_evals(r)
+
+def _iter_random(p: TestProblem, trace: str):
+    r = random_search(p.expr, *p.bracket, max_iter=RANDOM_SAMPLES, seed=0, trace=trace)
+    return r.x_best, r.iterations, _n_evals(r)
+
+
+METHODS: Dict[str, tuple] = {
+    # nombre: (problemas, compilar, iterar)
+    "bisection": (ROOT_PROBLEMS, _compile_f, _iter_callable(bisection, "root")),
+    "false_position": (ROOT_PROBLEMS, _compile_f, _iter_callable(false_position, "root")),
+    "false_position_illinois": (ROOT_PROBLEMS, _compile_f,
+                                _iter_callable(false_position, "root", variant="illinois")),
+    "false_position_pegasus": (ROOT_PROBLEMS, _compile_f,
+                               _iter_callable(false_position, "root", variant="pegasus")),
+    "false_position_anderson_bjorck": (ROOT_PROBLEMS, _compile_f,
+                                       _iter_callable(false_position, "root", variant="anderson_bjorck")),
+    "brent_root": (ROOT_PROBLEMS, _compile_f, _iter_callable(brent_root, "root")),
+    "newton_raphson": (ROOT_PROBLEMS, _compile_newton_raphson, _iter_newton_raphson),
+    "newton_raphson_safeguarded": (ROOT_PROBLEMS, _compile_newton_raphson, _iter_newton_raphson_safeguarded),
+    "golden_ratio": (OPTIMUM_PROBLEMS, _compile_f, _iter_callable(golden_ratio, "point")),
+    "brent_optimize": (OPTIMUM_PROBLEMS, _compile_f, _iter_callable(brent_optimize, "point")),
+    "newton": (OPTIMUM_PROBLEMS, _compile_newton, _iter_newton),
+    "quadratic_interpolation": (OPTIMUM_PROBLEMS, _compile_f, _iter_quadratic),
+    "random_search": (OPTIMUM_PROBLEMS, _compile_f, _iter_random),
+}
+
+
+def _timed(fn: Callable, *args):
+    t0 = time.perf_counter()
+    out = fn(*args)
+    return time.perf_counter() - t0, out
+
+
+def measure(method: str, problem: TestProblem, repeats: int = 5, trace: str = "dataframe") -> dict:
+    """
+    Mide un método sobre un problema:
+      - compile_s: sympify/diff/lambdify con la caché de expresiones vacía (mediana)
+      - iterate_s: el método con la caché ya caliente (mínimo de `repeats`)
+      - peak_kb:   pico de memoria de una ejecución aparte bajo tracemalloc
+      - n_evals:   evaluaciones de f + f' + f'' reportadas por el resultado
+      - abs_error: |x - solución conocida|
+    """
+    _, compile_fn, iterate_fn = METHODS[method]
+    row = {"method": method, "problem": problem.name, "expr": problem.expr}
+    try:
+        compile_times, iterate_times = [], []
+        for _ in range(repeats):
+            clear_expression_cache()
+            compile_times.append(_timed(compile_fn, problem)[0])
+            secs, (x, iterations, n_evals) = _timed(iterate_fn, problem, trace)
+            iterate_times.append(secs)
+
+        tracemalloc.start()
+        try:
+            iterate_fn(problem, trace)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        x = float(x)
+        row.update(
+            ok=True,
+            compile_s=statistics.median(compile_times),
+            iterate_s=min(iterate_times),
+            iterations=int(iterations),
+            n_evals=n_evals,
+            peak_kb=peak / 1024,
+            x=x,
+            abs_error=abs(x - problem.solution) if np.isfinite(x) else float("inf"),
+        )
+    except Exception as e:
+        row.update(ok=False, error=f"{type(e).__name__}: {e}")
+    return row
+
+
+def run_suite(methods: Optional[List[str]] = None, repeats: int = 5, trace: str = "dataframe") -> dict:
+    results = []
+    for method in methods or list(METHODS):
+        problems = METHODS[method][0]
+        for problem in problems:
+            results.append(measure(method, problem, repeats=repeats, trace=trace))
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "repeats": repeats,
+            "trace": trace,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float = 0.2) -> List[dict]:
+    """
+    Compara dos corridas por (método, problema). Marca como regresión un aumento de
+    iterate_s mayor que `threshold` (20 % por defecto) o más evaluaciones de f.
+    """
+    base = {(r["method"], r["problem"]): r for r in baseline["results"] if r.get("ok")}
+    rows = []
+    for r in current["results"]:
+        b = base.get((r["method"], r["problem"]))
+        if b is None or not r.get("ok"):
+            continue
+        ratio = r["iterate_s"] / b["iterate_s"] if b["iterate_s"] else float("inf")
+        more_evals = (r.get("n_evals") is not None and b.get("n_evals") is not None
+                      and r["n_evals"] > b["n_evals"])
+        rows.append({
+            "method": r["method"], "problem": r["problem"],
+            "iterate_ratio": ratio,
+            "compile_ratio": r["compile_s"] / b["compile_s"] if b["compile_s"] else float("inf"),
+            "n_evals": r.get("n_evals"), "n_evals_base": b.get("n_evals"),
+            "regression": ratio > 1 + threshold or more_evals,
+        })
+    return rows
+
+
+def format_results(report: dict) -> str:
+    lines = [f"{'método':<32}{'problema':<14}{'compilar ms':>12}{'iterar ms':>11}{'iter':>6}"
+             f"{'evals':>7}{'pico KB':>9}{'|error|':>11}"]
+    for r in report["results"]:
+        if not r.get("ok"):
+            lines.append(f"{r['method']:<32}{r['problem']:<14}  {r['error']}")
+            continue
+        evals = "-" if r["n_evals"] is None else str(r["n_evals"])
+        lines.append(f"{r['method']:<32}{r['problem']:<14}{r['compile_s'] * 1e3:>12.3f}"
+                     f"{r['iterate_s'] * 1e3:>11.3f}{r['iterations']:>6}{evals:>7}"
+                     f"{r['peak_kb']:>9.1f}{r['abs_error']:>11.2e}")
+    return "\n".join(lines)
+
+
+def format_comparison(rows: List[dict]) -> str:
+    lines = [f"{'método':<32}{'problema':<14}{'iterar x':>10}{'compilar x':>12}{'evals':>13}"]
+    for r in rows:
+        evals = f"{r['n_evals_base']}->{r['n_evals']}" if r["n_evals"] is not None else "-"
+        flag = "  REGRESIÓN" if r["regression"] else ""
+        lines.append(f"{r['method']:<32}{r['problem']:<14}{r['iterate_ratio']:>10.2f}"
+                     f"{r['compile_ratio']:>12.2f}{evals:>13}{flag}")
+    return "\n".join(lines)
+
+
+def load(path: str) -> dict:
+    with open(path, encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+def save(report: dict, path: str):
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump(report, fh, indent=2, ensure_ascii=False)
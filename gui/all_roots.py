@@ -0,0 +1,34 @@
+# gui/all_roots.py
+from optimization_methods.utils import make_numeric_function
+from optimization_methods.sampling import sample_function
+from optimization_methods.all_roots import find_all_roots
+
+MAX_LISTED = 8    # raíces que se listan en la etiqueta; el resto solo se marca en la gráfica
+
+
+def all_roots_job(fx: str, xl: float, xu: float):
+    """
+    Trabajo para RunControls.run(): busca todas las raíces en [xl, xu] y muestrea
+    f para graficarla, ambas cosas fuera del hilo de Tk.
+    """
+    def job(callback):
+        _, _, fnum = make_numeric_function(fx)
+        found = find_all_roots(fx, xl, xu)
+        sampled = sample_function(fnum, min(xl, xu), max(xl, xu))
+        return fx, fnum, found, sampled
+    return job
+
+
+def show_all_roots(plot, label, payload):
+    """Grafica f con todas las raíces marcadas y las lista en la etiqueta."""
+    fx, _, found, sampled = payload
+    n = found.roots.size
+    listed = ", ".join(f"{x:.6f}" for x in found.roots[:MAX_LISTED])
+    if n > MAX_LISTED:
+        listed += ", …"
+    text = f"{n} raíces en el intervalo" + (f": {listed}" if n else "")
+    if found.poles.size:
+        text += f"  |  {found.poles.size} polo(s)/salto(s) descartado(s)"
+    label.config(text=text)
+    points = (found.roots, found.f_roots, f"Raíces ({n})") if n else None
+    plot.plot_function(sampled.xs, sampled.ys, f"f(x) = {fx}", points, ylim=sampled.ylim)
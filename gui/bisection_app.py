@@ -1,13 +1,14 @@
 # gui/bisection_app.py
 import tkinter as tk
 from tkinter import ttk, messagebox
-from tkinter import scrolledtext
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.figure import Figure
-import numpy as np
 
+from gui.worker import RunControls
+from gui.plotting import PlotPanel, LiveConvergence
+from gui.table_view import open_table_window
+from gui.all_roots import all_roots_job, show_all_roots
 from optimization_methods.utils import make_numeric_function
-from optimization_methods.bisection import bisection, BisectionResult
+from optimization_methods.sampling import sample_function
+from optimization_methods.bisection import bisection
 
 class BisectionWindow(tk.Toplevel):
     def __init__(self, master=None):
@@ -17,7 +18,6 @@ class BisectionWindow(tk.Toplevel):
         self.configure(bg="white")
         self.resizable(True, True)
 
-        self._canvas = None         # canvas matplotlib embebido
         self._last_result = None    # BisectionResult
         self._f_numeric = None      # función numérica
         self._expr_str = None
@@ -53,7 +53,10 @@ class BisectionWindow(tk.Toplevel):
         tk.Button(btns, text="Calcular", command=self._on_calculate, bg="#16a34a", fg="white").pack(side="left", padx=4)
         tk.Button(btns, text="Graficar función", command=self._on_plot_function, bg="#2563eb", fg="white").pack(side="left", padx=4)
         tk.Button(btns, text="Ver tabla", command=self._on_show_table, bg="#f59e0b", fg="white").pack(side="left", padx=4)
+        tk.Button(btns, text="Todas las raíces", command=self._on_all_roots, bg="#7c3aed", fg="white").pack(side="left", padx=4)
         tk.Button(btns, text="Limpiar", command=self._on_clear, bg="#ef4444", fg="white").pack(side="left", padx=4)
+        self.run_controls = RunControls(btns)
+        self.run_controls.pack(side="right")
 
         # Resultado
         self.lbl_result = tk.Label(self, text="", bg="white", font=("Segoe UI", 10, "bold"))
@@ -62,6 +65,8 @@ class BisectionWindow(tk.Toplevel):
         # Área para gráficos (error o función)
         self.graph_area = tk.Frame(self, bg="white", height=500)
         self.graph_area.pack(fill="both", expand=True, padx=12, pady=8)
+        self.plot = PlotPanel(self.graph_area)   # figura persistente de la ventana
+        self.plot.pack(fill="both", expand=True)
 
         # Ayuda
         help_txt = ("Operadores: ** (potencia), * (producto), /, +, -\n"
@@ -76,25 +81,34 @@ class BisectionWindow(tk.Toplevel):
             xu = float(self.ent_xu.get())
             itmax = int(self.ent_iter.get())
             tol = float(self.ent_tol.get())
+        except Exception as e:
+            messagebox.showerror("Error", str(e))
+            return
 
+        # El cálculo corre fuera del hilo de Tk; callback permite progreso y cancelación
+        def job(callback):
             # función numérica segura
             _, _, fnum = make_numeric_function(fx)
-            self._f_numeric = fnum
-            self._expr_str = fx
+            result = bisection(fnum, xl, xu, max_iter=itmax, tol=tol, callback=callback)
+            return fx, fnum, result
 
-            result: BisectionResult = bisection(fnum, xl, xu, max_iter=itmax, tol=tol)
-            self._last_result = result
+        # Curva y etiqueta se actualizan en vivo (a lo más una vez por cuadro)
+        live = LiveConvergence(self.plot, self.lbl_result, title="Convergencia del error (|xu - xl|/2)")
+        self.run_controls.run(job, self._show_result, total=itmax, on_progress=live)
 
-            # Mostrar resultado
-            self.lbl_result.config(
-                text=f"Raíz ≈ {result.root:.10f}  |  f(raíz) = {result.f_root:.3e}  |  iter = {result.iterations}"
-            )
+    def _show_result(self, payload):
+        fx, fnum, result = payload
+        self._f_numeric = fnum
+        self._expr_str = fx
+        self._last_result = result
 
-            # Graficar error
-            self._plot_errors(result.errors)
+        # Mostrar resultado
+        self.lbl_result.config(
+            text=f"Raíz ≈ {result.root:.10f}  |  f(raíz) = {result.f_root:.3e}  |  iter = {result.iterations}"
+        )
 
-        except Exception as e:
-            messagebox.showerror("Error", str(e))
+        # Graficar error
+        self._plot_errors(result.errors)
 
     def _on_plot_function(self):
         try:
@@ -107,71 +121,50 @@ class BisectionWindow(tk.Toplevel):
 
             xl = float(self.ent_xl.get())
             xu = float(self.ent_xu.get())
-            xs = np.linspace(min(xl, xu), max(xl, xu), 600)
-            ys = self._f_numeric(xs)
+            sampled = sample_function(self._f_numeric, min(xl, xu), max(xl, xu))
+            xs, ys = sampled.xs, sampled.ys
 
-            fig = Figure(figsize=(7.8, 4.8), dpi=100)
-            ax = fig.add_subplot(111)
-            ax.plot(xs, ys, label=f"f(x) = {self._expr_str}")
-            ax.axhline(0, linewidth=0.8)
-            ax.axvline(0, linewidth=0.8)
-
-            # Marcar raíz si existe
+            points = None
             if self._last_result is not None:
                 xr = self._last_result.root
-                ax.scatter([xr], [self._f_numeric(xr)], s=35, label=f"Raíz ≈ {xr:.6f}")
-
-            ax.set_title("Gráfica de la función")
-            ax.set_xlabel("x"); ax.set_ylabel("f(x)")
-            ax.legend(loc="best")
-            fig.tight_layout()
-
-            self._embed_figure(fig)
+                points = (xr, self._f_numeric(xr), f"Raíz ≈ {xr:.6f}")
+            self.plot.plot_function(xs, ys, f"f(x) = {self._expr_str}", points, ylim=sampled.ylim)
         except Exception as e:
             messagebox.showerror("Error al graficar", str(e))
 
+    def _on_all_roots(self):
+        # Busca todas las raíces de f en [xl, xu] (sin exigir cambio de signo en los extremos)
+        try:
+            fx = self.ent_fx.get().strip()
+            xl = float(self.ent_xl.get())
+            xu = float(self.ent_xu.get())
+        except Exception as e:
+            messagebox.showerror("Error", str(e))
+            return
+        self.run_controls.run(all_roots_job(fx, xl, xu), self._show_all_roots)
+
+    def _show_all_roots(self, payload):
+        fx, fnum, _, _ = payload
+        self._f_numeric = fnum
+        self._expr_str = fx
+        show_all_roots(self.plot, self.lbl_result, payload)
+
     def _on_show_table(self):
         if self._last_result is None:
             messagebox.showinfo("Información", "Primero ejecuta el cálculo.")
             return
-        win = tk.Toplevel(self)
-        win.title("Tabla de iteraciones — Bisección")
-        win.geometry("800x420")
-
-        txt = scrolledtext.ScrolledText(win, wrap="none")
-        txt.pack(fill="both", expand=True)
-        txt.insert("1.0", self._last_result.table.to_string(index=False))
-        txt.configure(state="disabled")
+        open_table_window(self, "Tabla de iteraciones — Bisección", self._last_result.trace, "800x420")
 
     def _on_clear(self):
         self.lbl_result.config(text="")
         self._last_result = None
         self._f_numeric = None
         self._expr_str = None
-        self._clear_canvas()
+        self.plot.clear()
 
     # ---------- Helpers ----------
     def _plot_errors(self, errors):
-        fig = Figure(figsize=(7.8, 4.8), dpi=100)
-        ax = fig.add_subplot(111)
-        ax.plot(range(1, len(errors)+1), errors, marker="o")
-        ax.set_title(f"Convergencia del error (|xu - xl|/2)")
-        ax.set_xlabel("Iteración")
-        ax.set_ylabel("Error")
-        ax.grid(True, linewidth=0.3)
-        fig.tight_layout()
-        self._embed_figure(fig)
-
-    def _embed_figure(self, fig: Figure):
-        self._clear_canvas()
-        self._canvas = FigureCanvasTkAgg(fig, master=self.graph_area)
-        self._canvas.draw()
-        self._canvas.get_tk_widget().pack(fill="both", expand=True)
-
-    def _clear_canvas(self):
-        if self._canvas is not None:
-            self._canvas.get_tk_widget().destroy()
-            self._canvas = None
+        self.plot.plot_convergence(range(1, len(errors) + 1), errors, title="Convergencia del error (|xu - xl|/2)")
 
 def open_bisection_window(master=None):
     BisectionWindow(master)
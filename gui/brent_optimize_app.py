@@ -0,0 +1,153 @@
+# gui/brent_optimize_app.py
+import tkinter as tk
+from tkinter import ttk, messagebox
+
+from gui.worker import RunControls
+from gui.plotting import PlotPanel, LiveConvergence
+from gui.table_view import open_table_window
+from optimization_methods.utils import make_numeric_function
+from optimization_methods.sampling import sample_function
+from optimization_methods.brent_optimize import brent_optimize
+
+# Nombre en pantalla -> goal de brent_optimize
+GOAL_NAMES = {
+    "Máximo": "max",
+    "Mínimo": "min",
+}
+
+class BrentOptimizeWindow(tk.Toplevel):
+    def __init__(self, master=None):
+        super().__init__(master)
+        self.title("Método de Brent (optimización)")
+        self.geometry("980x760")
+        self.configure(bg="white")
+        self.resizable(True, True)
+
+        self._last_result = None
+        self._f_numeric = None
+        self._expr_str = None
+
+        self._build_ui()
+
+    def _build_ui(self):
+        # Entradas
+        top = tk.Frame(self, bg="white")
+        top.pack(fill="x", padx=12, pady=10)
+
+        tk.Label(top, text="f(x):", bg="white").grid(row=0, column=0, sticky="w")
+        self.ent_fx = tk.Entry(top, width=50)
+        self.ent_fx.grid(row=0, column=1, padx=8, pady=4, sticky="w")
+        self.ent_fx.insert(0, "2*sin(x) - (x**2)/10")
+
+        tk.Label(top, text="xl:", bg="white").grid(row=0, column=2, sticky="e")
+        self.ent_xl = tk.Entry(top, width=10); self.ent_xl.grid(row=0, column=3); self.ent_xl.insert(0, "-5")
+
+        tk.Label(top, text="xu:", bg="white").grid(row=0, column=4, sticky="e")
+        self.ent_xu = tk.Entry(top, width=10); self.ent_xu.grid(row=0, column=5); self.ent_xu.insert(0, "5")
+
+        tk.Label(top, text="iter máx:", bg="white").grid(row=1, column=0, sticky="w")
+        self.ent_iter = tk.Entry(top, width=10); self.ent_iter.grid(row=1, column=1, sticky="w"); self.ent_iter.insert(0, "50")
+
+        tk.Label(top, text="tol:", bg="white").grid(row=1, column=2, sticky="e")
+        self.ent_tol = tk.Entry(top, width=10); self.ent_tol.grid(row=1, column=3); self.ent_tol.insert(0, "1e-5")
+
+        tk.Label(top, text="buscar:", bg="white").grid(row=1, column=4, sticky="e")
+        self.cmb_goal = ttk.Combobox(top, width=10, state="readonly", values=list(GOAL_NAMES))
+        self.cmb_goal.grid(row=1, column=5, sticky="w")
+        self.cmb_goal.set("Máximo")
+
+        # Botones
+        btns = tk.Frame(self, bg="white")
+        btns.pack(fill="x", padx=12, pady=8)
+        tk.Button(btns, text="Calcular", command=self._on_calculate, bg="#16a34a", fg="white").pack(side="left", padx=4)
+        tk.Button(btns, text="Graficar función", command=self._on_plot_function, bg="#2563eb", fg="white").pack(side="left", padx=4)
+        tk.Button(btns, text="Ver tabla", command=self._on_show_table, bg="#f59e0b", fg="white").pack(side="left", padx=4)
+        tk.Button(btns, text="Limpiar", command=self._on_clear, bg="#ef4444", fg="white").pack(side="left", padx=4)
+        self.run_controls = RunControls(btns)
+        self.run_controls.pack(side="right")
+
+        self.lbl_result = tk.Label(self, text="", bg="white", font=("Segoe UI", 10, "bold"))
+        self.lbl_result.pack(fill="x", padx=12, pady=4)
+
+        self.graph_area = tk.Frame(self, bg="white", height=500)
+        self.graph_area.pack(fill="both", expand=True, padx=12, pady=8)
+        self.plot = PlotPanel(self.graph_area)   # figura persistente de la ventana
+        self.plot.pack(fill="both", expand=True)
+
+        # Ayuda para el usuario
+        help_txt = (
+            "Funciones soportadas:\n"
+            "  sin(x), cos(x), tan(x), exp(x), log(x) [= ln(x)], sqrt(x), abs(x)\n"
+            "Constantes: pi, E\n"
+            "Operadores: +, -, *, /, ** (potencia)"
+        )
+        tk.Label(self, text=help_txt, fg="#555", bg="white", justify="left", anchor="w").pack(
+            fill="x", padx=12, pady=(6, 12)
+        )
+
+    # ----------- Callbacks -----------
+    def _on_calculate(self):
+        try:
+            fx = self.ent_fx.get().strip()
+            xl = float(self.ent_xl.get())
+            xu = float(self.ent_xu.get())
+            itmax = int(self.ent_iter.get())
+            tol = float(self.ent_tol.get())
+            goal = GOAL_NAMES[self.cmb_goal.get()]
+        except Exception as e:
+            messagebox.showerror("Error", str(e))
+            return
+
+        def job(callback):
+            _, _, fnum = make_numeric_function(fx)
+            result = brent_optimize(fnum, xl, xu, max_iter=itmax, tol=tol, goal=goal, callback=callback)
+            return fx, fnum, result
+
+        # Curva y etiqueta se actualizan en vivo (a lo más una vez por cuadro)
+        live = LiveConvergence(self.plot, self.lbl_result)
+        self.run_controls.run(job, self._show_result, total=itmax, on_progress=live)
+
+    def _show_result(self, payload):
+        fx, fnum, result = payload
+        self._f_numeric = fnum
+        self._expr_str = fx
+        self._last_result = result
+
+        self.lbl_result.config(
+            text=f"Punto de interés ≈ {result.point:.6f} | f(x) = {result.f_point:.6f} | iter = {result.iterations}"
+                 f" | evals = {result.n_f_evals} (parabólicos: {result.n_parabolic}, dorados: {result.n_golden})"
+        )
+        self._plot_errors(result.errors)
+
+    def _on_plot_function(self):
+        if self._f_numeric is None:
+            return
+        xl = float(self.ent_xl.get())
+        xu = float(self.ent_xu.get())
+        sampled = sample_function(self._f_numeric, min(xl, xu), max(xl, xu))
+        xs, ys = sampled.xs, sampled.ys
+
+        points = None
+        if self._last_result:
+            xp = self._last_result.point
+            points = (xp, self._f_numeric(xp), f"Punto ≈ {xp:.6f}")
+        self.plot.plot_function(xs, ys, f"f(x) = {self._expr_str}", points, ylim=sampled.ylim)
+
+    def _on_show_table(self):
+        if not self._last_result:
+            return
+        open_table_window(self, "Tabla de iteraciones — Brent (optimización)", self._last_result.trace, "800x420")
+
+    def _on_clear(self):
+        self.lbl_result.config(text="")
+        self._last_result = None
+        self._f_numeric = None
+        self._expr_str = None
+        self.plot.clear()
+
+    # ----------- Helpers -----------
+    def _plot_errors(self, errors):
+        self.plot.plot_convergence(range(1, len(errors) + 1), errors)
+
+def open_brent_optimize_window(master=None):
+    BrentOptimizeWindow(master)
@@ -0,0 +1,171 @@
+# gui/brent_root_app.py
+import tkinter as tk
+from tkinter import messagebox
+
+from gui.worker import RunControls
+from gui.plotting import PlotPanel, LiveConvergence
+from gui.table_view import open_table_window
+from gui.all_roots import all_roots_job, show_all_roots
+from optimization_methods.utils import make_numeric_function
+from optimization_methods.sampling import sample_function
+from optimization_methods.brent_root import brent_root
+
+class BrentRootWindow(tk.Toplevel):
+    def __init__(self, master=None):
+        super().__init__(master)
+        self.title("Método de Brent (raíces)")
+        self.geometry("980x760")
+        self.configure(bg="white")
+        self.resizable(True, True)
+
+        self._last_result = None    # BrentRootResult
+        self._f_numeric = None      # función numérica
+        self._expr_str = None
+
+        self._build_ui()
+
+    # ---------- UI ----------
+    def _build_ui(self):
+        # Frame superior: parámetros
+        top = tk.Frame(self, bg="white")
+        top.pack(fill="x", padx=12, pady=10)
+
+        tk.Label(top, text="f(x):", bg="white").grid(row=0, column=0, sticky="w")
+        self.ent_fx = tk.Entry(top, width=50)
+        self.ent_fx.grid(row=0, column=1, padx=8, pady=4, sticky="w")
+        self.ent_fx.insert(0, "x**3 - x - 2")  # ejemplo
+
+        tk.Label(top, text="xl:", bg="white").grid(row=0, column=2, sticky="e")
+        self.ent_xl = tk.Entry(top, width=10); self.ent_xl.grid(row=0, column=3, padx=4); self.ent_xl.insert(0, "1")
+
+        tk.Label(top, text="xu:", bg="white").grid(row=0, column=4, sticky="e")
+        self.ent_xu = tk.Entry(top, width=10); self.ent_xu.grid(row=0, column=5, padx=4); self.ent_xu.insert(0, "2")
+
+        tk.Label(top, text="iter máx:", bg="white").grid(row=1, column=0, sticky="w", pady=(6,0))
+        self.ent_iter = tk.Entry(top, width=10); self.ent_iter.grid(row=1, column=1, sticky="w", pady=(6,0)); self.ent_iter.insert(0, "50")
+
+        tk.Label(top, text="tol:", bg="white").grid(row=1, column=2, sticky="e", pady=(6,0))
+        self.ent_tol = tk.Entry(top, width=10); self.ent_tol.grid(row=1, column=3, pady=(6,0)); self.ent_tol.insert(0, "1e-6")
+
+        # Botones
+        btns = tk.Frame(self, bg="white")
+        btns.pack(fill="x", padx=12, pady=8)
+        tk.Button(btns, text="Calcular", command=self._on_calculate, bg="#16a34a", fg="white").pack(side="left", padx=4)
+        tk.Button(btns, text="Graficar función", command=self._on_plot_function, bg="#2563eb", fg="white").pack(side="left", padx=4)
+        tk.Button(btns, text="Ver tabla", command=self._on_show_table, bg="#f59e0b", fg="white").pack(side="left", padx=4)
+        tk.Button(btns, text="Todas las raíces", command=self._on_all_roots, bg="#7c3aed", fg="white").pack(side="left", padx=4)
+        tk.Button(btns, text="Limpiar", command=self._on_clear, bg="#ef4444", fg="white").pack(side="left", padx=4)
+        self.run_controls = RunControls(btns)
+        self.run_controls.pack(side="right")
+
+        # Resultado
+        self.lbl_result = tk.Label(self, text="", bg="white", font=("Segoe UI", 10, "bold"))
+        self.lbl_result.pack(fill="x", padx=12, pady=4)
+
+        # Área para gráficos (error o función)
+        self.graph_area = tk.Frame(self, bg="white", height=500)
+        self.graph_area.pack(fill="both", expand=True, padx=12, pady=8)
+        self.plot = PlotPanel(self.graph_area)   # figura persistente de la ventana
+        self.plot.pack(fill="both", expand=True)
+
+        # Ayuda
+        help_txt = ("Operadores: ** (potencia), * (producto), /, +, -\n"
+                    "Funciones: sin, cos, tan, exp, log(=ln), sqrt, abs, etc.")
+        tk.Label(self, text=help_txt, fg="#555", bg="white").pack(padx=12, pady=(0,10), anchor="w")
+
+    # ---------- Callbacks ----------
+    def _on_calculate(self):
+        try:
+            fx = self.ent_fx.get().strip()
+            xl = float(self.ent_xl.get())
+            xu = float(self.ent_xu.get())
+            itmax = int(self.ent_iter.get())
+            tol = float(self.ent_tol.get())
+        except Exception as e:
+            messagebox.showerror("Error", str(e))
+            return
+
+        # El cálculo corre fuera del hilo de Tk; callback permite progreso y cancelación
+        def job(callback):
+            # función numérica segura
+            _, _, fnum = make_numeric_function(fx)
+            result = brent_root(fnum, xl, xu, max_iter=itmax, tol=tol, callback=callback)
+            return fx, fnum, result
+
+        # Curva y etiqueta se actualizan en vivo (a lo más una vez por cuadro)
+        live = LiveConvergence(self.plot, self.lbl_result, title="Convergencia del error (|xu - xl|/2)")
+        self.run_controls.run(job, self._show_result, total=itmax, on_progress=live)
+
+    def _show_result(self, payload):
+        fx, fnum, result = payload
+        self._f_numeric = fnum
+        self._expr_str = fx
+        self._last_result = result
+
+        # Mostrar resultado
+        self.lbl_result.config(
+            text=f"Raíz ≈ {result.root:.10f}  |  f(raíz) = {result.f_root:.3e}  |  iter = {result.iterations}"
+                 f"  |  evaluaciones de f = {result.n_f_evals}"
+        )
+
+        # Graficar error
+        self._plot_errors(result.errors)
+
+    def _on_plot_function(self):
+        try:
+            if self._f_numeric is None:
+                # Si aún no calculó, generamos función para graficar
+                fx = self.ent_fx.get().strip()
+                _, _, fnum = make_numeric_function(fx)
+                self._f_numeric = fnum
+                self._expr_str = fx
+
+            xl = float(self.ent_xl.get())
+            xu = float(self.ent_xu.get())
+            sampled = sample_function(self._f_numeric, min(xl, xu), max(xl, xu))
+            xs, ys = sampled.xs, sampled.ys
+
+            points = None
+            if self._last_result is not None:
+                xr = self._last_result.root
+                points = (xr, self._f_numeric(xr), f"Raíz ≈ {xr:.6f}")
+            self.plot.plot_function(xs, ys, f"f(x) = {self._expr_str}", points, ylim=sampled.ylim)
+        except Exception as e:
+            messagebox.showerror("Error al graficar", str(e))
+
+    def _on_all_roots(self):
+        # Busca todas las raíces de f en [xl, xu] (sin exigir cambio de signo en los extremos)
+        try:
+            fx = self.ent_fx.get().strip()
+            xl = float(self.ent_xl.get())
+            xu = float(self.ent_xu.get())
+        except Exception as e:
+            messagebox.showerror("Error", str(e))
+            return
+        self.run_controls.run(all_roots_job(fx, xl, xu), self._show_all_roots)
+
+    def _show_all_roots(self, payload):
+        fx, fnum, _, _ = payload
+        self._f_numeric = fnum
+        self._expr_str = fx
+        show_all_roots(self.plot, self.lbl_result, payload)
+
+    def _on_show_table(self):
+        if self._last_result is None:
+            messagebox.showinfo("Información", "Primero ejecuta el cálculo.")
+            return
+        open_table_window(self, "Tabla de iteraciones — Brent", self._last_result.trace, "800x420")
+
+    def _on_clear(self):
+        self.lbl_result.config(text="")
+        self._last_result = None
+        self._f_numeric = None
+        self._expr_str = None
+        self.plot.clear()
+
+    # ---------- Helpers ----------
+    def _plot_errors(self, errors):
+        self.plot.plot_convergence(range(1, len(errors) + 1), errors, title="Convergencia del error (|xu - xl|/2)")
+
+def open_brent_root_window(master=None):
+    BrentRootWindow(master)
@@ -1,12 +1,22 @@
 # gui/false_position_app.py
 import tkinter as tk
-from tkinter import ttk, messagebox, scrolledtext
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.figure import Figure
-import numpy as np
+from tkinter import ttk, messagebox
 
+from gui.worker import RunControls
+from gui.plotting import PlotPanel, LiveConvergence
+from gui.table_view import open_table_window
+from gui.all_roots import all_roots_job, show_all_roots
 from optimization_methods.utils import make_numeric_function
-from optimization_methods.false_position import false_position, FalsePositionResult
+from optimization_methods.sampling import sample_function
+from optimization_methods.false_position import false_position
+
+# Nombre en pantalla -> variante de false_position
+VARIANT_NAMES = {
+    "Clásica": "standard",
+    "Illinois": "illinois",
+    "Pegasus": "pegasus",
+    "Anderson-Björck": "anderson_bjorck",
+}
 
 class FalsePositionWindow(tk.Toplevel):
     def __init__(self, master=None):
@@ -16,7 +26,6 @@ class FalsePositionWindow(tk.Toplevel):
         self.configure(bg="white")
         self.resizable(True, True)
 
-        self._canvas = None
         self._last_result = None
         self._f_numeric = None
         self._expr_str = None
@@ -45,19 +54,33 @@ class FalsePositionWindow(tk.Toplevel):
         tk.Label(top, text="tol:", bg="white").grid(row=1, column=2, sticky="e")
         self.ent_tol = tk.Entry(top, width=10); self.ent_tol.grid(row=1, column=3); self.ent_tol.insert(0, "1e-6")
 
+        tk.Label(top, text="variante:", bg="white").grid(row=1, column=4, sticky="e")
+        self.cmb_variant = ttk.Combobox(top, width=16, state="readonly", values=list(VARIANT_NAMES))
+        self.cmb_variant.grid(row=1, column=5, columnspan=2, sticky="w")
+        self.cmb_variant.set("Clásica")
+
+        # Vacío: sin criterio de intervalo en la clásica, xtol = tol en las modificadas
+        tk.Label(top, text="xtol:", bg="white").grid(row=2, column=0, sticky="w")
+        self.ent_xtol = tk.Entry(top, width=10); self.ent_xtol.grid(row=2, column=1, sticky="w")
+
         # Botones
         btns = tk.Frame(self, bg="white")
         btns.pack(fill="x", padx=12, pady=8)
         tk.Button(btns, text="Calcular", command=self._on_calculate, bg="#16a34a", fg="white").pack(side="left", padx=4)
         tk.Button(btns, text="Graficar función", command=self._on_plot_function, bg="#2563eb", fg="white").pack(side="left", padx=4)
         tk.Button(btns, text="Ver tabla", command=self._on_show_table, bg="#f59e0b", fg="white").pack(side="left", padx=4)
+        tk.Button(btns, text="Todas las raíces", command=self._on_all_roots, bg="#7c3aed", fg="white").pack(side="left", padx=4)
         tk.Button(btns, text="Limpiar", command=self._on_clear, bg="#ef4444", fg="white").pack(side="left", padx=4)
+        self.run_controls = RunControls(btns)
+        self.run_controls.pack(side="right")
 
         self.lbl_result = tk.Label(self, text="", bg="white", font=("Segoe UI", 10, "bold"))
         self.lbl_result.pack(fill="x", padx=12, pady=4)
 
         self.graph_area = tk.Frame(self, bg="white", height=500)
         self.graph_area.pack(fill="both", expand=True, padx=12, pady=8)
+        self.plot = PlotPanel(self.graph_area)   # figura persistente de la ventana
+        self.plot.pack(fill="both", expand=True)
 
     # ----------- Callbacks -----------
     def _on_calculate(self):
@@ -67,83 +90,80 @@ class FalsePositionWindow(tk.Toplevel):
             xu = float(self.ent_xu.get())
             itmax = int(self.ent_iter.get())
             tol = float(self.ent_tol.get())
+            variant = VARIANT_NAMES[self.cmb_variant.get()]
+            xtol_text = self.ent_xtol.get().strip()
+            xtol = float(xtol_text) if xtol_text else None
+        except Exception as e:
+            messagebox.showerror("Error", str(e))
+            return
 
+        def job(callback):
             _, _, fnum = make_numeric_function(fx)
-            self._f_numeric = fnum
-            self._expr_str = fx
+            result = false_position(fnum, xl, xu, max_iter=itmax, tol=tol, callback=callback,
+                                    variant=variant, xtol=xtol)
+            return fx, fnum, result
 
-            result: FalsePositionResult = false_position(fnum, xl, xu, max_iter=itmax, tol=tol)
-            self._last_result = result
+        # Curva y etiqueta se actualizan en vivo (a lo más una vez por cuadro)
+        live = LiveConvergence(self.plot, self.lbl_result)
+        self.run_controls.run(job, self._show_result, total=itmax, on_progress=live)
 
-            self.lbl_result.config(
-                text=f"Raíz ≈ {result.root:.10f}  |  f(raíz) = {result.f_root:.3e}  |  iter = {result.iterations}"
-            )
-            self._plot_errors(result.errors)
+    def _show_result(self, payload):
+        fx, fnum, result = payload
+        self._f_numeric = fnum
+        self._expr_str = fx
+        self._last_result = result
 
-        except Exception as e:
-            messagebox.showerror("Error", str(e))
+        self.lbl_result.config(
+            text=f"Raíz ≈ {result.root:.10f}  |  f(raíz) = {result.f_root:.3e}  |  iter = {result.iterations}"
+        )
+        self._plot_errors(result.errors)
 
     def _on_plot_function(self):
         if self._f_numeric is None:
             return
         xl = float(self.ent_xl.get())
         xu = float(self.ent_xu.get())
-        xs = np.linspace(min(xl, xu), max(xl, xu), 600)
-        ys = self._f_numeric(xs)
+        sampled = sample_function(self._f_numeric, min(xl, xu), max(xl, xu))
+        xs, ys = sampled.xs, sampled.ys
 
-        fig = Figure(figsize=(7.8, 4.8), dpi=100)
-        ax = fig.add_subplot(111)
-        ax.plot(xs, ys, label=f"f(x) = {self._expr_str}")
+        points = None
         if self._last_result:
             xr = self._last_result.root
-            ax.scatter([xr], [self._f_numeric(xr)], color="red", label=f"Raíz ≈ {xr:.6f}")
-        ax.axhline(0, color="black", linewidth=0.6)
-        ax.axvline(0, color="black", linewidth=0.6)
-        ax.legend()
-        ax.set_title("Gráfica de la función")
-        fig.tight_layout()
-        self._embed_figure(fig)
+            points = (xr, self._f_numeric(xr), f"Raíz ≈ {xr:.6f}")
+        self.plot.plot_function(xs, ys, f"f(x) = {self._expr_str}", points, ylim=sampled.ylim)
+
+    def _on_all_roots(self):
+        # Busca todas las raíces de f en [xl, xu] (sin exigir cambio de signo en los extremos)
+        try:
+            fx = self.ent_fx.get().strip()
+            xl = float(self.ent_xl.get())
+            xu = float(self.ent_xu.get())
+        except Exception as e:
+            messagebox.showerror("Error", str(e))
+            return
+        self.run_controls.run(all_roots_job(fx, xl, xu), self._show_all_roots)
+
+    def _show_all_roots(self, payload):
+        fx, fnum, _, _ = payload
+        self._f_numeric = fnum
+        self._expr_str = fx
+        show_all_roots(self.plot, self.lbl_result, payload)
 
     def _on_show_table(self):
         if not self._last_result:
             return
-        win = tk.Toplevel(self)
-        win.title("Tabla de iteraciones — Falsa Posición")
-        win.geometry("800x420")
-
-        txt = scrolledtext.ScrolledText(win, wrap="none")
-        txt.pack(fill="both", expand=True)
-        txt.insert("1.0", self._last_result.table.to_string(index=False))
-        txt.configure(state="disabled")
+        open_table_window(self, "Tabla de iteraciones — Falsa Posición", self._last_result.trace, "800x420")
 
     def _on_clear(self):
         self.lbl_result.config(text="")
         self._last_result = None
         self._f_numeric = None
         self._expr_str = None
-        self._clear_canvas()
+        self.plot.clear()
 
     # ----------- Helpers -----------
     def _plot_errors(self, errors):
-        fig = Figure(figsize=(7.8, 4.8), dpi=100)
-        ax = fig.add_subplot(111)
-        ax.plot(range(1, len(errors)+1), errors, marker="o")
-        ax.set_title("Convergencia del error")
-        ax.set_xlabel("Iteración"); ax.set_ylabel("Error")
-        ax.grid(True, linewidth=0.3)
-        fig.tight_layout()
-        self._embed_figure(fig)
-
-    def _embed_figure(self, fig):
-        self._clear_canvas()
-        self._canvas = FigureCanvasTkAgg(fig, master=self.graph_area)
-        self._canvas.draw()
-        self._canvas.get_tk_widget().pack(fill="both", expand=True)
-
-    def _clear_canvas(self):
-        if self._canvas:
-            self._canvas.get_tk_widget().destroy()
-            self._canvas = None
+        self.plot.plot_convergence(range(1, len(errors) + 1), errors)
 
 def open_false_position_window(master=None):
     FalsePositionWindow(master)
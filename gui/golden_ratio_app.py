@@ -1,12 +1,13 @@
 # gui/golden_ratio_app.py
 import tkinter as tk
-from tkinter import ttk, messagebox, scrolledtext
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.figure import Figure
-import numpy as np
+from tkinter import ttk, messagebox
 
+from gui.worker import RunControls
+from gui.plotting import PlotPanel, LiveConvergence
+from gui.table_view import open_table_window
 from optimization_methods.utils import make_numeric_function
-from optimization_methods.golden_ratio import golden_ratio, GoldenRatioResult
+from optimization_methods.sampling import sample_function
+from optimization_methods.golden_ratio import golden_ratio
 
 class GoldenRatioWindow(tk.Toplevel):
     def __init__(self, master=None):
@@ -16,7 +17,6 @@ class GoldenRatioWindow(tk.Toplevel):
         self.configure(bg="white")
         self.resizable(True, True)
 
-        self._canvas = None
         self._last_result = None
         self._f_numeric = None
         self._expr_str = None
@@ -52,12 +52,16 @@ class GoldenRatioWindow(tk.Toplevel):
         tk.Button(btns, text="Graficar función", command=self._on_plot_function, bg="#2563eb", fg="white").pack(side="left", padx=4)
         tk.Button(btns, text="Ver tabla", command=self._on_show_table, bg="#f59e0b", fg="white").pack(side="left", padx=4)
         tk.Button(btns, text="Limpiar", command=self._on_clear, bg="#ef4444", fg="white").pack(side="left", padx=4)
+        self.run_controls = RunControls(btns)
+        self.run_controls.pack(side="right")
 
         self.lbl_result = tk.Label(self, text="", bg="white", font=("Segoe UI", 10, "bold"))
         self.lbl_result.pack(fill="x", padx=12, pady=4)
 
         self.graph_area = tk.Frame(self, bg="white", height=500)
         self.graph_area.pack(fill="both", expand=True, padx=12, pady=8)
+        self.plot = PlotPanel(self.graph_area)   # figura persistente de la ventana
+        self.plot.pack(fill="both", expand=True)
 
         # Ayuda para el usuario
         help_txt = (
@@ -78,83 +82,60 @@ class GoldenRatioWindow(tk.Toplevel):
             xu = float(self.ent_xu.get())
             itmax = int(self.ent_iter.get())
             tol = float(self.ent_tol.get())
-
-            _, _, fnum = make_numeric_function(fx)
-            self._f_numeric = fnum
-            self._expr_str = fx
-
-            result: GoldenRatioResult = golden_ratio(fnum, xl, xu, max_iter=itmax, tol=tol)
-            self._last_result = result
-
-            self.lbl_result.config(
-                text=f"Punto de interés ≈ {result.point:.6f} | f(x) = {result.f_point:.6f} | iter = {result.iterations}"
-            )
-            self._plot_errors(result.errors)
-
         except Exception as e:
             messagebox.showerror("Error", str(e))
+            return
+
+        def job(callback):
+            _, _, fnum = make_numeric_function(fx)
+            result = golden_ratio(fnum, xl, xu, max_iter=itmax, tol=tol, callback=callback)
+            return fx, fnum, result
+
+        # Curva y etiqueta se actualizan en vivo (a lo más una vez por cuadro)
+        live = LiveConvergence(self.plot, self.lbl_result)
+        self.run_controls.run(job, self._show_result, total=itmax, on_progress=live)
+
+    def _show_result(self, payload):
+        fx, fnum, result = payload
+        self._f_numeric = fnum
+        self._expr_str = fx
+        self._last_result = result
+
+        self.lbl_result.config(
+            text=f"Punto de interés ≈ {result.point:.6f} | f(x) = {result.f_point:.6f} | iter = {result.iterations}"
+                 f" | evals = {result.n_f_evals}"
+        )
+        self._plot_errors(result.errors)
 
     def _on_plot_function(self):
         if self._f_numeric is None:
             return
         xl = float(self.ent_xl.get())
         xu = float(self.ent_xu.get())
-        xs = np.linspace(min(xl, xu), max(xl, xu), 600)
-        ys = self._f_numeric(xs)
+        sampled = sample_function(self._f_numeric, min(xl, xu), max(xl, xu))
+        xs, ys = sampled.xs, sampled.ys
 
-        fig = Figure(figsize=(7.8, 4.8), dpi=100)
-        ax = fig.add_subplot(111)
-        ax.plot(xs, ys, label=f"f(x) = {self._expr_str}")
+        points = None
         if self._last_result:
             xp = self._last_result.point
-            ax.scatter([xp], [self._f_numeric(xp)], color="red", label=f"Punto ≈ {xp:.6f}")
-        ax.axhline(0, color="black", linewidth=0.6)
-        ax.axvline(0, color="black", linewidth=0.6)
-        ax.legend()
-        ax.set_title("Gráfica de la función")
-        fig.tight_layout()
-        self._embed_figure(fig)
+            points = (xp, self._f_numeric(xp), f"Punto ≈ {xp:.6f}")
+        self.plot.plot_function(xs, ys, f"f(x) = {self._expr_str}", points, ylim=sampled.ylim)
 
     def _on_show_table(self):
         if not self._last_result:
             return
-        win = tk.Toplevel(self)
-        win.title("Tabla de iteraciones — Razón Dorada")
-        win.geometry("800x420")
-
-        txt = scrolledtext.ScrolledText(win, wrap="none")
-        txt.pack(fill="both", expand=True)
-        txt.insert("1.0", self._last_result.table.to_string(index=False))
-        txt.configure(state="disabled")
+        open_table_window(self, "Tabla de iteraciones — Razón Dorada", self._last_result.trace, "800x420")
 
     def _on_clear(self):
         self.lbl_result.config(text="")
         self._last_result = None
         self._f_numeric = None
         self._expr_str = None
-        self._clear_canvas()
+        self.plot.clear()
 
     # ----------- Helpers -----------
     def _plot_errors(self, errors):
-        fig = Figure(figsize=(7.8, 4.8), dpi=100)
-        ax = fig.add_subplot(111)
-        ax.plot(range(1, len(errors)+1), errors, marker="o")
-        ax.set_title("Convergencia del error")
-        ax.set_xlabel("Iteración"); ax.set_ylabel("Error")
-        ax.grid(True, linewidth=0.3)
-        fig.tight_layout()
-        self._embed_figure(fig)
-
-    def _embed_figure(self, fig):
-        self._clear_canvas()
-        self._canvas = FigureCanvasTkAgg(fig, master=self.graph_area)
-        self._canvas.draw()
-        self._canvas.get_tk_widget().pack(fill="both", expand=True)
-
-    def _clear_canvas(self):
-        if self._canvas:
-            self._canvas.get_tk_widget().destroy()
-            self._canvas = None
+        self.plot.plot_convergence(range(1, len(errors) + 1), errors)
 
 def open_golden_ratio_window(master=None):
     GoldenRatioWindow(master)
@@ -1,11 +1,12 @@
 # gui/newton_app.py
 import tkinter as tk
-from tkinter import ttk, messagebox, scrolledtext
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.figure import Figure
-import numpy as np
+from tkinter import ttk, messagebox
 
+from gui.worker import RunControls
+from gui.plotting import PlotPanel, LiveConvergence
+from gui.table_view import open_table_window
 from optimization_methods.utils import make_numeric_function
+from optimization_methods.sampling import sample_function
 from optimization_methods.newton import newton_optimize
 
 class NewtonWindow(tk.Toplevel):
@@ -16,8 +17,7 @@ class NewtonWindow(tk.Toplevel):
         self.configure(bg="white")
         self.resizable(True, True)
 
-        self._canvas = None
-        self._last_result = None   # tuple (x_opt, table_df, errors)
+        self._last_result = None   # NewtonResult
         self._f_numeric = None
         self._expr_str = None
 
@@ -49,12 +49,16 @@ class NewtonWindow(tk.Toplevel):
         tk.Button(btns, text="Graficar función", command=self._on_plot_function, bg="#2563eb", fg="white").pack(side="left", padx=4)
         tk.Button(btns, text="Ver tabla", command=self._on_show_table, bg="#f59e0b", fg="white").pack(side="left", padx=4)
         tk.Button(btns, text="Limpiar", command=self._on_clear, bg="#ef4444", fg="white").pack(side="left", padx=4)
+        self.run_controls = RunControls(btns)
+        self.run_controls.pack(side="right")
 
         self.lbl_result = tk.Label(self, text="", bg="white", font=("Segoe UI", 10, "bold"))
         self.lbl_result.pack(fill="x", padx=12, pady=4)
 
         self.graph_area = tk.Frame(self, bg="white", height=500)
         self.graph_area.pack(fill="both", expand=True, padx=12, pady=8)
+        self.plot = PlotPanel(self.graph_area)   # figura persistente de la ventana
+        self.plot.pack(fill="both", expand=True)
 
         # Ayuda
         help_txt = (
@@ -75,96 +79,71 @@ class NewtonWindow(tk.Toplevel):
             x0 = float(self.ent_x0.get())
             itmax = int(self.ent_iter.get())
             tol = float(self.ent_tol.get())
+        except Exception as e:
+            messagebox.showerror("Error", str(e))
+            return
 
+        def job(callback):
             # guardamos función numérica para graficar
             _, _, fnum = make_numeric_function(fx)
-            self._f_numeric = fnum
-            self._expr_str = fx
+            result = newton_optimize(fx, x0, tol=tol, max_iter=itmax, callback=callback)
+            return fx, fnum, result
 
-            x_opt, table, errors = newton_optimize(fx, x0, tol=tol, max_iter=itmax)
-            self._last_result = (x_opt, table, errors)
+        # Curva y etiqueta se actualizan en vivo (a lo más una vez por cuadro)
+        live = LiveConvergence(self.plot, self.lbl_result)
+        self.run_controls.run(job, self._show_result, total=itmax, on_progress=live)
 
-            # mostrar resumen
-            try:
-                f_val = float(self._f_numeric(x_opt))
-            except Exception:
-                f_val = float('nan')
+    def _show_result(self, payload):
+        fx, fnum, result = payload
+        self._f_numeric = fnum
+        self._expr_str = fx
+        self._last_result = result
+        x_opt = result.x_opt
 
-            self.lbl_result.config(
-                text=f"Punto encontrado ≈ {x_opt:.6f} | f(x) = {f_val:.6f} | iter = {len(table)}"
-            )
-            self._plot_errors(errors)
+        # mostrar resumen
+        try:
+            f_val = float(self._f_numeric(x_opt))
+        except Exception:
+            f_val = float('nan')
 
-        except Exception as e:
-            messagebox.showerror("Error", str(e))
+        self.lbl_result.config(
+            text=f"Punto encontrado ≈ {x_opt:.6f} | f(x) = {f_val:.6f} | iter = {result.iterations}"
+        )
+        self._plot_errors(result.errors)
 
     def _on_plot_function(self):
         if self._f_numeric is None or not self._last_result:
             return
-        x_opt, _, _ = self._last_result
+        x_opt = self._last_result.x_opt
         # centramos la gráfica en torno al punto inicial y encontrado
         try:
             x0 = float(self.ent_x0.get())
             left = min(x0, x_opt) - 5
             right = max(x0, x_opt) + 5
-            xs = np.linspace(left, right, 600)
-            ys = self._f_numeric(xs)
+            sampled = sample_function(self._f_numeric, left, right)
+            xs, ys = sampled.xs, sampled.ys
         except Exception as e:
             messagebox.showerror("Error al graficar", str(e))
             return
 
-        fig = Figure(figsize=(7.8, 4.8), dpi=100)
-        ax = fig.add_subplot(111)
-        ax.plot(xs, ys, label=f"f(x) = {self._expr_str}")
-        ax.scatter([x_opt], [self._f_numeric(x_opt)], color="red", label=f"Punto ≈ {x_opt:.6f}")
-        ax.axhline(0, color="black", linewidth=0.6)
-        ax.axvline(0, color="black", linewidth=0.6)
-        ax.legend()
-        ax.set_title("Gráfica de la función")
-        fig.tight_layout()
-        self._embed_figure(fig)
+        points = (x_opt, self._f_numeric(x_opt), f"Punto ≈ {x_opt:.6f}")
+        self.plot.plot_function(xs, ys, f"f(x) = {self._expr_str}", points, ylim=sampled.ylim)
 
     def _on_show_table(self):
         if not self._last_result:
             return
-        _, table, _ = self._last_result
-        win = tk.Toplevel(self)
-        win.title("Tabla de iteraciones — Newton (optimización)")
-        win.geometry("900x420")
-
-        txt = scrolledtext.ScrolledText(win, wrap="none")
-        txt.pack(fill="both", expand=True)
-        txt.insert("1.0", table.to_string(index=False))
-        txt.configure(state="disabled")
+        open_table_window(self, "Tabla de iteraciones — Newton (optimización)", self._last_result.trace, "900x420")
 
     def _on_clear(self):
         self.lbl_result.config(text="")
         self._last_result = None
         self._f_numeric = None
         self._expr_str = None
-        self._clear_canvas()
+        self.plot.clear()
 
     # Helpers
     def _plot_errors(self, errors):
-        fig = Figure(figsize=(7.8, 4.8), dpi=100)
-        ax = fig.add_subplot(111)
-        ax.plot(range(1, len(errors)+1), errors, marker="o")
-        ax.set_title("Convergencia del error")
-        ax.set_xlabel("Iteración"); ax.set_ylabel("Error")
-        ax.grid(True, linewidth=0.3)
-        fig.tight_layout()
-        self._embed_figure(fig)
-
-    def _embed_figure(self, fig):
-        self._clear_canvas()
-        self._canvas = FigureCanvasTkAgg(fig, master=self.graph_area)
-        self._canvas.draw()
-        self._canvas.get_tk_widget().pack(fill="both", expand=True)
-
-    def _clear_canvas(self):
-        if self._canvas:
-            self._canvas.get_tk_widget().destroy()
-            self._canvas = None
+        self.plot.plot_convergence(range(1, len(errors) + 1), errors)
 
 def open_newton_window(master=None):
     NewtonWindow(master)
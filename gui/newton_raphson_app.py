@@ -1,11 +1,12 @@
 # gui/newton_raphson_app.py
 import tkinter as tk
-from tkinter import messagebox, scrolledtext
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.figure import Figure
-import numpy as np
+from tkinter import messagebox
 
+from gui.worker import RunControls
+from gui.plotting import PlotPanel, LiveConvergence
+from gui.table_view import open_table_window
 from optimization_methods.utils import make_numeric_function
+from optimization_methods.sampling import sample_function
 from optimization_methods.newton_raphson import newton_raphson
 
 class NewtonRaphsonWindow(tk.Toplevel):
@@ -16,7 +17,6 @@ class NewtonRaphsonWindow(tk.Toplevel):
         self.configure(bg="white")
         self.resizable(True, True)
 
-        self._canvas = None
         self._last_result = None
         self._f_numeric = None
         self._expr_str = None
@@ -48,6 +48,17 @@ class NewtonRaphsonWindow(tk.Toplevel):
         self.ent_tol.grid(row=1, column=3)
         self.ent_tol.insert(0, "1e-5")
 
+        # Modo protegido: intervalo opcional (vacío = se busca solo si hace falta)
+        self.var_safeguard = tk.BooleanVar(value=False)
+        tk.Checkbutton(top, text="protegido (bisección de respaldo)", variable=self.var_safeguard,
+                       bg="white").grid(row=2, column=0, columnspan=2, sticky="w")
+        tk.Label(top, text="a:", bg="white").grid(row=2, column=2, sticky="e")
+        self.ent_a = tk.Entry(top, width=10)
+        self.ent_a.grid(row=2, column=3)
+        tk.Label(top, text="b:", bg="white").grid(row=2, column=4, sticky="e")
+        self.ent_b = tk.Entry(top, width=10)
+        self.ent_b.grid(row=2, column=5)
+
         # ==== Botones ====
         btns = tk.Frame(self, bg="white")
         btns.pack(fill="x", padx=12, pady=8)
@@ -55,12 +66,16 @@ class NewtonRaphsonWindow(tk.Toplevel):
         tk.Button(btns, text="Graficar función", command=self._on_plot_function, bg="#2563eb", fg="white").pack(side="left", padx=4)
         tk.Button(btns, text="Ver tabla", command=self._on_show_table, bg="#f59e0b", fg="white").pack(side="left", padx=4)
         tk.Button(btns, text="Limpiar", command=self._on_clear, bg="#ef4444", fg="white").pack(side="left", padx=4)
+        self.run_controls = RunControls(btns)
+        self.run_controls.pack(side="right")
 
         self.lbl_result = tk.Label(self, text="", bg="white", font=("Segoe UI", 10, "bold"))
         self.lbl_result.pack(fill="x", padx=12, pady=4)
 
         self.graph_area = tk.Frame(self, bg="white", height=500)
         self.graph_area.pack(fill="both", expand=True, padx=12, pady=8)
+        self.plot = PlotPanel(self.graph_area)   # figura persistente de la ventana
+        self.plot.pack(fill="both", expand=True)
 
         # ==== Ayuda ====
         help_txt = (
@@ -80,83 +95,70 @@ class NewtonRaphsonWindow(tk.Toplevel):
             x0 = float(self.ent_x0.get())
             itmax = int(self.ent_iter.get())
             tol = float(self.ent_tol.get())
-
-            _, _, fnum = make_numeric_function(fx)
-            self._f_numeric = fnum
-            self._expr_str = fx
-
-            root, table, errors = newton_raphson(fx, x0, tol=tol, max_iter=itmax)
-            self._last_result = (root, table, errors)
-
-            self.lbl_result.config(
-                text=f"Raíz ≈ {root:.6f} | f(x) = {fnum(root):.6f} | iter = {len(table)}"
-            )
-            self._plot_errors(errors)
-
+            safeguard = self.var_safeguard.get()
+            bracket = self._read_bracket() if safeguard else None
         except Exception as e:
             messagebox.showerror("Error", str(e))
+            return
+
+        def job(callback):
+            _, _, fnum = make_numeric_function(fx)
+            result = newton_raphson(fx, x0, tol=tol, max_iter=itmax, callback=callback,
+                                    bracket=bracket, safeguard=safeguard)
+            return fx, fnum, result
+
+        # Curva y etiqueta se actualizan en vivo (a lo más una vez por cuadro)
+        live = LiveConvergence(self.plot, self.lbl_result)
+        self.run_controls.run(job, self._show_result, total=itmax, on_progress=live)
+
+    def _show_result(self, payload):
+        fx, fnum, result = payload
+        self._f_numeric = fnum
+        self._expr_str = fx
+        self._last_result = result
+        root = result.root
+
+        text = f"Raíz ≈ {root:.6f} | f(x) = {fnum(root):.6f} | iter = {result.iterations}"
+        if result.checkpoint.safeguard:
+            text += f" | pasos Newton/bisección = {result.n_newton}/{result.n_bisection}"
+        self.lbl_result.config(text=text)
+        self._plot_errors(result.errors)
 
     def _on_plot_function(self):
         if self._f_numeric is None or not self._last_result:
             return
         x0 = float(self.ent_x0.get())
-        xs = np.linspace(x0 - 10, x0 + 10, 600)
-        ys = self._f_numeric(xs)
-
-        root, _, _ = self._last_result
-
-        fig = Figure(figsize=(7.8, 4.8), dpi=100)
-        ax = fig.add_subplot(111)
-        ax.plot(xs, ys, label=f"f(x) = {self._expr_str}")
-        ax.scatter([root], [self._f_numeric(root)], color="red", label=f"Raíz ≈ {root:.6f}")
-        ax.axhline(0, color="black", linewidth=0.6)
-        ax.axvline(0, color="black", linewidth=0.6)
-        ax.legend()
-        ax.set_title("Gráfica de la función")
-        fig.tight_layout()
-        self._embed_figure(fig)
+        sampled = sample_function(self._f_numeric, x0 - 10, x0 + 10)
+        xs, ys = sampled.xs, sampled.ys
+
+        root = self._last_result.root
+
+        points = (root, self._f_numeric(root), f"Raíz ≈ {root:.6f}")
+        self.plot.plot_function(xs, ys, f"f(x) = {self._expr_str}", points, ylim=sampled.ylim)
 
     def _on_show_table(self):
         if not self._last_result:
             return
-        _, table, _ = self._last_result
-        win = tk.Toplevel(self)
-        win.title("Tabla de iteraciones — Newton-Raphson")
-        win.geometry("800x420")
-
-        txt = scrolledtext.ScrolledText(win, wrap="none")
-        txt.pack(fill="both", expand=True)
-        txt.insert("1.0", table.to_string(index=False))
-        txt.configure(state="disabled")
+        open_table_window(self, "Tabla de iteraciones — Newton-Raphson", self._last_result.trace, "800x420")
 
     def _on_clear(self):
         self.lbl_result.config(text="")
         self._last_result = None
         self._f_numeric = None
         self._expr_str = None
-        self._clear_canvas()
+        self.plot.clear()
 
     # ----------- Helpers -----------
+    def _read_bracket(self):
+        a, b = self.ent_a.get().strip(), self.ent_b.get().strip()
+        if not a and not b:
+            return None
+        if not a or not b:
+            raise ValueError("Indica ambos extremos del intervalo (a y b) o ninguno.")
+        return float(a), float(b)
+
     def _plot_errors(self, errors):
-        fig = Figure(figsize=(7.8, 4.8), dpi=100)
-        ax = fig.add_subplot(111)
-        ax.plot(range(1, len(errors)+1), errors, marker="o")
-        ax.set_title("Convergencia del error")
-        ax.set_xlabel("Iteración"); ax.set_ylabel("Error")
-        ax.grid(True, linewidth=0.3)
-        fig.tight_layout()
-        self._embed_figure(fig)
-
-    def _embed_figure(self, fig):
-        self._clear_canvas()
-        self._canvas = FigureCanvasTkAgg(fig, master=self.graph_area)
-        self._canvas.draw()
-        self._canvas.get_tk_widget().pack(fill="both", expand=True)
-
-    def _clear_canvas(self):
-        if self._canvas:
-            self._canvas.get_tk_widget().destroy()
-            self._canvas = None
+        self.plot.plot_convergence(range(1, len(errors) + 1), errors)
 
 def open_newton_raphson_window(master=None):
     NewtonRaphsonWindow(master)
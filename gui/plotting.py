@@ -0,0 +1,208 @@
+# gui/plotting.py
+import tkinter as tk
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.figure import Figure
+import numpy as np
+
+
+class PlotPanel(tk.Frame):
+    """
+    Figura y canvas de matplotlib persistentes para una ventana. En lugar de crear
+    un Figure nuevo en cada clic, se actualizan en su lugar los datos de la curva,
+    los puntos marcados, los límites y los textos, y se redibuja con draw_idle().
+
+    Dos modos sobre los mismos artistas:
+      - plot_function():    f(x) con ejes x=0 / y=0, puntos marcados y leyenda.
+      - plot_convergence(): error (o mejor valor) por iteración. Si solo se agregan
+        puntos que caben en los límites actuales, se redibuja la curva con blitting.
+    """
+
+    def __init__(self, master=None, figsize=(7.8, 4.8), dpi=100):
+        super().__init__(master, bg="white")
+        self.fig = Figure(figsize=figsize, dpi=dpi)
+        self._setup(FigureCanvasTkAgg(self.fig, master=self))
+        self.canvas.get_tk_widget().pack(fill="both", expand=True)
+
+    def _setup(self, canvas):
+        self.canvas = canvas
+        self.ax = self.fig.add_subplot(111)
+        self._curve, = self.ax.plot([], [])
+        self._points, = self.ax.plot([], [], linestyle="none", marker="o", color="red", markersize=6)
+        self._hline = self.ax.axhline(0, color="black", linewidth=0.6)
+        self._vline = self.ax.axvline(0, color="black", linewidth=0.6)
+        self._legend = None
+        self._mode = None
+        self._labels = None
+        self._background = None
+        self.canvas.mpl_connect("draw_event", self._on_draw)
+        self.clear()
+
+    # ---------- Modos ----------
+    def plot_function(self, xs, ys, label: str, points=None, title: str = "Gráfica de la función",
+                      ylim=None):
+        """
+        Curva f(x) y, opcionalmente, puntos marcados: points = (xs, ys, etiqueta).
+        Los NaN en ys cortan la línea; ylim fija el rango en y (ej. cerca de polos).
+        """
+        self._enter_mode("function", (title, "x", "f(x)"))
+        self._curve.set_data(xs, ys)
+        self._curve.set_label(label)
+        if points is not None:
+            pxs, pys, plabel = points
+            self._points.set_data(np.atleast_1d(pxs), np.atleast_1d(pys))
+            self._points.set_label(plabel)
+            self._points.set_visible(True)
+        else:
+            self._points.set_data([], [])
+            self._points.set_visible(False)
+        self._set_legend(True)
+        self._rescale()
+        if ylim is not None:
+            self.ax.set_ylim(ylim)
+        self.canvas.draw_idle()
+
+    def plot_convergence(self, xs, ys, title: str = "Convergencia del error",
+                         ylabel: str = "Error", drawstyle: str = "default"):
+        """
+        Curva por iteración. Llamadas sucesivas con más puntos (mismos textos) que
+        caben en la vista actual solo repintan la curva (blitting); si no caben, se
+        reescala con margen para que las siguientes vuelvan a caber.
+        """
+        labels = (title, "Iteración", ylabel)
+        changed = self._mode != "convergence" or self._labels != labels
+        self._enter_mode("convergence", labels)
+        self._curve.set_drawstyle(drawstyle)
+        self._curve.set_data(xs, ys)
+        if not changed and self._background is not None and self._fits(xs, ys):
+            self._blit()
+            return
+        self._rescale(grow=True)
+        self.canvas.draw_idle()
+
+    def clear(self):
+        """Deja el panel en blanco sin destruir la figura."""
+        self._curve.set_data([], [])
+        self._points.set_data([], [])
+        for artist in (self._curve, self._points, self._hline, self._vline):
+            artist.set_visible(False)
+        self._set_legend(False)
+        self.ax.set_title("")
+        self.ax.set_xlabel("")
+        self.ax.set_ylabel("")
+        self.ax.grid(False)
+        self._mode = None
+        self._labels = None
+        self.canvas.draw_idle()
+
+    # ---------- Helpers ----------
+    def _enter_mode(self, mode: str, labels):
+        if self._mode == mode and self._labels == labels:
+            return
+        function = mode == "function"
+        self._curve.set_visible(True)
+        self._curve.set_marker("None" if function else "o")
+        self._curve.set_drawstyle("default")
+        # En convergencia la curva se pinta aparte (animated) para poder hacer blitting
+        self._curve.set_animated(not function)
+        self._hline.set_visible(function)
+        self._vline.set_visible(function)
+        if not function:
+            self._points.set_visible(False)
+            self._set_legend(False)
+        title, xlabel, ylabel = labels
+        self.ax.set_title(title)
+        self.ax.set_xlabel(xlabel)
+        self.ax.set_ylabel(ylabel)
+        if function:
+            self.ax.grid(False)
+        else:
+            self.ax.grid(True, linewidth=0.3)
+        self._mode = mode
+        self._labels = labels
+        self._background = None
+        self.fig.tight_layout()
+
+    def _set_legend(self, visible: bool):
+        if self._legend is not None:
+            self._legend.remove()
+            self._legend = None
+        if visible:
+            self._legend = self.ax.legend(loc="best")
+
+    def _rescale(self, grow: bool = False):
+        # Un ylim fijado antes (p. ej. cerca de polos) desactiva el autoescalado
+        self.ax.set_autoscale_on(True)
+        self.ax.relim(visible_only=True)
+        self.ax.autoscale_view()
+        if grow:
+            # Margen en x (y piso en 0 para errores): las próximas iteraciones
+            # caben sin reescalar
+            xs = np.asarray(self._curve.get_xdata(), dtype=float)
+            x_max = np.nanmax(xs) if xs.size else 0.0
+            self.ax.set_xlim(0, max(10.0, 1.25 * x_max))
+            ys = np.asarray(self._curve.get_ydata(), dtype=float)
+            if ys.size and np.nanmin(ys) >= 0:
+                self.ax.set_ylim(bottom=0)
+
+    def _fits(self, xs, ys) -> bool:
+        xs = np.asarray(xs, dtype=float)
+        ys = np.asarray(ys, dtype=float)
+        if xs.size == 0:
+            return True
+        (x0, x1), (y0, y1) = self.ax.get_xlim(), self.ax.get_ylim()
+        ys = ys[np.isfinite(ys)]
+        return (xs.min() >= x0 and xs.max() <= x1
+                and (ys.size == 0 or (ys.min() >= min(y0, y1) and ys.max() <= max(y0, y1))))
+
+    def _on_draw(self, event):
+        # Tras cada dibujo completo: guardar el fondo (sin la curva animada) y pintarla
+        if self._curve.get_animated():
+            self._background = self.canvas.copy_from_bbox(self.ax.bbox)
+            self.ax.draw_artist(self._curve)
+        else:
+            self._background = None
+
+    def _blit(self):
+        self.canvas.restore_region(self._background)
+        self.ax.draw_artist(self._curve)
+        self.canvas.blit(self.ax.bbox)
+
+
+class LiveConvergence:
+    """
+    Vista en vivo de un cálculo: se pasa como on_progress a RunControls.run().
+    Acumula los IterationState que llegan en cada cuadro, actualiza la curva de
+    convergencia del PlotPanel (con blitting mientras quepa) y, si se indica, una
+    etiqueta con la iteración, la estimación, el error y el intervalo vigentes.
+
+    value(state) elige qué se grafica (por defecto state.error).
+    """
+
+    def __init__(self, plot: PlotPanel, label=None, title: str = "Convergencia del error",
+                 ylabel: str = "Error", drawstyle: str = "default", value=None):
+        self.plot = plot
+        self.label = label
+        self.title = title
+        self.ylabel = ylabel
+        self.drawstyle = drawstyle
+        self.value = value if value is not None else (lambda state: state.error)
+        self.iters = []
+        self.values = []
+
+    def __call__(self, states):
+        self.iters.extend(state.iter for state in states)
+        self.values.extend(self.value(state) for state in states)
+        self.plot.plot_convergence(self.iters, self.values, title=self.title,
+                                   ylabel=self.ylabel, drawstyle=self.drawstyle)
+        if self.label is not None:
+            self.label.config(text=self.describe(states[-1]))
+
+    @staticmethod
+    def describe(state) -> str:
+        text = f"iter = {state.iter}  |  x ≈ {state.x:.10g}"
+        if np.isfinite(state.error):
+            text += f"  |  error = {state.error:.3e}"
+        if state.bracket is not None:
+            a, b = state.bracket
+            text += f"  |  [{a:.6g}, {b:.6g}]"
+        return text
@@ -1,12 +1,15 @@
 # gui/random_search_app.py
 import tkinter as tk
-from tkinter import ttk, messagebox, scrolledtext
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.figure import Figure
-import numpy as np
+from tkinter import ttk, messagebox
 
+from gui.worker import RunControls
+from gui.plotting import PlotPanel, LiveConvergence
+from gui.table_view import open_table_window
 from optimization_methods.utils import make_numeric_function
-from optimization_methods.random_search import random_search
+from optimization_methods.sampling import sample_function
+from optimization_methods.random_search import random_search, STREAM_CHUNK
+
+STREAM_THRESHOLD = 100_000
 
 class RandomSearchWindow(tk.Toplevel):
     def __init__(self, master=None):
@@ -16,7 +19,6 @@ class RandomSearchWindow(tk.Toplevel):
         self.configure(bg="white")
         self.resizable(True, True)
 
-        self._canvas = None
         self._last_result = None
         self._f_numeric = None
         self._expr_str = None
@@ -49,12 +51,16 @@ class RandomSearchWindow(tk.Toplevel):
         tk.Button(btns, text="Graficar función", command=self._on_plot_function, bg="#2563eb", fg="white").pack(side="left", padx=4)
         tk.Button(btns, text="Ver tabla", command=self._on_show_table, bg="#f59e0b", fg="white").pack(side="left", padx=4)
         tk.Button(btns, text="Limpiar", command=self._on_clear, bg="#ef4444", fg="white").pack(side="left", padx=4)
+        self.run_controls = RunControls(btns)
+        self.run_controls.pack(side="right")
 
         self.lbl_result = tk.Label(self, text="", bg="white", font=("Segoe UI", 10, "bold"))
         self.lbl_result.pack(fill="x", padx=12, pady=4)
 
         self.graph_area = tk.Frame(self, bg="white", height=500)
         self.graph_area.pack(fill="both", expand=True, padx=12, pady=8)
+        self.plot = PlotPanel(self.graph_area)   # figura persistente de la ventana
+        self.plot.pack(fill="both", expand=True)
 
         # ==== Ayuda ====
         help_txt = (
@@ -75,85 +81,67 @@ class RandomSearchWindow(tk.Toplevel):
             xl = float(self.ent_xl.get())
             xu = float(self.ent_xu.get())
             itmax = int(self.ent_iter.get())
-
-            _, _, fnum = make_numeric_function(fx)
-            self._f_numeric = fnum
-            self._expr_str = fx
-
-            x_best, f_best, table = random_search(fx, xl, xu, max_iter=itmax)
-            self._last_result = (x_best, f_best, table)
-
-            self.lbl_result.config(
-                text=f"Mejor x ≈ {x_best:.6f} | f(x) = {f_best:.6f} | iter = {len(table)}"
-            )
-            self._plot_progress(table)
-
         except Exception as e:
             messagebox.showerror("Error", str(e))
+            return
+
+        def job(callback):
+            _, _, fnum = make_numeric_function(fx)
+            # Con muchas muestras se usa el modo streaming (memoria constante, tabla reducida)
+            chunk = STREAM_CHUNK if itmax > STREAM_THRESHOLD else None
+            # trace="arrays": la tabla virtualizada y la gráfica leen los arreglos directamente
+            result = random_search(fx, xl, xu, max_iter=itmax, callback=callback, chunk_size=chunk,
+                                   trace="arrays")
+            return fx, fnum, result
+
+        # Curva y etiqueta se actualizan en vivo (a lo más una vez por cuadro)
+        live = LiveConvergence(self.plot, self.lbl_result, title="Progreso del mejor valor encontrado",
+                               ylabel="f(x_best)", drawstyle="steps-post",
+                               value=lambda state: state.row[4])
+        self.run_controls.run(job, self._show_result, total=itmax, on_progress=live)
+
+    def _show_result(self, payload):
+        fx, fnum, result = payload
+        self._f_numeric = fnum
+        self._expr_str = fx
+        self._last_result = result
+        x_best, f_best = result.x_best, result.f_best
+
+        self.lbl_result.config(
+            text=f"Mejor x ≈ {x_best:.6f} | f(x) = {f_best:.6f} | iter = {result.iterations}"
+        )
+        self._plot_progress(result.trace)
 
     def _on_plot_function(self):
         if self._f_numeric is None or not self._last_result:
             return
         xl = float(self.ent_xl.get())
         xu = float(self.ent_xu.get())
-        xs = np.linspace(xl, xu, 600)
-        ys = self._f_numeric(xs)
-
-        x_best, f_best, _ = self._last_result
-
-        fig = Figure(figsize=(7.8, 4.8), dpi=100)
-        ax = fig.add_subplot(111)
-        ax.plot(xs, ys, label=f"f(x) = {self._expr_str}")
-        ax.scatter([x_best], [f_best], color="red", label=f"Mejor punto ≈ {x_best:.6f}")
-        ax.axhline(0, color="black", linewidth=0.6)
-        ax.axvline(0, color="black", linewidth=0.6)
-        ax.legend()
-        ax.set_title("Gráfica de la función")
-        fig.tight_layout()
-        self._embed_figure(fig)
+        sampled = sample_function(self._f_numeric, xl, xu)
+        xs, ys = sampled.xs, sampled.ys
+
+        x_best, f_best = self._last_result.x_best, self._last_result.f_best
+
+        points = (x_best, f_best, f"Mejor punto ≈ {x_best:.6f}")
+        self.plot.plot_function(xs, ys, f"f(x) = {self._expr_str}", points, ylim=sampled.ylim)
 
     def _on_show_table(self):
         if not self._last_result:
             return
-        _, _, table = self._last_result
-        win = tk.Toplevel(self)
-        win.title("Tabla de iteraciones — Búsqueda Aleatoria")
-        win.geometry("800x420")
-
-        txt = scrolledtext.ScrolledText(win, wrap="none")
-        txt.pack(fill="both", expand=True)
-        txt.insert("1.0", table.to_string(index=False))
-        txt.configure(state="disabled")
+        open_table_window(self, "Tabla de iteraciones — Búsqueda Aleatoria", self._last_result.trace, "800x420")
 
     def _on_clear(self):
         self.lbl_result.config(text="")
         self._last_result = None
         self._f_numeric = None
         self._expr_str = None
-        self._clear_canvas()
+        self.plot.clear()
 
     # ==== Helpers ====
-    def _plot_progress(self, table):
-        fig = Figure(figsize=(7.8, 4.8), dpi=100)
-        ax = fig.add_subplot(111)
-        ax.plot(table["Iter"], table["f(x_best)"], marker="o")
-        ax.set_title("Progreso del mejor valor encontrado")
-        ax.set_xlabel("Iteración")
-        ax.set_ylabel("f(x_best)")
-        ax.grid(True, linewidth=0.3)
-        fig.tight_layout()
-        self._embed_figure(fig)
-
-    def _embed_figure(self, fig):
-        self._clear_canvas()
-        self._canvas = FigureCanvasTkAgg(fig, master=self.graph_area)
-        self._canvas.draw()
-        self._canvas.get_tk_widget().pack(fill="both", expand=True)
-
-    def _clear_canvas(self):
-        if self._canvas:
-            self._canvas.get_tk_widget().destroy()
-            self._canvas = None
+    def _plot_progress(self, trace):
+        self.plot.plot_convergence(trace["Iter"], trace["f(x_best)"],
+                                   title="Progreso del mejor valor encontrado",
+                                   ylabel="f(x_best)", drawstyle="steps-post")
 
 def open_random_search_window(master=None):
     RandomSearchWindow(master)
@@ -0,0 +1,227 @@
+# gui/table_view.py
+import tkinter as tk
+from tkinter import ttk, messagebox, filedialog
+import numpy as np
+import pandas as pd
+
+from gui.worker import get_executor
+
+
+def _format(value, integer: bool) -> str:
+    if integer and np.isfinite(value):
+        return str(int(value))
+    return f"{value:.10g}"
+
+
+class TableView(tk.Frame):
+    """
+    Tabla virtualizada de iteraciones sobre arreglos por columna. El Treeview solo
+    tiene tantas filas como caben en pantalla; al desplazarse se reescriben sus
+    valores con la ventana visible de los arreglos, así el costo no depende del
+    número de iteraciones. Incluye "Ir a iteración" y exportación a CSV en segundo
+    plano.
+    """
+
+    def __init__(self, master=None, columns=None, poll_ms: int = 100):
+        super().__init__(master, bg="white")
+        self.poll_ms = poll_ms
+        self._columns = {}
+        self._names = []
+        self._n = 0
+        self._offset = 0
+        self._visible = 0
+        self._items = []
+        self._iter_col = None
+        self._export_after = None
+
+        bar = tk.Frame(self, bg="white")
+        bar.pack(fill="x", pady=(4, 2))
+        tk.Label(bar, text="Ir a iteración:", bg="white").pack(side="left", padx=(4, 2))
+        self.ent_goto = tk.Entry(bar, width=10)
+        self.ent_goto.pack(side="left")
+        self.ent_goto.bind("<Return>", lambda _e: self._on_goto())
+        tk.Button(bar, text="Ir", command=self._on_goto, bg="#2563eb", fg="white").pack(side="left", padx=4)
+        self.btn_export = tk.Button(bar, text="Exportar CSV", command=self._on_export,
+                                    bg="#16a34a", fg="white")
+        self.btn_export.pack(side="left", padx=4)
+        self.lbl_status = tk.Label(bar, text="", bg="white", fg="#555")
+        self.lbl_status.pack(side="left", padx=8)
+
+        body = tk.Frame(self, bg="white")
+        body.pack(fill="both", expand=True)
+        self.tree = ttk.Treeview(body, show="headings", selectmode="browse")
+        self.scroll = ttk.Scrollbar(body, orient="vertical", command=self._on_scrollbar)
+        self.scroll.pack(side="right", fill="y")
+        self.tree.pack(side="left", fill="both", expand=True)
+
+        self.tree.bind("<Configure>", self._on_resize)
+        self.tree.bind("<MouseWheel>", self._on_wheel)
+        self.tree.bind("<Button-4>", lambda _e: self.scroll_rows(-3))
+        self.tree.bind("<Button-5>", lambda _e: self.scroll_rows(3))
+        for key, delta in (("<Up>", -1), ("<Down>", 1)):
+            self.tree.bind(key, lambda _e, d=delta: self._on_key(d))
+        self.tree.bind("<Prior>", lambda _e: self._on_key(-max(self._visible - 1, 1)))
+        self.tree.bind("<Next>", lambda _e: self._on_key(max(self._visible - 1, 1)))
+        self.tree.bind("<Home>", lambda _e: self._on_key(-self._n))
+        self.tree.bind("<End>", lambda _e: self._on_key(self._n))
+
+        if columns is not None:
+            self.set_data(columns)
+
+    # ---------- Datos ----------
+    def set_data(self, columns):
+        """columns: dict nombre -> arreglo (todas de igual longitud)."""
+        self._columns = {name: np.asarray(values) for name, values in columns.items()}
+        self._names = list(self._columns)
+        self._n = len(next(iter(self._columns.values()))) if self._columns else 0
+        self._iter_col = next((c for c in self._names if c.lower() == "iter"), None)
+        self._offset = 0
+
+        self.tree.delete(*self._items)
+        self._items = []
+        self.tree.configure(columns=self._names)
+        for name in self._names:
+            self.tree.heading(name, text=name)
+            self.tree.column(name, width=110, anchor="e", stretch=True)
+        self._set_visible(self._visible or 20)
+        self.lbl_status.config(text=f"{self._n} filas")
+
+    # ---------- Vista ----------
+    def _row_height(self) -> int:
+        height = ttk.Style(self).lookup("Treeview", "rowheight")
+        try:
+            return max(int(height), 1)
+        except (TypeError, ValueError):
+            return 20
+
+    def _set_visible(self, rows: int):
+        rows = max(1, rows)
+        while len(self._items) < rows:
+            self._items.append(self.tree.insert("", "end", values=()))
+        while len(self._items) > rows:
+            self.tree.delete(self._items.pop())
+        self._visible = rows
+        self._render()
+
+    def _render(self):
+        self._offset = min(max(self._offset, 0), max(self._n - self._visible, 0))
+        stop = min(self._offset + self._visible, self._n)
+        window = [self._columns[name][self._offset:stop] for name in self._names]
+        ints = [name == self._iter_col for name in self._names]
+        for k, item in enumerate(self._items):
+            if k < stop - self._offset:
+                values = [_format(float(col[k]), is_int) for col, is_int in zip(window, ints)]
+            else:
+                values = ()
+            self.tree.item(item, values=values)
+        if self._n:
+            self.scroll.set(self._offset / self._n, stop / self._n)
+        else:
+            self.scroll.set(0, 1)
+
+    def scroll_rows(self, delta: int):
+        self._offset += delta
+        self._render()
+
+    def goto_row(self, row: int):
+        """Muestra la fila `row` arriba de la vista y la selecciona."""
+        self._offset = row
+        self._render()
+        k = row - self._offset
+        if 0 <= k < len(self._items):
+            self.tree.selection_set(self._items[k])
+
+    def row_of_iteration(self, it: int) -> int:
+        """Fila de la iteración `it` (o la más cercana por arriba)."""
+        if self._iter_col is None:
+            return it - 1
+        iters = self._columns[self._iter_col]
+        if np.all(iters[1:] >= iters[:-1]):
+            return int(np.searchsorted(iters, it))
+        matches = np.flatnonzero(iters == it)
+        return int(matches[0]) if matches.size else it - 1
+
+    # ---------- Eventos ----------
+    def _on_resize(self, event):
+        # Cuántas filas caben (descontando el encabezado) en el alto actual
+        rows = (event.height - self._row_height()) // self._row_height()
+        if rows != self._visible:
+            self._set_visible(rows)
+
+    def _on_scrollbar(self, action, *args):
+        if action == "moveto":
+            self._offset = int(float(args[0]) * self._n)
+        elif action == "scroll":
+            step = int(args[0])
+            self._offset += step * (self._visible - 1 if args[1] == "pages" else 1)
+        self._render()
+
+    def _on_wheel(self, event):
+        self.scroll_rows(-3 if event.delta > 0 else 3)
+
+    def _on_key(self, delta: int):
+        self.scroll_rows(delta)
+        return "break"
+
+    def _on_goto(self):
+        try:
+            it = int(self.ent_goto.get())
+        except ValueError:
+            messagebox.showerror("Error", "La iteración debe ser un entero.", parent=self)
+            return
+        self.goto_row(min(max(self.row_of_iteration(it), 0), max(self._n - 1, 0)))
+
+    # ---------- Exportación ----------
+    def _on_export(self):
+        path = filedialog.asksaveasfilename(parent=self, defaultextension=".csv",
+                                            filetypes=[("CSV", "*.csv"), ("Todos", "*.*")])
+        if not path:
+            return
+        columns = dict(self._columns)
+        future = get_executor().submit(export_csv, columns, path)
+        self.btn_export.config(state="disabled")
+        self.lbl_status.config(text="Exportando...")
+        self._poll_export(future, path)
+
+    def _poll_export(self, future, path):
+        if not future.done():
+            self._export_after = self.after(self.poll_ms, self._poll_export, future, path)
+            return
+        self._export_after = None
+        self.btn_export.config(state="normal")
+        exc = future.exception()
+        if exc is not None:
+            self.lbl_status.config(text="")
+            messagebox.showerror("Error al exportar", str(exc), parent=self)
+        else:
+            self.lbl_status.config(text=f"{future.result()} filas exportadas a {path}")
+
+    def destroy(self):
+        if self._export_after is not None:
+            self.after_cancel(self._export_after)
+            self._export_after = None
+        super().destroy()
+
+
+def export_csv(columns, path: str) -> int:
+    """Escribe las columnas en CSV (corre en el pool de hilos) y devuelve las filas."""
+    df = pd.DataFrame(columns)
+    for name in df.columns:
+        if name.lower() == "iter":
+            df[name] = df[name].astype(int)
+    df.to_csv(path, index=False)
+    return len(df)
+
+
+def open_table_window(master, title: str, trace, geometry: str = "800x420"):
+    """Ventana con la tabla virtualizada de un IterationTrace."""
+    columns = trace.arrays()
+    if trace.mode == "none":
+        messagebox.showinfo("Información", "El cálculo no guardó la tabla de iteraciones.", parent=master)
+        return None
+    win = tk.Toplevel(master)
+    win.title(title)
+    win.geometry(geometry)
+    view = TableView(win, columns)
+    view.pack(fill="both", expand=True)
+    return win
@@ -0,0 +1,155 @@
+# gui/worker.py
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import tkinter as tk
+from tkinter import ttk, messagebox
+
+_executor = None
+_executor_lock = threading.Lock()
+
+def get_executor() -> ThreadPoolExecutor:
+    """Pool de hilos compartido por todas las ventanas (se crea al primer uso)."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="solver")
+        return _executor
+
+
+class SolverCancelled(Exception):
+    """El usuario canceló el cálculo."""
+
+
+class SolverJob:
+    """
+    Trabajo en segundo plano. `report` se pasa al método como callback(iter, state):
+    guarda la iteración actual, acumula los IterationState para la vista en vivo y
+    lanza SolverCancelled si se pidió cancelar.
+    """
+
+    def __init__(self, total=None):
+        self.total = total
+        self.progress = 0
+        self.future = None
+        self._cancel = threading.Event()
+        self._states = []
+        self._states_lock = threading.Lock()
+
+    def report(self, iteration, state=None):
+        if self._cancel.is_set():
+            raise SolverCancelled()
+        self.progress = iteration
+        if state is not None:
+            with self._states_lock:
+                self._states.append(state)
+
+    def take_states(self) -> list:
+        """Estados reportados desde la última llamada (se vacía la cola)."""
+        with self._states_lock:
+            states, self._states = self._states, []
+        return states
+
+    def cancel(self):
+        self._cancel.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel.is_set()
+
+
+class RunControls(tk.Frame):
+    """
+    Barra de progreso + botón Cancelar. run() ejecuta fn(callback) en el pool
+    compartido y entrega el resultado en el hilo de Tk consultando con after().
+    El sondeo va a `fps` cuadros por segundo: en cada cuadro los estados nuevos se
+    pasan juntos a on_progress, así la vista en vivo no depende de cuán rápido
+    itere el método.
+    """
+
+    def __init__(self, master=None, fps: int = 30):
+        super().__init__(master, bg="white")
+        self.poll_ms = max(1, round(1000 / fps))
+        self._job = None
+        self._after_id = None
+
+        self.bar = ttk.Progressbar(self, length=220, mode="determinate")
+        self.bar.pack(side="left", padx=4)
+        self.lbl = tk.Label(self, text="", bg="white", fg="#555")
+        self.lbl.pack(side="left", padx=4)
+        self.btn_cancel = tk.Button(self, text="Cancelar", command=self.cancel,
+                                    bg="#6b7280", fg="white", state="disabled")
+        self.btn_cancel.pack(side="left", padx=4)
+
+    @property
+    def busy(self) -> bool:
+        return self._job is not None
+
+    def run(self, fn, on_done, total=None, on_error=None, on_progress=None):
+        """
+        Lanza fn(callback) en segundo plano; on_done(resultado) corre en el hilo de Tk.
+        on_progress(states), si se indica, recibe en el hilo de Tk la lista de
+        IterationState reportados desde el cuadro anterior.
+        """
+        self.cancel()
+        if self._after_id is not None:
+            self.after_cancel(self._after_id)
+            self._after_id = None
+        job = SolverJob(total)
+        job.future = get_executor().submit(fn, job.report)
+        self._job = job
+
+        self.bar.stop()
+        if total:
+            self.bar.configure(mode="determinate", maximum=total, value=0)
+        else:
+            self.bar.configure(mode="indeterminate")
+            self.bar.start(15)
+        self.lbl.config(text="Calculando...")
+        self.btn_cancel.config(state="normal")
+        self._schedule(job, on_done, on_error, on_progress)
+
+    def cancel(self):
+        if self._job is not None:
+            self._job.cancel()
+
+    def _schedule(self, job, on_done, on_error, on_progress):
+        self._after_id = self.after(self.poll_ms, self._poll, job, on_done, on_error, on_progress)
+
+    def _poll(self, job, on_done, on_error, on_progress):
+        self._after_id = None
+        if job is not self._job:
+            return
+        if not job.future.done():
+            if job.total:
+                self.bar.configure(value=job.progress)
+                self.lbl.config(text=f"iter {job.progress}/{job.total}")
+            states = job.take_states()
+            if states and on_progress is not None:
+                on_progress(states)
+            self._schedule(job, on_done, on_error, on_progress)
+            return
+
+        self._job = None
+        self.bar.stop()
+        self.bar.configure(mode="determinate", value=0)
+        self.btn_cancel.config(state="disabled")
+        exc = job.future.exception()
+        if isinstance(exc, SolverCancelled):
+            self.lbl.config(text="Cálculo cancelado")
+        elif exc is not None:
+            self.lbl.config(text="")
+            if on_error is not None:
+                on_error(exc)
+            else:
+                messagebox.showerror("Error", str(exc), parent=self.winfo_toplevel())
+        else:
+            self.lbl.config(text="")
+            on_done(job.future.result())
+
+    def destroy(self):
+        # Al cerrar la ventana se cancela el trabajo y se detiene el sondeo
+        self.cancel()
+        if self._after_id is not None:
+            self.after_cancel(self._after_id)
+            self._after_id = None
+        super().destroy()
@@ -1,32 +1,81 @@
+import argparse
+import importlib
+import sys
+import threading
+import time
 import tkinter as tk
 from tkinter import ttk, messagebox
 
-from gui.bisection_app import open_bisection_window
-from gui.false_position_app import open_false_position_window
-from gui.golden_ratio_app import open_golden_ratio_window
-from gui.quadratic_interpolation_app import open_quadratic_interpolation_window
-from gui.newton_raphson_app import open_newton_raphson_window
-from gui.newton_app import open_newton_window
-from gui.random_search_app import open_random_search_window
+_T_START = time.perf_counter()
 
+# Nombre visible -> (módulo, función que abre la ventana).
+# Los módulos de gui (y matplotlib, pandas, SymPy...) se importan al elegir el método.
 METHODS = {
-    "Bisección": open_bisection_window,
-    "Falsa Posición": open_false_position_window,
-    "Razón Dorada": open_golden_ratio_window,
-    "Interpolación Cuadrática": open_quadratic_interpolation_window,
-    "Newton": open_newton_window,
-    "Newton-Raphson": open_newton_raphson_window,
-    "Búsqueda Aleatoria": open_random_search_window,
+    "Bisección": ("gui.bisection_app", "open_bisection_window"),
+    "Falsa Posición": ("gui.false_position_app", "open_false_position_window"),
+    "Brent (raíces)": ("gui.brent_root_app", "open_brent_root_window"),
+    "Razón Dorada": ("gui.golden_ratio_app", "open_golden_ratio_window"),
+    "Brent (optimización)": ("gui.brent_optimize_app", "open_brent_optimize_window"),
+    "Interpolación Cuadrática": ("gui.quadratic_interpolation_app", "open_quadratic_interpolation_window"),
+    "Newton": ("gui.newton_app", "open_newton_window"),
+    "Newton-Raphson": ("gui.newton_raphson_app", "open_newton_raphson_window"),
+    "Búsqueda Aleatoria": ("gui.random_search_app", "open_random_search_window"),
 }
 
+IMPORT_TIMES = {}   # módulo -> (segundos, hilo que lo importó)
+_import_lock = threading.Lock()
+
+def load_method(method_name: str):
+    """Importa (una sola vez) el módulo del método y devuelve su función open_*_window."""
+    module_name, func_name = METHODS[method_name]
+    with _import_lock:
+        module = sys.modules.get(module_name)
+        if module is None:
+            t0 = time.perf_counter()
+            module = importlib.import_module(module_name)
+            IMPORT_TIMES[module_name] = (time.perf_counter() - t0, threading.current_thread().name)
+    return getattr(module, func_name)
+
+def prewarm(names=None):
+    """Importa en segundo plano los módulos de los métodos mientras el usuario elige."""
+    def work():
+        for name in names or list(METHODS):
+            try:
+                load_method(name)
+            except Exception:
+                # el error se mostrará cuando el usuario elija ese método
+                pass
+    thread = threading.Thread(target=work, name="prewarm", daemon=True)
+    thread.start()
+    return thread
+
+def import_report(menu_ready=None) -> str:
+    lines = ["Tiempos de importación:"]
+    if menu_ready is not None:
+        lines.append(f"  menú visible tras {menu_ready * 1000:8.1f} ms")
+    for module_name, (secs, thread) in IMPORT_TIMES.items():
+        lines.append(f"  {module_name:<36} {secs * 1000:8.1f} ms  ({thread})")
+    return "\n".join(lines)
+
 def launch_selected(root, method_name: str):
-    func = METHODS.get(method_name)
-    if func:
-        func(root)
-    else:
+    if method_name not in METHODS:
         messagebox.showinfo("En construcción", f"El método '{method_name}' aún no está disponible.")
+        return
+    try:
+        func = load_method(method_name)
+    except Exception as e:
+        messagebox.showerror("Error", f"No se pudo cargar '{method_name}': {e}")
+        return
+    func(root)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Optimización — Métodos")
+    parser.add_argument("--no-prewarm", action="store_true",
+                        help="no importar los métodos en segundo plano al iniciar")
+    parser.add_argument("--import-report", action="store_true",
+                        help="mostrar los tiempos de importación al cerrar")
+    args = parser.parse_args(argv)
 
-def main():
     root = tk.Tk()
     root.title("Optimización — Métodos")
     root.geometry("520x220")
@@ -42,8 +91,18 @@ def main():
 
     tk.Label(root, text="GUI en Tkinter — Proyecto modular", bg="white", fg="#555").pack(pady=(14,0))
 
+    # El pre-calentamiento arranca cuando el menú ya se pintó
+    menu_ready = {}
+    def on_ready():
+        menu_ready["t"] = time.perf_counter() - _T_START
+        if not args.no_prewarm:
+            prewarm()
+    root.after_idle(on_ready)
+
     root.mainloop()   # 👈 Esto mantiene la ventana abierta
 
+    if args.import_report:
+        print(import_report(menu_ready.get("t")), file=sys.stderr)
+
 if __name__ == "__main__":
     main()
-
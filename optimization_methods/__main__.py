@@ -0,0 +1,7 @@
+# optimization_methods/__main__.py
+import sys
+
+from optimization_methods.batch import main
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,168 @@
+# optimization_methods/all_roots.py
+from dataclasses import dataclass
+from typing import List, Optional
+import numpy as np
+from time import perf_counter
+
+from optimization_methods.utils import compile_expression, evaluate_array
+from optimization_methods.evaluation import CountedFunction, eval_stats
+from optimization_methods.false_position import false_position_batch
+
+GRID_POINTS = 4001        # malla uniforme de búsqueda
+TOUCH_TOL = 1e-8          # |f| máximo en un mínimo local de |f| para contarlo como raíz (toque)
+INVPHI = (5 ** 0.5 - 1) / 2
+
+@dataclass
+class AllRootsResult:
+    roots: np.ndarray         # raíces distintas, ordenadas
+    f_roots: np.ndarray
+    kinds: List[str]          # "cambio de signo" o "toque" (raíz de multiplicidad par)
+    converged: np.ndarray     # por raíz
+    poles: np.ndarray         # cambios de signo descartados: polos o saltos, no raíces
+    n_brackets: int = 0       # intervalos de la malla con cambio de signo
+    n_touches: int = 0        # mínimos locales de |f| examinados
+    iterations: int = 0       # iteraciones del refinamiento por lotes (la más larga)
+    n_f_evals: int = 0
+    n_df_evals: int = 0
+    n_d2f_evals: int = 0
+    eval_time: float = 0.0
+    iter_time: float = 0.0
+
+def find_all_roots(func_expr: str, a: float, b: float, n_grid: int = GRID_POINTS,
+                   xtol: float = 1e-12, max_iter: int = 100, touch_tol: float = TOUCH_TOL,
+                   merge_tol: Optional[float] = None) -> AllRootsResult:
+    """
+    Todas las raíces de f en [a, b], sin dar intervalos a mano.
+
+    1. Evalúa f vectorizada sobre una malla uniforme de n_grid puntos.
+    2. Cada par de puntos vecinos con cambio de signo es un intervalo, y todos se
+       refinan a la vez con false_position_batch (variante Illinois) hasta que
+       miden menos de xtol. Si al final |f| no es menor que en los extremos de la
+       malla, el cambio de signo era un polo o un salto y se descarta (poles).
+    3. Cada mínimo local de |f| sin cambio de signo (raíces dobles, que la curva
+       solo toca) se refina a la vez con sección dorada sobre |f| entre sus
+       vecinos, y cuenta como raíz si |f| < touch_tol.
+    Los ceros exactos de la malla se toman tal cual. Las raíces a menos de
+    merge_tol (por defecto 10*xtol) se agrupan.
+    Dos raíces dentro del mismo paso de la malla pueden no detectarse: para eso se
+    aumenta n_grid.
+    """
+    a, b = float(min(a, b)), float(max(a, b))
+    if not (np.isfinite(a) and np.isfinite(b)) or a == b:
+        raise ValueError("El intervalo de búsqueda debe ser finito y no vacío.")
+    n_grid = max(int(n_grid), 3)
+    _, _, f_num = compile_expression(func_expr, 0)
+    t_start = perf_counter()
+    f = CountedFunction(f_num)
+
+    xs = np.linspace(a, b, n_grid)
+    with np.errstate(all="ignore"):
+        ys = evaluate_array(f, xs)
+    finite = np.isfinite(ys)
+    # Por debajo de unos ulp de |x| el intervalo ya no se puede achicar
+    xtol = max(xtol, 4 * np.finfo(float).eps * max(abs(a), abs(b)))
+    merge_tol = 10 * xtol if merge_tol is None else merge_tol
+
+    found_x, found_f, found_kind, found_ok = [], [], [], []
+    iterations = 0
+
+    # Ceros exactos de la malla: toque si los vecinos tienen el mismo signo
+    zeros = np.flatnonzero(ys == 0.0)
+    if zeros.size:
+        left = ys[np.maximum(zeros - 1, 0)]
+        right = ys[np.minimum(zeros + 1, n_grid - 1)]
+        found_x.append(xs[zeros])
+        found_f.append(ys[zeros])
+        found_kind += ["toque" if l * r > 0 else "cambio de signo" for l, r in zip(left, right)]
+        found_ok.append(np.ones(zeros.size, dtype=bool))
+
+    # Cambios de signo entre vecinos finitos: refinamiento por lotes
+    brackets = np.flatnonzero(finite[:-1] & finite[1:] & (ys[:-1] * ys[1:] < 0))
+    poles = np.empty(0)
+    if brackets.size:
+        with np.errstate(all="ignore"):
+            refined = false_position_batch(f, xs[brackets], xs[brackets + 1], max_iter=max_iter,
+                                           tol=0.0, variant="illinois", xtol=xtol)
+        iterations = int(refined.iterations.max())
+        ends = np.minimum(np.abs(ys[brackets]), np.abs(ys[brackets + 1]))
+        is_root = np.abs(refined.f_roots) < ends
+        found_x.append(refined.roots[is_root])
+        found_f.append(refined.f_roots[is_root])
+        found_kind += ["cambio de signo"] * int(is_root.sum())
+        found_ok.append(refined.converged[is_root])
+        # Si una iteración cae justo en el polo (f = ±inf) el carril queda en NaN:
+        # como posición queda el centro del intervalo de la malla
+        middle = 0.5 * (xs[brackets] + xs[brackets + 1])
+        poles = np.where(np.isfinite(refined.roots), refined.roots, middle)[~is_root]
+
+    # Toques: mínimos locales de |f| con vecinos del mismo signo, cuyo vértice de la
+    # parábola por los tres puntos se acerca a cero (descarta mesetas y mínimos lejos de 0)
+    y0, y1, y2 = ys[:-2], ys[1:-1], ys[2:]
+    mag = np.abs(ys)
+    with np.errstate(all="ignore"):
+        vertex = y1 - (y2 - y0) ** 2 / (8.0 * (y0 - 2.0 * y1 + y2))
+        touches = 1 + np.flatnonzero(
+            finite[:-2] & finite[1:-1] & finite[2:] & (y1 != 0.0)
+            & (mag[1:-1] <= mag[:-2]) & (mag[1:-1] <= mag[2:])
+            & (y0 * y1 > 0) & (y2 * y1 > 0)
+            & ((vertex * y1 <= 0) | (np.abs(vertex) < 0.5 * np.abs(y1))))
+    if touches.size:
+        tx, tf, it = _touch_batch(f, xs[touches - 1], xs[touches + 1], xtol, max_iter)
+        iterations = max(iterations, it)
+        hit = np.abs(tf) < touch_tol
+        found_x.append(tx[hit])
+        found_f.append(tf[hit])
+        found_kind += ["toque"] * int(hit.sum())
+        found_ok.append(np.ones(int(hit.sum()), dtype=bool))
+
+    roots, f_roots, kinds, converged = _merge(found_x, found_f, found_kind, found_ok, merge_tol)
+    return AllRootsResult(roots=roots, f_roots=f_roots, kinds=kinds, converged=converged, poles=poles,
+                          n_brackets=int(brackets.size), n_touches=int(touches.size),
+                          iterations=iterations, **eval_stats(t_start, f))
+
+
+def _touch_batch(f, lo, hi, xtol, max_iter):
+    """Sección dorada vectorizada: mínimo de |f| en cada [lo_i, hi_i] a la vez."""
+    lo, hi = lo.copy(), hi.copy()
+    x1 = hi - INVPHI * (hi - lo)
+    x2 = lo + INVPHI * (hi - lo)
+    with np.errstate(all="ignore"):
+        f1 = np.abs(evaluate_array(f, x1))
+        f2 = np.abs(evaluate_array(f, x2))
+    iterations = 0
+    for it in range(1, max_iter + 1):
+        active = np.flatnonzero(hi - lo >= xtol)
+        if active.size == 0:
+            break
+        iterations = it
+        # f1 < f2: el mínimo queda en [lo, x2]; si no, en [x1, hi]
+        left = f1[active] < f2[active]
+        li, ri = active[left], active[~left]
+        hi[li], x2[li], f2[li] = x2[li], x1[li], f1[li]
+        lo[ri], x1[ri], f1[ri] = x1[ri], x2[ri], f2[ri]
+        x1[li] = hi[li] - INVPHI * (hi[li] - lo[li])
+        x2[ri] = lo[ri] + INVPHI * (hi[ri] - lo[ri])
+        new_x = np.concatenate((x1[li], x2[ri]))
+        with np.errstate(all="ignore"):
+            new_f = np.abs(evaluate_array(f, new_x))
+        f1[li] = new_f[:li.size]
+        f2[ri] = new_f[li.size:]
+    best = np.where(f1 <= f2, x1, x2)
+    with np.errstate(all="ignore"):
+        f_best = evaluate_array(f, best)
+    return best, f_best, iterations
+
+
+def _merge(found_x, found_f, found_kind, found_ok, merge_tol):
+    """Ordena las raíces y agrupa las cercanas, quedándose con la de menor |f|."""
+    xs = np.concatenate(found_x) if found_x else np.empty(0)
+    if xs.size == 0:
+        return np.empty(0), np.empty(0), [], np.empty(0, dtype=bool)
+    fs = np.concatenate(found_f)
+    ok = np.concatenate(found_ok)
+    order = np.argsort(xs, kind="stable")
+    xs, fs, ok = xs[order], fs[order], ok[order]
+    kinds = [found_kind[i] for i in order]
+    groups = np.split(np.arange(xs.size), np.flatnonzero(np.diff(xs) > merge_tol) + 1)
+    keep = [g[np.argmin(np.abs(fs[g]))] for g in groups]
+    return xs[keep], fs[keep], [kinds[i] for i in keep], ok[keep]
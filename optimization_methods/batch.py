@@ -0,0 +1,259 @@
+# optimization_methods/batch.py
+"""
+Ejecución por lotes sin GUI:
+
+    python -m optimization_methods problemas.jsonl --workers 8 > resultados.jsonl
+
+Cada problema (fila CSV u objeto JSONL) indica: method, expr, y según el método
+xl/xu (intervalo), x0 (y x1, x2 para interpolación cuadrática), tol, max_iter, seed
+(y variant, xtol para falsa posición: en illinois, pegasus y anderson_bjorck
+xtol vale tol si se omite; goal = "max" o "min" para Brent en optimización;
+en newton_raphson, xl/xu activan el modo protegido con ese intervalo).
+Se escribe una línea JSONL por problema en cuanto termina (orden de finalización;
+el campo "index" conserva la posición en el archivo). Con --chunksize N > 1 cada
+proceso recibe N problemas por envío: menos costo de comunicación con problemas
+muy rápidos, pero sus resultados se escriben juntos al terminar el bloque.
+Una línea que no se puede leer no detiene la corrida: da un resultado con
+"ok": false en su posición. Los valores no finitos (NaN, inf) se escriben como null.
+"""
+import argparse
+import csv
+import json
+import math
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from itertools import islice
+
+from optimization_methods.utils import compile_expression
+
+NUMERIC_FIELDS = ("xl", "xu", "x0", "x1", "x2", "tol", "xtol")
+INT_FIELDS = ("max_iter", "seed")
+# Clave con la que read_problems marca una línea que no se pudo leer
+INVALID = "_invalid"
+
+
+def _kwargs(problem, *names):
+    return {name: problem[name] for name in names if problem.get(name) is not None}
+
+
+def _run_bisection(p):
+    from optimization_methods.bisection import bisection
+    _, _, f = compile_expression(p["expr"])
+    r = bisection(f, p["xl"], p["xu"], trace="none", **_kwargs(p, "tol", "max_iter"))
+    return r.root, r.f_root, r.iterations, r
+
+
+def _run_false_position(p):
+    from optimization_methods.false_position import false_position
+    _, _, f = compile_expression(p["expr"])
+    r = false_position(f, p["xl"], p["xu"], trace="none",
+                       **_kwargs(p, "tol", "max_iter", "variant", "xtol"))
+    return r.root, r.f_root, r.iterations, r
+
+
+def _run_brent_root(p):
+    from optimization_methods.brent_root import brent_root
+    _, _, f = compile_expression(p["expr"])
+    r = brent_root(f, p["xl"], p["xu"], trace="none", **_kwargs(p, "tol", "max_iter"))
+    return r.root, r.f_root, r.iterations, r
+
+
+def _run_golden_ratio(p):
+    from optimization_methods.golden_ratio import golden_ratio
+    _, _, f = compile_expression(p["expr"])
+    r = golden_ratio(f, p["xl"], p["xu"], trace="none", **_kwargs(p, "tol", "max_iter"))
+    return r.point, r.f_point, r.iterations, r
+
+
+def _run_brent_optimize(p):
+    from optimization_methods.brent_optimize import brent_optimize
+    _, _, f = compile_expression(p["expr"])
+    r = brent_optimize(f, p["xl"], p["xu"], trace="none", **_kwargs(p, "tol", "max_iter", "goal"))
+    return r.point, r.f_point, r.iterations, r
+
+
+def _run_newton(p):
+    from optimization_methods.newton import newton_optimize
+    r = newton_optimize(p["expr"], p["x0"], trace="none", **_kwargs(p, "tol", "max_iter"))
+    return r.x_opt, compile_expression(p["expr"])[2](r.x_opt), r.iterations, r
+
+
+def _run_newton_raphson(p):
+    from optimization_methods.newton_raphson import newton_raphson
+    # Con xl/xu se usa el modo protegido (Newton con respaldo de bisección en ese intervalo)
+    bracket = (p["xl"], p["xu"]) if "xl" in p and "xu" in p else None
+    r = newton_raphson(p["expr"], p["x0"], trace="none", bracket=bracket, **_kwargs(p, "tol", "max_iter"))
+    return r.root, compile_expression(p["expr"])[2](r.root), r.iterations, r
+
+
+def _run_quadratic_interpolation(p):
+    from optimization_methods.quadratic_interpolation import quadratic_interpolation_method
+    r = quadratic_interpolation_method(p["expr"], p["x0"], p["x1"], p["x2"], trace="none",
+                                       **_kwargs(p, "tol", "max_iter"))
+    return r.point, compile_expression(p["expr"])[2](r.point), r.iterations, r
+
+
+def _run_random_search(p):
+    from optimization_methods.random_search import random_search
+    r = random_search(p["expr"], p["xl"], p["xu"], trace="none", **_kwargs(p, "max_iter", "seed"))
+    return r.x_best, r.f_best, r.iterations, r
+
+
+METHODS = {
+    "bisection": _run_bisection,
+    "false_position": _run_false_position,
+    "brent_root": _run_brent_root,
+    "golden_ratio": _run_golden_ratio,
+    "brent_optimize": _run_brent_optimize,
+    "newton": _run_newton,
+    "newton_raphson": _run_newton_raphson,
+    "quadratic_interpolation": _run_quadratic_interpolation,
+    "random_search": _run_random_search,
+}
+
+
+def _normalize(problem):
+    """Convierte los campos de texto (CSV) a números; las celdas vacías se ignoran."""
+    p = {k: v for k, v in problem.items() if v not in ("", None)}
+    for name in NUMERIC_FIELDS:
+        if name in p:
+            p[name] = float(p[name])
+    for name in INT_FIELDS:
+        if name in p:
+            p[name] = int(float(p[name]))
+    return p
+
+
+def solve_problem(index, problem):
+    """Resuelve un problema y devuelve un dict serializable; los errores se reportan, no se lanzan."""
+    out = {"index": index, "id": problem.get("id"), "method": problem.get("method")}
+    t0 = time.perf_counter()
+    try:
+        if INVALID in problem:
+            raise ValueError(problem[INVALID])
+        p = _normalize(problem)
+        runner = METHODS.get(p.get("method"))
+        if runner is None:
+            raise ValueError(f"Método desconocido: {p.get('method')!r}. Opciones: {', '.join(METHODS)}")
+        x, fx, iterations, r = runner(p)
+        out.update(ok=True, x=float(x), f=float(fx), iterations=int(iterations),
+                   n_evals=r.n_f_evals + r.n_df_evals + r.n_d2f_evals)
+    except Exception as e:
+        out.update(ok=False, error=f"{type(e).__name__}: {e}")
+    out["elapsed"] = time.perf_counter() - t0
+    # JSON no admite NaN ni infinitos
+    return {k: None if isinstance(v, float) and not math.isfinite(v) else v for k, v in out.items()}
+
+
+def _solve_chunk(chunk):
+    return [solve_problem(index, problem) for index, problem in chunk]
+
+
+def read_problems(path):
+    """
+    Genera los problemas de un archivo .csv o .jsonl ('-' lee JSONL de stdin).
+    Una línea o fila que no se puede leer se genera igual, como {INVALID: motivo},
+    para que solve_problem la reporte en su posición sin detener la corrida.
+    """
+    if path == "-":
+        stream, close = sys.stdin, False
+    else:
+        stream, close = open(path, newline="", encoding="utf-8"), True
+    try:
+        if path.lower().endswith(".csv"):
+            rows = csv.DictReader(stream)
+            while True:
+                try:
+                    row = next(rows)
+                except StopIteration:
+                    return
+                except csv.Error as e:
+                    row = {INVALID: f"Fila CSV inválida: {e}"}
+                yield row
+        else:
+            for number, line in enumerate(stream, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    problem = json.loads(line)
+                except ValueError as e:
+                    problem = {INVALID: f"JSON inválido (línea {number}): {e}"}
+                if not isinstance(problem, dict):
+                    problem = {INVALID: f"Línea {number}: se esperaba un objeto JSON"}
+                yield problem
+    finally:
+        if close:
+            stream.close()
+
+
+def _chunks(problems, size):
+    it = enumerate(problems)
+    while True:
+        chunk = list(islice(it, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def run_batch(problems, workers=None, chunksize=1, out=sys.stdout):
+    """
+    Reparte los problemas en bloques de `chunksize` sobre un ProcessPoolExecutor y
+    escribe cada resultado como una línea JSONL al terminar su bloque (con el valor
+    por defecto, 1, en cuanto termina cada problema). Solo se mantienen en vuelo
+    unos pocos bloques por proceso, así que la memoria no crece con el tamaño del
+    archivo. Devuelve (resueltos, fallidos).
+    """
+    workers = workers or os.cpu_count() or 1
+    max_pending = workers * 4
+    solved = failed = 0
+    chunks = _chunks(problems, chunksize)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = set()
+        exhausted = False
+        while pending or not exhausted:
+            while not exhausted and len(pending) < max_pending:
+                chunk = next(chunks, None)
+                if chunk is None:
+                    exhausted = True
+                else:
+                    pending.add(pool.submit(_solve_chunk, chunk))
+            if not pending:
+                break
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                for result in future.result():
+                    out.write(json.dumps(result, ensure_ascii=False) + "\n")
+                    if result["ok"]:
+                        solved += 1
+                    else:
+                        failed += 1
+            out.flush()
+    return solved, failed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m optimization_methods",
+                                     description="Resuelve por lotes problemas de un archivo CSV/JSONL.")
+    parser.add_argument("problems", help="archivo .csv o .jsonl con los problemas ('-' = JSONL por stdin)")
+    parser.add_argument("-o", "--output", default="-", help="archivo JSONL de salida (por defecto stdout)")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="procesos (por defecto, núcleos)")
+    parser.add_argument("-c", "--chunksize", type=int, default=1,
+                        help="problemas por envío a un proceso (por defecto 1: cada resultado se escribe "
+                             "al terminar; más grande amortiza el envío con problemas muy rápidos, "
+                             "pero los resultados salen por bloque)")
+    args = parser.parse_args(argv)
+
+    out = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    t0 = time.perf_counter()
+    try:
+        solved, failed = run_batch(read_problems(args.problems), workers=args.workers,
+                                   chunksize=max(1, args.chunksize), out=out)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    print(f"{solved} resueltos, {failed} con error en {time.perf_counter() - t0:.2f} s", file=sys.stderr)
+    return 1 if failed else 0
@@ -1,26 +1,81 @@
 # optimization_methods/bisection.py
 from dataclasses import dataclass
-from typing import Callable, List, Dict, Any
+from typing import Callable, Iterator, List, Optional
 import pandas as pd
 import numpy as np
+from time import perf_counter
+
+from optimization_methods.utils import evaluate_array
+from optimization_methods.trace import IterationTrace
+from optimization_methods.evaluation import CountedFunction, MemoizedFunction, eval_stats
+from optimization_methods.steps import IterationState, make_state
+
+COLUMNS = ["iter", "xl", "xu", "xr", "f(xl)", "f(xu)", "f(xr)", "error"]
 
 @dataclass
 class BisectionResult:
     root: float
     f_root: float
     iterations: int
-    table: pd.DataFrame
+    trace: IterationTrace
     errors: List[float]
+    n_f_evals: int = 0
+    n_df_evals: int = 0
+    n_d2f_evals: int = 0
+    eval_time: float = 0.0
+    iter_time: float = 0.0
+
+    @property
+    def table(self) -> pd.DataFrame:
+        return self.trace.table
 
 def bisection(f: Callable[[float], float],
               xl: float,
               xu: float,
               max_iter: int = 50,
-              tol: float = 1e-6) -> BisectionResult:
+              tol: float = 1e-6,
+              trace: str = "dataframe",
+              callback: Optional[Callable[[int, IterationState], None]] = None) -> BisectionResult:
     """
     Método de Bisección para encontrar una raíz en [xl, xu].
     Requiere cambio de signo: f(xl)*f(xu) < 0
     Error usado: |xu - xl|/2 (típico en bisección).
+    trace: "dataframe", "arrays" o "none" (ver IterationTrace).
+    callback: callback(iter, state) opcional tras cada iteración (ver IterationState).
+    El resultado incluye n_f_evals, eval_time e iter_time.
+    """
+    t_start = perf_counter()
+    counted = CountedFunction(f)
+    f = MemoizedFunction(counted)   # f(xr) final sale de la caché
+    steps = bisection_steps(f, xl, xu, max_iter=max_iter, tol=tol)
+
+    record = IterationTrace(COLUMNS, mode=trace, capacity=max_iter)
+    keep_errors = trace != "none"
+    errors: List[float] = []
+    xr = xl  # inicialización
+
+    for state in steps:
+        xr = state.x
+        if keep_errors:
+            errors.append(state.error)
+        record.append(*state.row)
+        if callback is not None:
+            callback(state.iter, state)
+
+    f_root = float(f(xr))
+    return BisectionResult(root=xr, f_root=f_root, iterations=len(record), trace=record, errors=errors,
+                           **eval_stats(t_start, counted))
+
+
+def bisection_steps(f: Callable[[float], float],
+                    xl: float,
+                    xu: float,
+                    max_iter: int = 50,
+                    tol: float = 1e-6) -> Iterator[IterationState]:
+    """
+    Bisección paso a paso: devuelve un iterador que produce un IterationState por
+    iteración (bracket = intervalo que queda tras la iteración). El cambio de signo
+    se valida al llamar, antes de la primera iteración.
     """
     fl = float(f(xl))
     fu = float(f(xu))
@@ -28,35 +83,104 @@ def bisection(f: Callable[[float], float],
         raise ValueError("La función devolvió NaN en los límites.")
     if fl * fu > 0:
         raise ValueError("No hay cambio de signo en [xl, xu]. Asegura f(xl)*f(xu) < 0.")
+    return _bisection_steps(f, xl, xu, fl, fu, max_iter, tol)
 
-    rows: List[Dict[str, Any]] = []
-    errors: List[float] = []
-    xr = xl  # inicialización
-
+def _bisection_steps(f, xl, xu, fl, fu, max_iter, tol):
     for it in range(1, max_iter + 1):
         xr = (xl + xu) / 2.0
         fr = float(f(xr))
-
         err = abs(xu - xl) / 2.0
-        errors.append(err)
+        row = (it, xl, xu, xr, fl, fu, fr, err)
+
+        done = fr == 0.0 or err < tol
+        if not done:
+            # Selección de subintervalo
+            if fl * fr < 0:
+                xu = xr
+                fu = fr
+            else:
+                xl = xr
+                fl = fr
+        yield make_state((it, xr, err, (xl, xu), row))
+        if done:
+            return
+
+
+@dataclass
+class BisectionBatchResult:
+    roots: np.ndarray
+    f_roots: np.ndarray
+    iterations: np.ndarray
+    errors: np.ndarray
+    converged: np.ndarray
+    n_f_evals: int = 0
+    n_df_evals: int = 0
+    n_d2f_evals: int = 0
+    eval_time: float = 0.0
+    iter_time: float = 0.0
+
+def bisection_batch(f: Callable[[np.ndarray], np.ndarray],
+                    xl,
+                    xu,
+                    max_iter: int = 50,
+                    tol: float = 1e-6) -> BisectionBatchResult:
+    """
+    Bisección vectorizada: avanza todos los intervalos [xl_i, xu_i] a la vez.
+    f debe aceptar arreglos de NumPy (como la devuelta por make_numeric_function).
+    Cada iteración evalúa f una sola vez sobre los carriles activos; los que ya
+    convergieron quedan congelados por una máscara.
+    Los resultados son arreglos con la forma de xl/xu (tras broadcasting).
+    n_f_evals cuenta puntos evaluados (no llamadas vectorizadas).
+    """
+    t_start = perf_counter()
+    f = CountedFunction(f)
+    xl, xu = np.broadcast_arrays(np.asarray(xl, dtype=float), np.asarray(xu, dtype=float))
+    shape = xl.shape
+    xl = xl.ravel().copy()
+    xu = xu.ravel().copy()
+
+    fl = evaluate_array(f, xl)
+    fu = evaluate_array(f, xu)
+    if np.isnan(fl).any() or np.isnan(fu).any():
+        raise ValueError("La función devolvió NaN en los límites.")
+    bad = np.flatnonzero(fl * fu > 0)
+    if bad.size:
+        raise ValueError(f"No hay cambio de signo en {bad.size} intervalo(s) (primero: índice {bad[0]}). "
+                         "Asegura f(xl)*f(xu) < 0.")
 
-        rows.append({
-            "iter": it,
-            "xl": xl, "xu": xu, "xr": xr,
-            "f(xl)": fl, "f(xu)": fu, "f(xr)": fr,
-            "error": err
-        })
+    roots = xl.copy()
+    f_roots = fl.copy()
+    errors = np.full(xl.size, np.inf)
+    iterations = np.zeros(xl.size, dtype=int)
+    converged = np.zeros(xl.size, dtype=bool)
+    active = np.ones(xl.size, dtype=bool)
 
-        if fr == 0.0 or err < tol:
+    for it in range(1, max_iter + 1):
+        idx = np.flatnonzero(active)
+        if idx.size == 0:
             break
+        a, b = xl[idx], xu[idx]
+        xr = (a + b) / 2.0
+        fr = evaluate_array(f, xr)
+        err = np.abs(b - a) / 2.0
+
+        roots[idx] = xr
+        f_roots[idx] = fr
+        errors[idx] = err
+        iterations[idx] = it
+
+        done = (fr == 0.0) | (err < tol)
+        converged[idx[done]] = True
+        active[idx[done]] = False
 
-        # Selección de subintervalo
-        if fl * fr < 0:
-            xu = xr
-            fu = fr
-        else:
-            xl = xr
-            fl = fr
+        # Selección de subintervalo solo en los carriles que siguen activos
+        lower = ~done & (fl[idx] * fr < 0)
+        upper = ~done & ~lower
+        xu[idx[lower]] = xr[lower]
+        fu[idx[lower]] = fr[lower]
+        xl[idx[upper]] = xr[upper]
+        fl[idx[upper]] = fr[upper]
 
-    df = pd.DataFrame(rows, columns=["iter", "xl", "xu", "xr", "f(xl)", "f(xu)", "f(xr)", "error"])
-    return BisectionResult(root=xr, f_root=float(f(xr)), iterations=len(df), table=df, errors=errors)
+    return BisectionBatchResult(roots=roots.reshape(shape), f_roots=f_roots.reshape(shape),
+                                iterations=iterations.reshape(shape), errors=errors.reshape(shape),
+                                converged=converged.reshape(shape), **eval_stats(t_start, f))
@@ -0,0 +1,178 @@
+# optimization_methods/brent_optimize.py
+from dataclasses import dataclass
+from typing import Callable, Iterator, List, Optional
+import pandas as pd
+import numpy as np
+from time import perf_counter
+
+from optimization_methods.trace import IterationTrace
+from optimization_methods.evaluation import CountedFunction, MemoizedFunction, eval_stats
+from optimization_methods.steps import IterationState, make_state
+
+# [a, b]: intervalo que contiene el óptimo al inicio de la iteración; x: mejor punto;
+# u: punto evaluado; parabola: 1 si el paso fue parabólico, 0 si fue de sección dorada
+COLUMNS = ["iter", "a", "b", "x", "f(x)", "u", "f(u)", "parabola", "error"]
+GOALS = ("max", "min")
+CGOLD = (3 - 5 ** 0.5) / 2          # fracción de sección dorada, ≈ 0.382
+SQRT_EPS = float(np.sqrt(np.finfo(float).eps))
+
+@dataclass
+class BrentOptimizeResult:
+    point: float
+    f_point: float
+    iterations: int
+    trace: IterationTrace
+    errors: List[float]
+    n_parabolic: int = 0          # iteraciones con paso parabólico
+    n_golden: int = 0             # iteraciones con paso de sección dorada
+    n_f_evals: int = 0
+    n_df_evals: int = 0
+    n_d2f_evals: int = 0
+    eval_time: float = 0.0
+    iter_time: float = 0.0
+
+    @property
+    def n_evals(self) -> int:
+        """Alias de n_f_evals: evaluaciones de f usadas, incluida la del punto devuelto."""
+        return self.n_f_evals
+
+    @property
+    def table(self) -> pd.DataFrame:
+        return self.trace.table
+
+def brent_optimize(f: Callable[[float], float],
+                   xl: float,
+                   xu: float,
+                   max_iter: int = 50,
+                   tol: float = 1e-5,
+                   goal: str = "max",
+                   trace: str = "dataframe",
+                   callback: Optional[Callable[[int, IterationState], None]] = None) -> BrentOptimizeResult:
+    """
+    Método de Brent para optimización en una variable: busca un máximo (goal="max",
+    como la Razón Dorada) o un mínimo (goal="min") en [xl, xu].
+
+    En cada iteración ajusta una parábola por los tres mejores puntos (x, w, v) y
+    salta a su vértice; si el paso cae fuera del intervalo o no se achica lo
+    suficiente respecto del de hace dos iteraciones, toma un paso de sección dorada.
+    Así conserva la robustez de la Razón Dorada y, con f suave, converge
+    superlinealmente con una evaluación de f por iteración.
+    Se detiene cuando el mejor punto está a menos de ~tol del óptimo dentro del
+    intervalo que lo contiene.
+    trace: "dataframe", "arrays" o "none" (ver IterationTrace).
+    callback: callback(iter, state) opcional tras cada iteración (ver IterationState).
+    El resultado incluye n_parabolic, n_golden, n_f_evals (alias n_evals), eval_time e iter_time.
+    """
+    t_start = perf_counter()
+    counted = CountedFunction(f)
+    f = MemoizedFunction(counted)
+    steps = brent_optimize_steps(f, xl, xu, max_iter=max_iter, tol=tol, goal=goal)
+
+    record = IterationTrace(COLUMNS, mode=trace, capacity=max_iter)
+    keep_errors = trace != "none"
+    errors: List[float] = []
+    n_parabolic = 0
+    state = None
+
+    for state in steps:
+        if keep_errors:
+            errors.append(state.error)
+        record.append(*state.row)
+        n_parabolic += state.row[7] == 1.0
+        if callback is not None:
+            callback(state.iter, state)
+
+    if state is not None:
+        point = state.x
+    else:
+        # Sin iteraciones: el punto inicial de sección dorada
+        a, b = min(xl, xu), max(xl, xu)
+        point = a + CGOLD * (b - a)
+    f_point = float(f(point))   # sale de la caché: es el mejor punto evaluado
+    return BrentOptimizeResult(
+        point=point,
+        f_point=f_point,
+        iterations=len(record),
+        trace=record,
+        errors=errors,
+        n_parabolic=n_parabolic,
+        n_golden=len(record) - n_parabolic,
+        **eval_stats(t_start, counted)
+    )
+
+
+def brent_optimize_steps(f: Callable[[float], float],
+                         xl: float,
+                         xu: float,
+                         max_iter: int = 50,
+                         tol: float = 1e-5,
+                         goal: str = "max") -> Iterator[IterationState]:
+    """
+    Brent (optimización) paso a paso: devuelve un iterador que produce un
+    IterationState por iteración (x = mejor punto, bracket = intervalo que queda).
+    El objetivo se valida al llamar, antes de la primera iteración.
+    """
+    if goal not in GOALS:
+        raise ValueError(f"goal debe ser 'max' o 'min', no {goal!r}.")
+    return _brent_optimize_steps(f, float(min(xl, xu)), float(max(xl, xu)), max_iter, tol,
+                                 -1.0 if goal == "max" else 1.0)
+
+def _brent_optimize_steps(f, a, b, max_iter, tol, sign):
+    # Se minimiza g = sign*f; x: mejor punto, w: segundo mejor, v: el anterior de w
+    x = w = v = a + CGOLD * (b - a)
+    fx = fw = fv = sign * float(f(x))
+    d = e = 0.0   # paso actual y el de la iteración anterior
+
+    for it in range(1, max_iter + 1):
+        xm = 0.5 * (a + b)
+        tol1 = SQRT_EPS * abs(x) + tol / 3.0
+        tol2 = 2.0 * tol1
+        if abs(x - xm) <= tol2 - 0.5 * (b - a):
+            return
+
+        parabolic = False
+        if abs(e) > tol1:
+            # Parábola por x, w, v: el vértice queda en x + p/q
+            r = (x - w) * (fx - fv)
+            q = (x - v) * (fx - fw)
+            p = (x - v) * q - (x - w) * r
+            q = 2.0 * (q - r)
+            if q > 0.0:
+                p = -p
+            q = abs(q)
+            e_prev, e = e, d
+            # Se acepta si cae dentro de (a, b) y el paso es menor que la mitad del de hace dos
+            if abs(p) < abs(0.5 * q * e_prev) and q * (a - x) < p < q * (b - x):
+                d = p / q
+                parabolic = True
+                if (x + d) - a < tol2 or b - (x + d) < tol2:
+                    d = tol1 if xm >= x else -tol1
+        if not parabolic:
+            # Sección dorada hacia el lado más grande del intervalo
+            e = (a - x) if x >= xm else (b - x)
+            d = CGOLD * e
+
+        u = x + d if abs(d) >= tol1 else x + (tol1 if d > 0 else -tol1)
+        fu = sign * float(f(u))
+        row = (it, a, b, x, sign * fx, u, sign * fu, 1.0 if parabolic else 0.0, b - a)
+
+        # Actualizar el intervalo y los tres mejores puntos
+        if fu <= fx:
+            if u >= x:
+                a = x
+            else:
+                b = x
+            v, w, x = w, x, u
+            fv, fw, fx = fw, fx, fu
+        else:
+            if u < x:
+                a = u
+            else:
+                b = u
+            if fu <= fw or w == x:
+                v, w = w, u
+                fv, fw = fw, fu
+            elif fu <= fv or v == x or v == w:
+                v, fv = u, fu
+
+        yield make_state((it, x, row[8], (a, b), row))
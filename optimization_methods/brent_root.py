@@ -0,0 +1,162 @@
+# optimization_methods/brent_root.py
+from dataclasses import dataclass
+from typing import Callable, Iterator, List, Optional
+import pandas as pd
+import numpy as np
+from time import perf_counter
+
+from optimization_methods.trace import IterationTrace
+from optimization_methods.evaluation import CountedFunction, MemoizedFunction, eval_stats
+from optimization_methods.steps import IterationState, make_state
+
+# Misma tabla que bisección: [xl, xu] es el intervalo con cambio de signo al inicio de
+# la iteración, xr el punto nuevo y error la mitad del ancho del intervalo
+COLUMNS = ["iter", "xl", "xu", "xr", "f(xl)", "f(xu)", "f(xr)", "error"]
+EPS = np.finfo(float).eps
+# Si el intervalo no se reduce a la mitad en este número de iteraciones, la siguiente
+# es una bisección: acota el peor caso (p. ej. raíces múltiples) a unas veces bisección
+HALVING_WINDOW = 2
+
+@dataclass
+class BrentRootResult:
+    root: float
+    f_root: float
+    iterations: int
+    trace: IterationTrace
+    errors: List[float]
+    n_f_evals: int = 0
+    n_df_evals: int = 0
+    n_d2f_evals: int = 0
+    eval_time: float = 0.0
+    iter_time: float = 0.0
+
+    @property
+    def table(self) -> pd.DataFrame:
+        return self.trace.table
+
+def brent_root(f: Callable[[float], float],
+               xl: float,
+               xu: float,
+               max_iter: int = 50,
+               tol: float = 1e-6,
+               trace: str = "dataframe",
+               callback: Optional[Callable[[int, IterationState], None]] = None) -> BrentRootResult:
+    """
+    Método de Brent (Brent-Dekker) para encontrar una raíz en [xl, xu].
+    Requiere cambio de signo: f(xl)*f(xu) < 0
+
+    Combina interpolación cuadrática inversa, secante y bisección: el paso
+    interpolado solo se acepta si cae dentro del intervalo y reduce el paso lo
+    suficiente; si no, se bisecta. Así siempre conserva un intervalo con cambio de
+    signo (tan seguro como bisección) y, con f suave, converge superlinealmente
+    con una fracción de las evaluaciones.
+    Se detiene cuando el intervalo que contiene la raíz mide menos de ~tol, o si
+    f(xr) == 0. La raíz devuelta es el extremo con menor |f|.
+    trace: "dataframe", "arrays" o "none" (ver IterationTrace).
+    callback: callback(iter, state) opcional tras cada iteración (ver IterationState).
+    El resultado incluye n_f_evals, eval_time e iter_time.
+    """
+    t_start = perf_counter()
+    counted = CountedFunction(f)
+    f = MemoizedFunction(counted)   # f en la raíz final sale de la caché
+    fl, fu = _check_bracket(f, xl, xu)
+    steps = _brent_root_steps(f, float(xl), float(xu), fl, fu, max_iter, tol)
+
+    record = IterationTrace(COLUMNS, mode=trace, capacity=max_iter)
+    keep_errors = trace != "none"
+    errors: List[float] = []
+    # Sin iteraciones (p. ej. intervalo ya menor que tol): el mejor extremo
+    xr, f_root = (xl, fl) if abs(fl) <= abs(fu) else (xu, fu)
+
+    for state in steps:
+        xr = state.x
+        if keep_errors:
+            errors.append(state.error)
+        record.append(*state.row)
+        if callback is not None:
+            callback(state.iter, state)
+
+    if len(record):
+        f_root = float(f(xr))
+    return BrentRootResult(root=xr, f_root=f_root, iterations=len(record), trace=record, errors=errors,
+                           **eval_stats(t_start, counted))
+
+
+def brent_root_steps(f: Callable[[float], float],
+                     xl: float,
+                     xu: float,
+                     max_iter: int = 50,
+                     tol: float = 1e-6) -> Iterator[IterationState]:
+    """
+    Brent paso a paso: devuelve un iterador que produce un IterationState por
+    iteración (x = mejor punto, bracket = intervalo con cambio de signo tras la
+    iteración). El cambio de signo se valida al llamar, antes de la primera iteración.
+    """
+    fl, fu = _check_bracket(f, xl, xu)
+    return _brent_root_steps(f, float(xl), float(xu), fl, fu, max_iter, tol)
+
+def _check_bracket(f, xl, xu):
+    fl = float(f(xl))
+    fu = float(f(xu))
+    if np.isnan(fl) or np.isnan(fu):
+        raise ValueError("La función devolvió NaN en los límites.")
+    if fl * fu > 0:
+        raise ValueError("No hay cambio de signo en [xl, xu]. Asegura f(xl)*f(xu) < 0.")
+    return fl, fu
+
+def _brent_root_steps(f, a, b, fa, fb, max_iter, tol):
+    # b: mejor estimación; c: contrapunto (f(b) y f(c) de distinto signo); a: b anterior
+    c, fc = a, fa
+    d = e = b - a
+    if abs(fc) < abs(fb):
+        a, b, c = b, c, b
+        fa, fb, fc = fb, fc, fb
+    widths = [abs(c - b)] * HALVING_WINDOW   # anchos de las últimas iteraciones
+
+    for it in range(1, max_iter + 1):
+        tol1 = 2.0 * EPS * abs(b) + 0.5 * tol
+        xm = 0.5 * (c - b)
+        if abs(xm) <= tol1 or fb == 0.0:
+            return
+
+        stalled = 2.0 * abs(xm) > 0.5 * widths[(it - 1) % HALVING_WINDOW]
+        if not stalled and abs(e) >= tol1 and abs(fa) > abs(fb):
+            s = fb / fa
+            if a == c:
+                # Secante (solo hay dos puntos distintos)
+                p = 2.0 * xm * s
+                q = 1.0 - s
+            else:
+                # Interpolación cuadrática inversa
+                q = fa / fc
+                r = fb / fc
+                p = s * (2.0 * xm * q * (q - r) - (b - a) * (r - 1.0))
+                q = (q - 1.0) * (r - 1.0) * (s - 1.0)
+            if p > 0:
+                q = -q
+            p = abs(p)
+            # Se acepta si cae dentro del intervalo y el paso decrece lo suficiente
+            if 2.0 * p < min(3.0 * xm * q - abs(tol1 * q), abs(e * q)):
+                e, d = d, p / q
+            else:
+                d = e = xm
+        else:
+            d = e = xm
+
+        widths[(it - 1) % HALVING_WINDOW] = 2.0 * abs(xm)
+        lo, hi, f_lo, f_hi = (b, c, fb, fc) if b < c else (c, b, fc, fb)
+        a, fa = b, fb
+        xr = b + d if abs(d) > tol1 else b + (tol1 if xm > 0 else -tol1)
+        fr = float(f(xr))
+        row = (it, lo, hi, xr, f_lo, f_hi, fr, abs(xm))
+
+        # Mantener el cambio de signo entre b y c, y b como el punto con menor |f|
+        b, fb = xr, fr
+        if (fb > 0 and fc > 0) or (fb < 0 and fc < 0):
+            c, fc = a, fa
+            d = e = b - a
+        if abs(fc) < abs(fb):
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+
+        yield make_state((it, b, abs(xm), (min(b, c), max(b, c)), row))
@@ -0,0 +1,99 @@
+# optimization_methods/evaluation.py
+from time import perf_counter
+from typing import Callable, Optional
+import math
+import numpy as np
+
+EVAL_CACHE_SIZE = 64
+_MISSING = object()
+
+
+class CountedFunction:
+    """
+    Envuelve f (o una derivada) y acumula el número de evaluaciones y su tiempo.
+    Con arreglos cuenta un punto por elemento, así los modos vectorizados son
+    comparables con los escalares.
+    """
+    __slots__ = ("f", "calls", "elapsed")
+
+    def __init__(self, f: Callable):
+        self.f = f
+        self.calls = 0
+        self.elapsed = 0.0
+
+    def __call__(self, x):
+        t0 = perf_counter()
+        try:
+            return self.f(x)
+        finally:
+            self.elapsed += perf_counter() - t0
+            self.calls += x.size if isinstance(x, np.ndarray) else 1
+
+
+class MemoizedFunction:
+    """
+    Caché acotada de evaluaciones dentro de una sola resolución; al llenarse descarta
+    la entrada más antigua. Se coloca delante de CountedFunction, así los aciertos no
+    cuentan como evaluaciones. Los escalares (int, float, np.float64, ...) se pasan a
+    float y la clave es (x, signo de x): 0.0 y -0.0 son iguales para un dict, pero f
+    puede distinguirlos (1/x, atan2). Los arreglos pasan directo a f.
+    """
+    __slots__ = ("f", "maxsize", "hits", "_cache")
+
+    def __init__(self, f: Callable, maxsize: int = EVAL_CACHE_SIZE, initial: Optional[dict] = None):
+        self.f = f
+        self.maxsize = maxsize
+        self.hits = 0
+        self._cache = {}
+        # Valores ya conocidos (p. ej. de un checkpoint, con claves como las de
+        # snapshot() o floats sueltos): los más recientes al final
+        for key, value in (initial or {}).items():
+            if not isinstance(key, tuple):
+                key = _key(float(key))
+            if len(self._cache) >= maxsize:
+                del self._cache[next(iter(self._cache))]
+            self._cache[key] = value
+
+    def __call__(self, x):
+        if type(x) is not float:
+            if not isinstance(x, (float, int, np.integer, np.floating)):
+                return self.f(x)
+            x = float(x)
+        key = _key(x)
+        cache = self._cache
+        value = cache.get(key, _MISSING)
+        if value is _MISSING:
+            if len(cache) >= self.maxsize:
+                del cache[next(iter(cache))]
+            value = cache[key] = self.f(x)
+        else:
+            self.hits += 1
+        return value
+
+    def snapshot(self) -> dict:
+        """Copia de la caché ((x, signo) -> valor), de la entrada más antigua a la más reciente."""
+        return dict(self._cache)
+
+
+def _key(x: float) -> tuple:
+    return (x, math.copysign(1.0, x))
+
+
+def eval_stats(t_start: float,
+               f: Optional[CountedFunction] = None,
+               df: Optional[CountedFunction] = None,
+               d2f: Optional[CountedFunction] = None) -> dict:
+    """
+    Campos de instrumentación comunes a todos los resultados:
+    n_f_evals, n_df_evals, n_d2f_evals, eval_time (s en f/f'/f'') e iter_time
+    (s desde t_start, sin contar la compilación de la expresión).
+    """
+    # Una función fusionada (f' y f'' juntas) puede ocupar dos lugares: su tiempo se suma una vez
+    counters = list({id(c): c for c in (f, df, d2f) if c is not None}.values())
+    return {
+        "n_f_evals": f.calls if f is not None else 0,
+        "n_df_evals": df.calls if df is not None else 0,
+        "n_d2f_evals": d2f.calls if d2f is not None else 0,
+        "eval_time": sum(c.elapsed for c in counters),
+        "iter_time": perf_counter() - t_start,
+    }
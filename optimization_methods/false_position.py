@@ -1,62 +1,267 @@
 # optimization_methods/false_position.py
 from dataclasses import dataclass
-from typing import Callable, List, Dict, Any
+from typing import Callable, Iterator, List, Optional
 import pandas as pd
 import numpy as np
+from time import perf_counter
+
+from optimization_methods.utils import evaluate_array
+from optimization_methods.trace import IterationTrace
+from optimization_methods.evaluation import CountedFunction, MemoizedFunction, eval_stats
+from optimization_methods.steps import IterationState, make_state
+
+COLUMNS = ["iter", "xl", "xu", "xr", "f(xl)", "f(xu)", "f(xr)", "error"]
+
+
+# Variantes modificadas: cuando el mismo extremo se conserva dos veces seguidas, su
+# valor de f se multiplica por m (0 < m < 1) para que la secante deje de quedarse
+# del mismo lado. m(f_anterior, f_nuevo) usa el valor del extremo que se reemplaza
+# y el de xr (tienen el mismo signo).
+def _illinois(f_old: float, f_new: float) -> float:
+    return 0.5
+
+def _pegasus(f_old: float, f_new: float) -> float:
+    return f_old / (f_old + f_new)
+
+def _anderson_bjorck(f_old: float, f_new: float) -> float:
+    m = 1.0 - f_new / f_old
+    return m if m > 0 else 0.5
+
+VARIANTS = {
+    "standard": None,            # regula falsi clásica (un extremo puede quedar fijo)
+    "illinois": _illinois,
+    "pegasus": _pegasus,
+    "anderson_bjorck": _anderson_bjorck,
+}
+
+def _scale_factor(variant: str):
+    try:
+        return VARIANTS[variant]
+    except KeyError:
+        raise ValueError(f"Variante desconocida: '{variant}'. Opciones: {', '.join(VARIANTS)}.") from None
+
+def _default_xtol(variant: str, tol: float, xtol: Optional[float]) -> Optional[float]:
+    """xtol efectivo: en las variantes modificadas el intervalo sí se cierra, así que
+    sin xtol explícito se usa tol también como ancho mínimo (xtol=0 lo desactiva)."""
+    if xtol is None and variant != "standard":
+        return tol
+    return xtol
 
 @dataclass
 class FalsePositionResult:
     root: float
     f_root: float
     iterations: int
-    table: pd.DataFrame
+    trace: IterationTrace
     errors: List[float]
+    n_f_evals: int = 0
+    n_df_evals: int = 0
+    n_d2f_evals: int = 0
+    eval_time: float = 0.0
+    iter_time: float = 0.0
+
+    @property
+    def table(self) -> pd.DataFrame:
+        return self.trace.table
 
 def false_position(f: Callable[[float], float],
                    xl: float,
                    xu: float,
                    max_iter: int = 50,
-                   tol: float = 1e-6) -> FalsePositionResult:
+                   tol: float = 1e-6,
+                   trace: str = "dataframe",
+                   callback: Optional[Callable[[int, IterationState], None]] = None,
+                   variant: str = "standard",
+                   xtol: Optional[float] = None) -> FalsePositionResult:
     """
     Método de Falsa Posición (Interpolación Lineal).
     Requiere que f(xl) * f(xu) < 0.
+    variant: "standard" (clásico), "illinois", "pegasus" o "anderson_bjorck". Las
+    modificadas escalan f en el extremo que se conserva dos veces seguidas; así el
+    intervalo se cierra por ambos lados y la convergencia vuelve a ser superlineal.
+    En la tabla, f(xl) y f(xu) muestran los valores ya escalados que usa la fórmula.
+    Parada: |f(xr)| < tol (residuo; f(xr) == 0 siempre detiene) o |xu - xl| < xtol
+    tras actualizar el intervalo. En las variantes modificadas xtol vale tol si no
+    se indica (xtol=0 lo desactiva); en la clásica solo se usa si se indica, porque
+    el intervalo no suele cerrarse.
+    trace: "dataframe", "arrays" o "none" (ver IterationTrace).
+    callback: callback(iter, state) opcional tras cada iteración (ver IterationState).
+    El resultado incluye n_f_evals, eval_time e iter_time.
     """
+    t_start = perf_counter()
+    counted = CountedFunction(f)
+    f = MemoizedFunction(counted)   # f(xr) final sale de la caché
+
+    steps = false_position_steps(f, xl, xu, max_iter=max_iter, tol=tol, variant=variant, xtol=xtol)
+
+    record = IterationTrace(COLUMNS, mode=trace, capacity=max_iter)
+    keep_errors = trace != "none"
+    errors: List[float] = []
+    xr = xl
 
+    for state in steps:
+        xr = state.x
+        if keep_errors:
+            errors.append(state.error)
+        record.append(*state.row)
+        if callback is not None:
+            callback(state.iter, state)
+
+    f_root = float(f(xr))
+    return FalsePositionResult(root=xr, f_root=f_root, iterations=len(record), trace=record, errors=errors,
+                               **eval_stats(t_start, counted))
+
+
+def false_position_steps(f: Callable[[float], float],
+                         xl: float,
+                         xu: float,
+                         max_iter: int = 50,
+                         tol: float = 1e-6,
+                         variant: str = "standard",
+                         xtol: Optional[float] = None) -> Iterator[IterationState]:
+    """
+    Falsa Posición paso a paso: devuelve un iterador que produce un IterationState
+    por iteración (error = |f(xr)|, bracket = intervalo que queda tras la iteración).
+    El cambio de signo y la variante se validan al llamar, antes de la primera iteración.
+    """
+    scale = _scale_factor(variant)
+    xtol = _default_xtol(variant, tol, xtol)
     fl = float(f(xl))
     fu = float(f(xu))
     if fl * fu > 0:
         raise ValueError("No hay cambio de signo en [xl, xu]. Asegura f(xl)*f(xu) < 0.")
+    return _false_position_steps(f, xl, xu, fl, fu, max_iter, tol, scale, xtol)
 
-    rows: List[Dict[str, Any]] = []
-    errors: List[float] = []
-    xr = xl
-
+def _false_position_steps(f, xl, xu, fl, fu, max_iter, tol, scale, xtol):
+    side = 0   # extremo reemplazado en la iteración anterior: -1 = xu, 1 = xl
     for it in range(1, max_iter + 1):
         # Fórmula de Falsa Posición
         xr = xu - (fu * (xl - xu)) / (fl - fu)
         fr = float(f(xr))
 
-        # Error: diferencia entre xr y el anterior xl o xu (aprox)
+        # Error: residuo |f(xr)|
         err = abs(fr)
-        errors.append(err)
+        row = (it, xl, xu, xr, fl, fu, fr, err)
+
+        done = err < tol or fr == 0.0
+        if not done:
+            # Actualizar intervalo; en las variantes, escalar el extremo que se conserva de nuevo
+            if fl * fr < 0:
+                if scale is not None and side == -1:
+                    fl *= scale(fu, fr)
+                xu, fu, side = xr, fr, -1
+            else:
+                if scale is not None and side == 1:
+                    fu *= scale(fl, fr)
+                xl, fl, side = xr, fr, 1
+            done = xtol is not None and abs(xu - xl) < xtol
+        yield make_state((it, xr, err, (xl, xu), row))
+        if done:
+            return
+
+
+@dataclass
+class FalsePositionBatchResult:
+    roots: np.ndarray
+    f_roots: np.ndarray
+    iterations: np.ndarray
+    errors: np.ndarray
+    converged: np.ndarray
+    n_f_evals: int = 0
+    n_df_evals: int = 0
+    n_d2f_evals: int = 0
+    eval_time: float = 0.0
+    iter_time: float = 0.0
+
+def false_position_batch(f: Callable[[np.ndarray], np.ndarray],
+                         xl,
+                         xu,
+                         max_iter: int = 50,
+                         tol: float = 1e-6,
+                         variant: str = "standard",
+                         xtol: Optional[float] = None) -> FalsePositionBatchResult:
+    """
+    Falsa Posición vectorizada: avanza todos los intervalos [xl_i, xu_i] a la vez.
+    Mismas variantes, reglas de parada y xtol por defecto que false_position, aplicadas por carril;
+    los carriles convergidos quedan congelados por una máscara.
+    n_f_evals cuenta puntos evaluados (no llamadas vectorizadas).
+    """
+    t_start = perf_counter()
+    scaled = _scale_factor(variant) is not None
+    xtol = _default_xtol(variant, tol, xtol)
+    f = CountedFunction(f)
+    xl, xu = np.broadcast_arrays(np.asarray(xl, dtype=float), np.asarray(xu, dtype=float))
+    shape = xl.shape
+    xl = xl.ravel().copy()
+    xu = xu.ravel().copy()
+
+    fl = evaluate_array(f, xl)
+    fu = evaluate_array(f, xu)
+    if np.isnan(fl).any() or np.isnan(fu).any():
+        raise ValueError("La función devolvió NaN en los límites.")
+    bad = np.flatnonzero(fl * fu > 0)
+    if bad.size:
+        raise ValueError(f"No hay cambio de signo en {bad.size} intervalo(s) (primero: índice {bad[0]}). "
+                         "Asegura f(xl)*f(xu) < 0.")
 
-        rows.append({
-            "iter": it,
-            "xl": xl, "xu": xu, "xr": xr,
-            "f(xl)": fl, "f(xu)": fu, "f(xr)": fr,
-            "error": err
-        })
+    roots = xl.copy()
+    f_roots = fl.copy()
+    errors = np.full(xl.size, np.inf)
+    iterations = np.zeros(xl.size, dtype=int)
+    converged = np.zeros(xl.size, dtype=bool)
+    active = np.ones(xl.size, dtype=bool)
+    side = np.zeros(xl.size, dtype=np.int8)   # extremo reemplazado antes: -1 = xu, 1 = xl
 
-        if abs(fr) < tol:
+    for it in range(1, max_iter + 1):
+        idx = np.flatnonzero(active)
+        if idx.size == 0:
             break
+        a, b = xl[idx], xu[idx]
+        fa, fb = fl[idx], fu[idx]
+
+        # Fórmula de Falsa Posición; si fa == fb ambos son cero y xl ya es raíz
+        denom = fa - fb
+        safe = np.where(denom != 0, denom, 1.0)
+        xr = np.where(denom != 0, b - (fb * (a - b)) / safe, a)
+        fr = evaluate_array(f, xr)
+        err = np.abs(fr)
+
+        roots[idx] = xr
+        f_roots[idx] = fr
+        errors[idx] = err
+        iterations[idx] = it
+
+        done = (err < tol) | (fr == 0)
+        lower = ~done & (fa * fr < 0)
+        upper = ~done & ~lower
+        if scaled:
+            prev = side[idx]
+            keep_l = lower & (prev == -1)
+            keep_u = upper & (prev == 1)
+            fl[idx[keep_l]] = fa[keep_l] * _scale_array(variant, fb[keep_l], fr[keep_l])
+            fu[idx[keep_u]] = fb[keep_u] * _scale_array(variant, fa[keep_u], fr[keep_u])
+            side[idx[lower]] = -1
+            side[idx[upper]] = 1
+        xu[idx[lower]] = xr[lower]
+        fu[idx[lower]] = fr[lower]
+        xl[idx[upper]] = xr[upper]
+        fl[idx[upper]] = fr[upper]
+
+        if xtol is not None:
+            done |= np.abs(xu[idx] - xl[idx]) < xtol
+        converged[idx[done]] = True
+        active[idx[done]] = False
+
+    return FalsePositionBatchResult(roots=roots.reshape(shape), f_roots=f_roots.reshape(shape),
+                                    iterations=iterations.reshape(shape), errors=errors.reshape(shape),
+                                    converged=converged.reshape(shape), **eval_stats(t_start, f))
 
-        # Actualizar intervalo
-        if fl * fr < 0:
-            xu = xr
-            fu = fr
-        else:
-            xl = xr
-            fl = fr
 
-    df = pd.DataFrame(rows, columns=["iter", "xl", "xu", "xr", "f(xl)", "f(xu)", "f(xr)", "error"])
-    return FalsePositionResult(root=xr, f_root=float(f(xr)), iterations=len(df), table=df, errors=errors)
+def _scale_array(variant: str, f_old: np.ndarray, f_new: np.ndarray) -> np.ndarray:
+    """Factor m de la variante, vectorizado (ver _illinois, _pegasus, _anderson_bjorck)."""
+    if variant == "illinois":
+        return np.full(f_new.shape, 0.5)
+    if variant == "pegasus":
+        return f_old / (f_old + f_new)
+    m = 1.0 - f_new / f_old
+    return np.where(m > 0, m, 0.5)
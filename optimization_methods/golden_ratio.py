@@ -1,64 +1,180 @@
 # optimization_methods/golden_ratio.py
-from dataclasses import dataclass
-from typing import Callable, List, Dict, Any
+from dataclasses import dataclass, replace
+from typing import Callable, Iterator, List, Optional
 import pandas as pd
-import numpy as np
+from time import perf_counter
+
+from optimization_methods.trace import IterationTrace
+from optimization_methods.evaluation import CountedFunction, MemoizedFunction, eval_stats
+from optimization_methods.steps import IterationState, make_state
+
+COLUMNS = ["iter", "xl", "xu", "x1", "x2", "f(x1)", "f(x2)", "error"]
+PHI = (1 + 5 ** 0.5) / 2  # número áureo (float de Python: aritmética escalar más rápida)
+
+@dataclass
+class GoldenRatioCheckpoint:
+    """
+    Estado de la Razón Dorada tras la última iteración completa, para continuar
+    exactamente donde se detuvo (golden_ratio(..., resume=checkpoint)). Solo tiene
+    floats, enteros y None: se puede guardar con pickle o con dataclasses.asdict.
+    """
+    xl: float
+    xu: float
+    x1: float
+    x2: float
+    f1: Optional[float]       # valores en caché de los puntos interiores (None: sin evaluar)
+    f2: Optional[float]
+    iterations: int = 0       # iteraciones acumuladas de todas las ejecuciones
+    n_f_evals: int = 0        # evaluaciones de f acumuladas de todas las ejecuciones
+    error: float = float("inf")
+    converged: bool = False
+
+def _initial_checkpoint(xl: float, xu: float) -> GoldenRatioCheckpoint:
+    xl, xu = float(xl), float(xu)
+    return GoldenRatioCheckpoint(xl=xl, xu=xu, x1=xu - (xu - xl) / PHI, x2=xl + (xu - xl) / PHI,
+                                 f1=None, f2=None)
 
 @dataclass
 class GoldenRatioResult:
     point: float
     f_point: float
     iterations: int
-    table: pd.DataFrame
+    trace: IterationTrace
     errors: List[float]
+    n_f_evals: int = 0
+    n_df_evals: int = 0
+    n_d2f_evals: int = 0
+    eval_time: float = 0.0
+    iter_time: float = 0.0
+    checkpoint: Optional[GoldenRatioCheckpoint] = None
+
+    @property
+    def n_evals(self) -> int:
+        """Alias de n_f_evals: evaluaciones de f usadas, incluida la del punto devuelto."""
+        return self.n_f_evals
+
+    @property
+    def table(self) -> pd.DataFrame:
+        return self.trace.table
 
 def golden_ratio(f: Callable[[float], float],
                  xl: float,
                  xu: float,
                  max_iter: int = 50,
-                 tol: float = 1e-5) -> GoldenRatioResult:
+                 tol: float = 1e-5,
+                 max_evals: Optional[int] = None,
+                 trace: str = "dataframe",
+                 callback: Optional[Callable[[int, IterationState], None]] = None,
+                 resume: Optional[GoldenRatioCheckpoint] = None) -> GoldenRatioResult:
     """
     Método de la Razón Dorada para optimización en una variable.
     Busca un máximo en el intervalo [xl, xu].
+
+    Tras la primera iteración uno de los puntos interiores sobrevive (x1 nuevo = x2
+    anterior o viceversa), así que se reutiliza junto con su valor y solo se evalúa
+    f una vez por iteración.
+    max_evals: presupuesto opcional de evaluaciones de f, incluida la evaluación
+    final en el punto devuelto. n_f_evals (alias n_evals) en el resultado reporta las usadas.
+    trace: "dataframe", "arrays" o "none" (ver IterationTrace).
+    callback: callback(iter, state) opcional tras cada iteración (ver IterationState).
+    resume: checkpoint de una ejecución anterior (result.checkpoint); se continúa
+    con el mismo intervalo y los valores de f ya calculados, sin repetir
+    evaluaciones (xl y xu se ignoran). max_iter y max_evals cuentan solo lo nuevo;
+    la tabla trae las filas nuevas, numeradas a partir de las ya hechas.
+    El resultado incluye n_f_evals, eval_time, iter_time y checkpoint.
     """
+    t_start = perf_counter()
+    counted = CountedFunction(f)
+    f = MemoizedFunction(counted)
+    # Copia propia: el generador la actualiza en su lugar y el checkpoint recibido no cambia
+    checkpoint = replace(resume) if resume is not None else _initial_checkpoint(xl, xu)
+    steps = golden_ratio_steps(f, xl, xu, max_iter=max_iter, tol=tol, max_evals=max_evals,
+                               resume=checkpoint)
 
-    phi = (1 + np.sqrt(5)) / 2  # número áureo
-    rows: List[Dict[str, Any]] = []
+    record = IterationTrace(COLUMNS, mode=trace, capacity=max_iter)
+    keep_errors = trace != "none"
     errors: List[float] = []
+    point = (checkpoint.xl + checkpoint.xu) / 2
 
-    for it in range(1, max_iter + 1):
-        # Cálculo de los puntos interiores
-        x1 = xu - (xu - xl) / phi
-        x2 = xl + (xu - xl) / phi
+    for state in steps:
+        point = state.x
+        if keep_errors:
+            errors.append(state.error)
+        record.append(*state.row)
+        if callback is not None:
+            callback(state.iter, state)
 
-        f1 = float(f(x1))
-        f2 = float(f(x2))
+    f_point = float(f(point))
+    return GoldenRatioResult(
+        point=point,
+        f_point=f_point,
+        iterations=len(record),
+        trace=record,
+        errors=errors,
+        checkpoint=checkpoint,
+        **eval_stats(t_start, counted)
+    )
 
-        error = abs(xu - xl)
-        errors.append(error)
 
-        rows.append({
-            "iter": it,
-            "xl": xl, "xu": xu,
-            "x1": x1, "x2": x2,
-            "f(x1)": f1, "f(x2)": f2,
-            "error": error
-        })
+def golden_ratio_steps(f: Callable[[float], float],
+                       xl: float,
+                       xu: float,
+                       max_iter: int = 50,
+                       tol: float = 1e-5,
+                       max_evals: Optional[int] = None,
+                       resume: Optional[GoldenRatioCheckpoint] = None) -> Iterator[IterationState]:
+    """
+    Razón Dorada paso a paso: devuelve un iterador que produce un IterationState por
+    iteración. bracket es el intervalo que queda tras la iteración y x su punto medio
+    (el punto que se devolvería al detenerse ahí). max_evals descuenta la evaluación
+    final en ese punto, igual que golden_ratio.
+    Con resume se parte de ese checkpoint, que el generador actualiza en su lugar al
+    terminar o al cerrarse (break del consumidor incluido).
+    """
+    if max_evals is not None and max_evals < 3:
+        raise ValueError("max_evals debe ser al menos 3 (dos puntos interiores y el punto final).")
+    state = resume if resume is not None else _initial_checkpoint(xl, xu)
+    return _golden_ratio_steps(f, state, max_iter, tol, max_evals)
 
-        # Actualización del intervalo
-        if f1 < f2:
-            xl = x1
-        else:
-            xu = x2
+def _golden_ratio_steps(f, state, max_iter, tol, max_evals):
+    phi = PHI
+    n_evals = 0
 
-        if error < tol:
-            break
+    # Puntos interiores; None indica que su valor aún no se ha evaluado
+    xl, xu, x1, x2, f1, f2 = state.xl, state.xu, state.x1, state.x2, state.f1, state.f2
+    done, error, converged = state.iterations, state.error, False
 
-    point = (xl + xu) / 2
-    return GoldenRatioResult(
-        point=point,
-        f_point=float(f(point)),
-        iterations=len(rows),
-        table=pd.DataFrame(rows),
-        errors=errors
-    )
+    # El estado vive en variables locales y se vuelca al checkpoint una sola vez al salir
+    try:
+        for it in range(done + 1, done + max_iter + 1):
+            pending = (f1 is None) + (f2 is None)
+            if max_evals is not None and n_evals + pending + 1 > max_evals:
+                return
+            if f1 is None:
+                f1 = float(f(x1))
+                n_evals += 1
+            if f2 is None:
+                f2 = float(f(x2))
+                n_evals += 1
+
+            error = abs(xu - xl)
+            row = (it, xl, xu, x1, x2, f1, f2, error)
+
+            # Actualización del intervalo reutilizando el punto interior que sobrevive
+            if f1 < f2:
+                xl = x1
+                x1, f1 = x2, f2
+                x2, f2 = xl + (xu - xl) / phi, None
+            else:
+                xu = x2
+                x2, f2 = x1, f1
+                x1, f1 = xu - (xu - xl) / phi, None
+
+            done, converged = it, error < tol
+            yield make_state((it, (xl + xu) / 2, error, (xl, xu), row))
+            if converged:
+                return
+    finally:
+        state.xl, state.xu, state.x1, state.x2, state.f1, state.f2 = xl, xu, x1, x2, f1, f2
+        state.iterations, state.n_f_evals = done, state.n_f_evals + n_evals
+        state.error, state.converged = error, converged
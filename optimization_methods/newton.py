@@ -1,60 +1,170 @@
 # optimization_methods/newton.py
-import sympy as sp
+from dataclasses import dataclass
+from typing import Callable, Iterator, List, Optional
+import numpy as np
 import pandas as pd
-from typing import Tuple, List
+from time import perf_counter
 
-def newton_optimize(func_expr: str, x0: float, tol: float = 1e-5, max_iter: int = 50) -> Tuple[float, pd.DataFrame, List[float]]:
+from optimization_methods.utils import compile_expression, compile_fused, evaluate_array
+from optimization_methods.trace import IterationTrace
+from optimization_methods.evaluation import CountedFunction, MemoizedFunction, eval_stats
+from optimization_methods.steps import IterationState, make_state
+
+COLUMNS = ["Iter", "xi", "f'(xi)", "f''(xi)", "xi+1", "Error"]
+
+@dataclass
+class NewtonResult:
+    x_opt: float
+    iterations: int
+    trace: IterationTrace
+    errors: List[float]
+    n_f_evals: int = 0
+    n_df_evals: int = 0
+    n_d2f_evals: int = 0
+    eval_time: float = 0.0
+    iter_time: float = 0.0
+
+    @property
+    def table(self) -> pd.DataFrame:
+        return self.trace.table
+
+    def __iter__(self):
+        # Compatibilidad: x_opt, table, errors = newton_optimize(...)
+        return iter((self.x_opt, self.table, self.errors))
+
+def newton_optimize(func_expr: str, x0: float, tol: float = 1e-5, max_iter: int = 50,
+                    trace: str = "dataframe",
+                    callback: Optional[Callable[[int, IterationState], None]] = None) -> NewtonResult:
     """
     Método de Newton para optimización (buscar mínimo/máximo usando f' y f'').
-    Devuelve (x_opt, table_df, errors_list).
+    Devuelve un NewtonResult, desempaquetable como (x_opt, table_df, errors_list).
 
     Parametros:
       - func_expr: str, expresión en x (ej. "2*sin(x) - x**2/10")
       - x0: float, valor inicial
       - tol: tolerancia para |x_{n+1} - x_n|
       - max_iter: iteraciones máximas
+      - trace: "dataframe", "arrays" o "none" (ver IterationTrace)
+      - callback: callback(iter, state) opcional tras cada iteración (ver IterationState)
+    El resultado incluye n_df_evals, n_d2f_evals, eval_time e iter_time.
     """
-    x = sp.Symbol("x")
-    try:
-        f = sp.sympify(func_expr)
-    except Exception as e:
-        raise ValueError(f"Expresión inválida: {e}")
-
-    f1 = sp.diff(f, x)
-    f2 = sp.diff(f1, x)
-
-    f1_num = sp.lambdify(x, f1, modules=["numpy"])
-    f2_num = sp.lambdify(x, f2, modules=["numpy"])
-    f_num = sp.lambdify(x, f, modules=["numpy"])
+    # f' y f'' fusionadas (subexpresiones comunes una sola vez), desde la caché de expresiones
+    fused = compile_fused(func_expr, (1, 2))
+    t_start = perf_counter()
+    fused_counted = CountedFunction(fused)
+    derivatives = MemoizedFunction(fused_counted)
 
     xi = float(x0)
-    rows = []
+    record = IterationTrace(COLUMNS, mode=trace, capacity=max_iter)
+    keep_errors = trace != "none"
     errors = []
 
+    for state in _newton_steps(derivatives, xi, tol, max_iter):
+        xi = state.x
+        if keep_errors:
+            errors.append(state.error)
+        record.append(*state.row)
+        if callback is not None:
+            callback(state.iter, state)
+
+    return NewtonResult(x_opt=float(xi), iterations=len(record), trace=record, errors=errors,
+                        **eval_stats(t_start, df=fused_counted, d2f=fused_counted))
+
+
+def newton_optimize_steps(func_expr: str, x0: float, tol: float = 1e-5,
+                          max_iter: int = 50) -> Iterator[IterationState]:
+    """
+    Newton para optimización paso a paso: devuelve un iterador que produce un
+    IterationState por iteración (x = xi+1, error = |xi+1 - xi|, sin bracket).
+    """
+    return _newton_steps(compile_fused(func_expr, (1, 2)), float(x0), tol, max_iter)
+
+def _newton_steps(derivatives, xi, tol, max_iter):
     for it in range(1, max_iter + 1):
-        f1xi = float(f1_num(xi))
-        f2xi = float(f2_num(xi))
+        f1xi, f2xi = derivatives(xi)
+        f1xi, f2xi = float(f1xi), float(f2xi)
 
         if f2xi == 0:
             raise ZeroDivisionError("La segunda derivada se anuló en la iteración; no es posible continuar.")
 
         x_next = xi - f1xi / f2xi
         err = abs(x_next - xi)
-        errors.append(err)
-
-        rows.append({
-            "Iter": it,
-            "xi": xi,
-            "f'(xi)": f1xi,
-            "f''(xi)": f2xi,
-            "xi+1": x_next,
-            "Error": err
-        })
+        yield make_state((it, x_next, err, None, (it, xi, f1xi, f2xi, x_next, err)))
 
         xi = x_next
         if err < tol:
+            return
+
+@dataclass
+class NewtonMultistartResult:
+    points: np.ndarray        # puntos estacionarios distintos, ordenados
+    f_points: np.ndarray
+    kinds: List[str]          # "máximo", "mínimo" o "indeterminado" según el signo de f''
+    counts: np.ndarray        # arranques que llegaron a cada punto
+    x_final: np.ndarray       # por arranque
+    iterations: np.ndarray    # por arranque
+    converged: np.ndarray     # por arranque
+    n_f_evals: int = 0
+    n_df_evals: int = 0
+    n_d2f_evals: int = 0
+    eval_time: float = 0.0
+    iter_time: float = 0.0
+
+def newton_optimize_multistart(func_expr: str, x0s, tol: float = 1e-5, max_iter: int = 50,
+                               merge_tol: Optional[float] = None) -> NewtonMultistartResult:
+    """
+    Newton para optimización desde muchos puntos iniciales a la vez (NumPy).
+    Cada iteración evalúa f' y f'' una vez sobre los arranques activos; los que
+    convergen (|paso| < tol), tienen f'' = 0 o dan valores no finitos se congelan.
+    Los puntos convergidos a menos de merge_tol (por defecto 10*tol) se agrupan y
+    cada punto estacionario se clasifica por el signo de f'' (f'' < 0: máximo).
+    """
+    _, _, f_num = compile_expression(func_expr, 0)
+    fused = compile_fused(func_expr, (1, 2))
+    t_start = perf_counter()
+    f_counted = CountedFunction(f_num)
+    fused_counted = CountedFunction(fused)
+
+    def derivatives(xs: np.ndarray):
+        # Derivadas constantes llegan como escalares: se difunden al tamaño de xs
+        return [np.broadcast_to(np.asarray(d, dtype=float), xs.shape) for d in fused_counted(xs)]
+
+    x = np.array(x0s, dtype=float).ravel()
+    iterations = np.zeros(x.size, dtype=int)
+    converged = np.zeros(x.size, dtype=bool)
+    active = np.isfinite(x)
+
+    for it in range(1, max_iter + 1):
+        idx = np.flatnonzero(active)
+        if idx.size == 0:
             break
+        xi = x[idx]
+        d1, d2 = derivatives(xi)
+
+        # Carriles con f'' = 0 o valores no finitos: se detienen sin converger
+        bad = (d2 == 0) | ~np.isfinite(d1) | ~np.isfinite(d2)
+        step = np.zeros(idx.size)
+        np.divide(d1, d2, out=step, where=~bad)
+        x[idx[~bad]] = xi[~bad] - step[~bad]
+        iterations[idx[~bad]] = it
+
+        done = ~bad & (np.abs(step) < tol)
+        converged[idx[done]] = True
+        active[idx[bad | done]] = False
+
+    # Agrupar puntos convergidos cercanos y clasificarlos por el signo de f''
+    merge_tol = 10 * tol if merge_tol is None else merge_tol
+    found = np.sort(x[converged])
+    if found.size:
+        groups = np.split(found, np.flatnonzero(np.diff(found) > merge_tol) + 1)
+        points = np.array([np.median(g) for g in groups])
+        counts = np.array([g.size for g in groups])
+    else:
+        points = np.empty(0)
+        counts = np.empty(0, dtype=int)
+    d2_points = derivatives(points)[1]
+    kinds = ["máximo" if v < 0 else "mínimo" if v > 0 else "indeterminado" for v in d2_points]
 
-    import pandas as pd
-    table = pd.DataFrame(rows, columns=["Iter", "xi", "f'(xi)", "f''(xi)", "xi+1", "Error"])
-    return float(xi), table, errors
+    return NewtonMultistartResult(points=points, f_points=evaluate_array(f_counted, points), kinds=kinds,
+                                  counts=counts, x_final=x, iterations=iterations, converged=converged,
+                                  **eval_stats(t_start, f_counted, fused_counted, fused_counted))
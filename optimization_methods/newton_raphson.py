@@ -1,52 +1,299 @@
 # optimization_methods/newton_raphson.py
-import sympy as sp
+from dataclasses import dataclass, field, replace
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+import math
 import pandas as pd
+from time import perf_counter
 
-def newton_raphson(func_expr: str, x0: float, tol: float = 1e-5, max_iter: int = 50):
+from optimization_methods.utils import compile_expression, compile_fused
+from optimization_methods.trace import IterationTrace
+from optimization_methods.evaluation import CountedFunction, MemoizedFunction, eval_stats
+from optimization_methods.steps import IterationState, make_state
+
+COLUMNS = ["Iter", "xi", "f(xi)", "f'(xi)", "xi+1", "Error"]
+# Modo protegido: además el intervalo [a, b] con cambio de signo al inicio de la
+# iteración (NaN si aún no hay) y Newton = 1 si se aceptó el paso de Newton, 0 si bisección
+SAFEGUARD_COLUMNS = COLUMNS + ["a", "b", "Newton"]
+# Búsqueda automática de intervalo: paso inicial relativo y número de expansiones (x2)
+EXPAND_STEP = 0.1
+EXPAND_TRIES = 40
+
+@dataclass
+class NewtonRaphsonCheckpoint:
+    """
+    Estado de Newton-Raphson tras la última iteración completa, para continuar
+    exactamente donde se detuvo (newton_raphson(..., resume=checkpoint)). Solo
+    tiene str, floats, enteros y un dict: se puede guardar con pickle.
+    """
+    func_expr: str
+    x: float                  # próximo punto a evaluar
+    iterations: int = 0       # iteraciones acumuladas de todas las ejecuciones
+    error: float = float("inf")
+    converged: bool = False
+    safeguard: bool = False   # modo protegido (Newton con respaldo de bisección)
+    bracket: Optional[Tuple[float, float]] = None   # intervalo con cambio de signo, si ya hay
+    # (f(x), f'(x)) ya calculados con clave (x, signo de x) como en MemoizedFunction,
+    # del más antiguo al más reciente; al reanudar se reutilizan, así un ciclo que
+    # vuelve a puntos visitados no repite evaluaciones
+    cache: Dict[Tuple[float, float], Tuple[float, float]] = field(default_factory=dict)
+
+@dataclass
+class NewtonRaphsonResult:
+    root: float
+    iterations: int
+    trace: IterationTrace
+    errors: List[float]
+    n_f_evals: int = 0
+    n_df_evals: int = 0
+    n_d2f_evals: int = 0
+    eval_time: float = 0.0
+    iter_time: float = 0.0
+    checkpoint: Optional[NewtonRaphsonCheckpoint] = None
+    n_newton: int = 0         # modo protegido: pasos de Newton aceptados
+    n_bisection: int = 0      # modo protegido: pasos de bisección
+
+    @property
+    def table(self) -> pd.DataFrame:
+        return self.trace.table
+
+    def __iter__(self):
+        # Compatibilidad: root, table, errors = newton_raphson(...)
+        return iter((self.root, self.table, self.errors))
+
+def newton_raphson(func_expr: str, x0: float, tol: float = 1e-5, max_iter: int = 50,
+                   trace: str = "dataframe",
+                   callback: Optional[Callable[[int, IterationState], None]] = None,
+                   resume: Optional[NewtonRaphsonCheckpoint] = None,
+                   bracket: Optional[Tuple[float, float]] = None,
+                   safeguard: bool = False) -> NewtonRaphsonResult:
     """
     Método de Newton-Raphson para encontrar raíces de una función f(x) = 0.
 
+    Con safeguard=True (o al dar bracket) corre en modo protegido: un paso de Newton
+    solo se acepta si queda dentro del intervalo con cambio de signo y reduce |f|;
+    si no (f' nula, valores no finitos, residuo que no baja, lo que también corta
+    los ciclos) se toma un paso de bisección. Sin bracket se usa Newton hasta ver un
+    cambio de signo entre puntos evaluados; si un paso se rechaza antes, el
+    intervalo se busca automáticamente expandiendo alrededor del mejor punto.
+
     Parámetros:
         func_expr : str -> expresión de la función (ej: "2*sin(x) - x**2/10")
         x0        : float -> valor inicial
         tol       : float -> tolerancia
         max_iter  : int   -> máximo de iteraciones
+        trace     : str   -> "dataframe", "arrays" o "none" (ver IterationTrace)
+        callback  : callable -> callback(iter, state) opcional (ver IterationState)
+        resume    : NewtonRaphsonCheckpoint -> checkpoint de una ejecución anterior
+                    (result.checkpoint) de la misma expresión; se continúa desde su
+                    punto (x0 se ignora) y max_iter cuenta solo las iteraciones nuevas;
+                    conserva el modo y el intervalo del checkpoint
+        bracket   : (a, b) -> intervalo con f(a)*f(b) <= 0 para el modo protegido; si
+                    x0 queda fuera se parte del punto medio
+        safeguard : bool  -> modo protegido aun sin bracket
 
-    Retorna:
+    Retorna un NewtonRaphsonResult, desempaquetable como:
         root      : float -> raíz aproximada
         table     : DataFrame con las iteraciones
         errors    : lista con errores por iteración
+    Además incluye n_f_evals, n_df_evals, eval_time, iter_time y checkpoint (y en
+    modo protegido n_newton y n_bisection).
+    Errores: ZeroDivisionError si f' se anula (modo normal); ValueError si el bracket
+    no tiene cambio de signo o si el modo protegido no encuentra intervalo.
     """
-    x = sp.Symbol("x")
-    f = sp.sympify(func_expr)
-    fprime = sp.diff(f, x)
+    _check_resume(resume, func_expr)
+    # f y f' fusionadas: las subexpresiones comunes se calculan una sola vez por punto
+    fused = compile_fused(func_expr, (0, 1))
+    t_start = perf_counter()
+    # Copia propia: el generador la actualiza en su lugar y el checkpoint recibido no cambia
+    checkpoint = (replace(resume) if resume is not None
+                  else _initial_checkpoint(func_expr, x0, bracket, safeguard))
+    fused_counted = CountedFunction(fused)
+    f_and_fprime = MemoizedFunction(fused_counted, initial=checkpoint.cache)
+    steps = _make_steps(f_and_fprime, checkpoint, tol, max_iter)
 
-    f_lamb = sp.lambdify(x, f, modules=["numpy"])
-    fprime_lamb = sp.lambdify(x, fprime, modules=["numpy"])
-
-    xi = x0
+    xi = checkpoint.x
+    columns = SAFEGUARD_COLUMNS if checkpoint.safeguard else COLUMNS
+    record = IterationTrace(columns, mode=trace, capacity=max_iter)
+    keep_errors = trace != "none"
     errors = []
-    data = []
+    n_newton = 0
+
+    for state in steps:
+        xi = state.x
+        record.append(*state.row)
+        if keep_errors:
+            errors.append(state.error)
+        if checkpoint.safeguard:
+            n_newton += state.row[8] == 1.0
+        if callback is not None:
+            callback(state.iter, state)
+
+    checkpoint.cache = {key: (float(fx), float(fpx)) for key, (fx, fpx) in f_and_fprime.snapshot().items()}
+    n_bisection = len(record) - n_newton if checkpoint.safeguard else 0
+    return NewtonRaphsonResult(root=xi, iterations=len(record), trace=record, errors=errors,
+                               checkpoint=checkpoint, n_newton=n_newton, n_bisection=n_bisection,
+                               **eval_stats(t_start, fused_counted, fused_counted))
 
-    for it in range(1, max_iter + 1):
-        fxi = f_lamb(xi)
-        fpxi = fprime_lamb(xi)
 
-        if fpxi == 0:
-            raise ZeroDivisionError("La derivada se anuló, no se puede continuar.")
+def newton_raphson_steps(func_expr: str, x0: float, tol: float = 1e-5, max_iter: int = 50,
+                         resume: Optional[NewtonRaphsonCheckpoint] = None,
+                         bracket: Optional[Tuple[float, float]] = None,
+                         safeguard: bool = False) -> Iterator[IterationState]:
+    """
+    Newton-Raphson paso a paso: devuelve un iterador que produce un IterationState
+    por iteración (x = xi+1, error = |xi+1 - xi|; en modo protegido, bracket = el
+    intervalo con cambio de signo tras la iteración, o None si aún no hay).
+    Con resume se parte de ese checkpoint, que el generador actualiza en su lugar al
+    terminar o al cerrarse (su caché de valores no se modifica).
+    El bracket y el checkpoint se validan al llamar, antes de la primera iteración.
+    """
+    _check_resume(resume, func_expr)
+    state = resume if resume is not None else _initial_checkpoint(func_expr, x0, bracket, safeguard)
+    return _make_steps(compile_fused(func_expr, (0, 1)), state, tol, max_iter)
+
+def _check_resume(resume, func_expr):
+    # Se comparan las expresiones de SymPy, no las cadenas: "x**2-2" y "x**2 - 2" son la misma
+    if resume is None:
+        return
+    if compile_expression(resume.func_expr, 0)[1] != compile_expression(func_expr, 0)[1]:
+        raise ValueError("El checkpoint corresponde a otra función: "
+                         f"'{resume.func_expr}' en lugar de '{func_expr}'.")
+
+def _initial_checkpoint(func_expr, x0, bracket, safeguard):
+    x0 = float(x0)
+    if bracket is not None:
+        a, b = sorted(map(float, bracket))
+        if not a <= x0 <= b:
+            x0 = 0.5 * (a + b)
+        bracket = (a, b)
+    return NewtonRaphsonCheckpoint(func_expr=func_expr, x=x0, safeguard=safeguard or bracket is not None,
+                                   bracket=bracket)
+
+def _make_steps(f_and_fprime, state, tol, max_iter):
+    if not state.safeguard:
+        return _newton_raphson_steps(f_and_fprime, state, tol, max_iter)
+    neg = pos = None
+    if state.bracket is not None:
+        neg, pos = _bracket_signs(f_and_fprime, *state.bracket)
+    return _safeguarded_steps(f_and_fprime, state, tol, max_iter, neg, pos)
+
+def _bracket_signs(f_and_fprime, a, b):
+    """Devuelve (punto con f <= 0, punto con f >= 0) de [a, b]; valida el cambio de signo."""
+    fa = float(f_and_fprime(a)[0])
+    fb = float(f_and_fprime(b)[0])
+    if not (math.isfinite(fa) and math.isfinite(fb)):
+        raise ValueError("La función no es finita en los límites del intervalo.")
+    if fa * fb > 0:
+        raise ValueError("No hay cambio de signo en [a, b]. Asegura f(a)*f(b) <= 0.")
+    if fa == 0.0:
+        return a, a
+    if fb == 0.0:
+        return b, b
+    return (a, b) if fa < 0 else (b, a)
 
-        x_next = xi - fxi / fpxi
-        error = abs(x_next - xi)
+def _newton_raphson_steps(f_and_fprime, state, tol, max_iter):
+    xi, done, error, converged = state.x, state.iterations, state.error, False
+    # El estado vive en variables locales y se vuelca al checkpoint una sola vez al salir
+    try:
+        for it in range(done + 1, done + max_iter + 1):
+            fxi, fpxi = f_and_fprime(xi)
+
+            if fpxi == 0:
+                raise ZeroDivisionError("La derivada se anuló, no se puede continuar.")
+
+            x_next = xi - fxi / fpxi
+            error = abs(x_next - xi)
+            row = (it, xi, fxi, fpxi, x_next, error)
+            xi, done, converged = x_next, it, error < tol
+            yield make_state((it, xi, error, None, row))
+            if converged:
+                return
+    finally:
+        state.x, state.iterations, state.error, state.converged = float(xi), done, float(error), converged
+
+def _evaluate(f_and_fprime, x):
+    """(f(x), f'(x)) como floats; un error numérico (p. ej. un polo) cuenta como no finito."""
+    try:
+        fx, fpx = f_and_fprime(x)
+    except (ZeroDivisionError, OverflowError, ValueError):
+        return math.nan, math.nan
+    return float(fx), float(fpx)
+
+def _expand_bracket(f_and_fprime, x, fx):
+    """
+    Busca un cambio de signo alrededor de x evaluando x ± h con h creciente (x2).
+    Devuelve (punto con f < 0, punto con f > 0), el más cercano a x primero.
+    """
+    h = EXPAND_STEP * max(abs(x), 1.0)
+    tries = 0
+    while tries < EXPAND_TRIES:
+        tries += 1
+        for xn in (x - h, x + h):
+            fn = _evaluate(f_and_fprime, xn)[0]
+            if fn == 0.0:
+                return xn, xn
+            if not math.isfinite(fx) and math.isfinite(fn):
+                # x fuera del dominio: se vuelve a empezar desde el primer punto válido
+                x, fx = xn, fn
+                h = EXPAND_STEP * max(abs(x), 1.0) / 2.0
+                tries = 0
+                break
+            if math.isfinite(fn) and (fn < 0) != (fx < 0):
+                return (xn, x) if fn < 0 else (x, xn)
+        h *= 2.0
+    raise ValueError(f"No se encontró un intervalo con cambio de signo alrededor de x = {x:.6g}.")
 
-        data.append([it, xi, fxi, fpxi, x_next, error])
-        errors.append(error)
+def _safeguarded_steps(f_and_fprime, state, tol, max_iter, neg, pos):
+    # neg/pos: últimos puntos evaluados con f <= 0 y f >= 0; con ambos hay intervalo
+    xi, done, error, converged = state.x, state.iterations, state.error, False
+    fxi, fpxi = _evaluate(f_and_fprime, xi)
+    # El punto de partida también cuenta (salvo fuera del bracket dado): así un cambio
+    # de signo entre x0 y el primer paso de Newton ya forma intervalo
+    if math.isfinite(fxi) and (neg is None or pos is None or min(neg, pos) <= xi <= max(neg, pos)):
+        neg, pos = (xi, pos) if fxi <= 0 else (neg, xi)
+    try:
+        for it in range(done + 1, done + max_iter + 1):
+            bracketed = neg is not None and pos is not None
+            a, b = (min(neg, pos), max(neg, pos)) if bracketed else (math.nan, math.nan)
+            newton = False
 
-        if error < tol:
-            xi = x_next
-            break
-        xi = x_next
+            if fxi == 0.0:
+                x_next, newton = xi, True
+            elif math.isfinite(fxi) and math.isfinite(fpxi) and fpxi != 0.0:
+                xn = xi - fxi / fpxi
+                if math.isfinite(xn) and (not bracketed or a <= xn <= b):
+                    if abs(xn - xi) < tol:
+                        # Paso ya menor que tol: se acepta sin evaluar (como el modo normal)
+                        x_next, newton = xn, True
+                    else:
+                        fn, fpn = _evaluate(f_and_fprime, xn)
+                        if math.isfinite(fn):
+                            neg, pos = (xn, pos) if fn <= 0 else (neg, xn)
+                        # Solo se acepta si reduce el residuo: así no puede ciclar ni divergir
+                        if math.isfinite(fn) and abs(fn) < abs(fxi):
+                            x_next, newton, fx_next, fpx_next = xn, True, fn, fpn
 
-    columns = ["Iter", "xi", "f(xi)", "f'(xi)", "xi+1", "Error"]
-    table = pd.DataFrame(data, columns=columns)
+            if not newton:
+                if neg is None or pos is None:
+                    neg, pos = _expand_bracket(f_and_fprime, xi, fxi)
+                x_next = 0.5 * (neg + pos)
+                fx_next, fpx_next = _evaluate(f_and_fprime, x_next)
+                if not math.isfinite(fx_next):
+                    raise ValueError(f"La función no es finita en x = {x_next:.6g} dentro del intervalo.")
+                neg, pos = (x_next, pos) if fx_next <= 0 else (neg, x_next)
 
-    return xi, table, errors
+            error = abs(x_next - xi)
+            row = (it, xi, fxi, fpxi, x_next, error, a, b, 1.0 if newton else 0.0)
+            width = abs(pos - neg) if neg is not None and pos is not None else math.inf
+            converged = error < tol or width < tol or x_next == xi
+            if not converged:
+                fxi, fpxi = fx_next, fpx_next
+            xi, done = x_next, it
+            bracket = (min(neg, pos), max(neg, pos)) if width < math.inf else None
+            yield make_state((it, xi, error, bracket, row))
+            if converged:
+                return
+    finally:
+        state.x, state.iterations, state.error, state.converged = float(xi), done, float(error), converged
+        if neg is not None and pos is not None:
+            state.bracket = (min(neg, pos), max(neg, pos))
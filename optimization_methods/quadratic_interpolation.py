@@ -1,20 +1,73 @@
 # optimization_methods/quadratic_interpolation.py
+from dataclasses import dataclass
+from typing import Iterator
 import numpy as np
 import pandas as pd
-import sympy as sp
+from time import perf_counter
 
-def quadratic_interpolation_method(func_expr, x0, x1, x2, tol=1e-5, max_iter=50):
+from optimization_methods.utils import compile_expression
+from optimization_methods.trace import IterationTrace
+from optimization_methods.evaluation import CountedFunction, MemoizedFunction, eval_stats
+from optimization_methods.steps import IterationState, make_state
+
+COLUMNS = ["Iter", "x0", "f(x0)", "x1", "f(x1)", "x2", "f(x2)", "x3", "f(x3)", "Error"]
+
+@dataclass
+class QuadraticInterpolationResult:
+    point: float
+    iterations: int
+    trace: IterationTrace
+    n_f_evals: int = 0
+    n_df_evals: int = 0
+    n_d2f_evals: int = 0
+    eval_time: float = 0.0
+    iter_time: float = 0.0
+
+    @property
+    def table(self) -> pd.DataFrame:
+        return self.trace.table
+
+    def __iter__(self):
+        # Compatibilidad: point, table = quadratic_interpolation_method(...)
+        return iter((self.point, self.table))
+
+def quadratic_interpolation_method(func_expr, x0, x1, x2, tol=1e-5, max_iter=50, trace="dataframe",
+                                   callback=None):
     """
     Método de interpolación cuadrática para optimización unidimensional.
+    Devuelve un QuadraticInterpolationResult, desempaquetable como (punto, tabla),
+    con n_f_evals, eval_time e iter_time.
+    trace: "dataframe", "arrays" o "none" (ver IterationTrace).
+    callback: callback(iter, state) opcional tras cada iteración (ver IterationState).
     """
 
-    x = sp.Symbol("x")
-    try:
-        f = sp.lambdify(x, sp.sympify(func_expr), modules=["numpy"])
-    except Exception as e:
-        raise ValueError(f"Función inválida: {e}")
+    _, _, f = compile_expression(func_expr, 0)
+    t_start = perf_counter()
+    counted = CountedFunction(f)
+    # Dos de los tres puntos (o los tres) se conservan entre iteraciones: salen de la caché
+    f = MemoizedFunction(counted)
+
+    record = IterationTrace(COLUMNS, mode=trace, capacity=max_iter)
+    x3 = x1
+    for state in _quadratic_interpolation_steps(f, x0, x1, x2, tol, max_iter):
+        x3 = state.x
+        record.append(*state.row)
+        if callback is not None:
+            callback(state.iter, state)
+
+    return QuadraticInterpolationResult(point=x3, iterations=len(record), trace=record,
+                                        **eval_stats(t_start, counted))
 
-    data = []
+
+def quadratic_interpolation_steps(func_expr, x0, x1, x2, tol=1e-5, max_iter=50) -> Iterator[IterationState]:
+    """
+    Interpolación cuadrática paso a paso: devuelve un iterador que produce un
+    IterationState por iteración (x = x3, bracket = (x0, x2) tras el reemplazo).
+    """
+    _, _, f = compile_expression(func_expr, 0)
+    return _quadratic_interpolation_steps(MemoizedFunction(f), x0, x1, x2, tol, max_iter)
+
+def _quadratic_interpolation_steps(f, x0, x1, x2, tol, max_iter):
     prev_x = x1  # para calcular error inicial
     for it in range(1, max_iter + 1):
         f0, f1, f2 = f(x0), f(x1), f(x2)
@@ -30,27 +83,25 @@ def quadratic_interpolation_method(func_expr, x0, x1, x2, tol=1e-5, max_iter=50)
         # Calcular error relativo aproximado
         error = abs(x3 - prev_x)
         prev_x = x3
-
-        data.append([it, x0, f0, x1, f1, x2, f2, x3, f3, error])
+        row = (it, x0, f0, x1, f1, x2, f2, x3, f3, error)
 
         # Criterio de parada
-        if error < tol:
-            break
+        done = error < tol
 
         # Reemplazo de puntos
-        if f3 > f1:
-            if x3 > x1:
-                x0 = x1
-            else:
-                x2 = x1
-            x1 = x3
-        else:
-            if x3 > x1:
-                x2 = x3
+        if not done:
+            if f3 > f1:
+                if x3 > x1:
+                    x0 = x1
+                else:
+                    x2 = x1
+                x1 = x3
             else:
-                x0 = x3
-
-    columns = ["Iter", "x0", "f(x0)", "x1", "f(x1)", "x2", "f(x2)", "x3", "f(x3)", "Error"]
-    table = pd.DataFrame(data, columns=columns)
+                if x3 > x1:
+                    x2 = x3
+                else:
+                    x0 = x3
 
-    return x3, table
+        yield make_state((it, x3, error, (x0, x2), row))
+        if done:
+            return
@@ -1,9 +1,43 @@
 # optimization_methods/random_search.py
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Iterator
 import numpy as np
 import pandas as pd
-import sympy as sp
+from time import perf_counter
 
-def random_search(func_expr: str, xl: float, xu: float, max_iter: int = 50, seed: int = None):
+from optimization_methods.utils import compile_expression, evaluate_array
+from optimization_methods.trace import IterationTrace
+from optimization_methods.evaluation import CountedFunction, MemoizedFunction, eval_stats
+from optimization_methods.steps import IterationState, make_state
+
+COLUMNS = ["Iter", "xi", "f(xi)", "x_best", "f(x_best)"]
+EVAL_BLOCK = 65536
+STREAM_CHUNK = 65536
+
+@dataclass
+class RandomSearchResult:
+    x_best: float
+    f_best: float
+    iterations: int
+    trace: IterationTrace
+    n_f_evals: int = 0
+    n_df_evals: int = 0
+    n_d2f_evals: int = 0
+    eval_time: float = 0.0
+    iter_time: float = 0.0
+
+    @property
+    def table(self) -> pd.DataFrame:
+        return self.trace.table
+
+    def __iter__(self):
+        # Compatibilidad: x_best, f_best, table = random_search(...)
+        return iter((self.x_best, self.f_best, self.table))
+
+def random_search(func_expr: str, xl: float, xu: float, max_iter: int = 50, seed: int = None,
+                  trace: str = "dataframe", callback=None, chunk_size: int = None):
     """
     Método de Búsqueda Aleatoria (Random Search) para optimización unidimensional.
 
@@ -12,30 +46,245 @@ def random_search(func_expr: str, xl: float, xu: float, max_iter: int = 50, seed
         xl, xu: float    -> límites del intervalo de búsqueda
         max_iter: int    -> número de evaluaciones aleatorias
         seed: int        -> semilla opcional para reproducibilidad
+        trace: str       -> "dataframe", "arrays" o "none" (ver IterationTrace)
+        callback         -> callback(n, state) opcional por bloque de muestras (ver IterationState)
+        chunk_size: int  -> si se indica, modo streaming: genera y evalúa bloques de
+                            ese tamaño en memoria constante y la tabla solo guarda las
+                            muestras que mejoran el óptimo (más la última)
 
-    Retorna:
+    Retorna un RandomSearchResult, desempaquetable como:
         x_best: float    -> punto óptimo encontrado
         f_best: float    -> valor óptimo
         table: DataFrame -> tabla con iteraciones
+    Además incluye n_f_evals (puntos evaluados), eval_time e iter_time.
     """
+    _, _, f = compile_expression(func_expr, 0)
+    t_start = perf_counter()
+    counted = CountedFunction(f)
+    f = MemoizedFunction(counted)   # los arreglos pasan directo
+
     if seed is not None:
         np.random.seed(seed)
 
-    x = sp.Symbol("x")
-    try:
-        f = sp.lambdify(x, sp.sympify(func_expr), modules=["numpy"])
-    except Exception as e:
-        raise ValueError(f"Función inválida: {e}")
+    if chunk_size is not None:
+        return _random_search_stream(f, counted, t_start, xl, xu, max_iter, int(chunk_size), trace, callback)
 
     xs = np.random.uniform(xl, xu, max_iter)
-    fs = f(xs)
+    if callback is None:
+        fs = evaluate_array(f, xs)
+    else:
+        # Evaluación por bloques para poder informar progreso y cancelar
+        fs = np.empty(max_iter)
+        best_x, best_f = np.nan, -np.inf
+        for start in range(0, max_iter, EVAL_BLOCK):
+            stop = min(start + EVAL_BLOCK, max_iter)
+            fs[start:stop] = evaluate_array(f, xs[start:stop])
+            block = fs[start:stop]
+            if np.isfinite(block).any():
+                j = start + int(np.nanargmax(block))
+                if fs[j] > best_f:
+                    best_x, best_f = xs[j], fs[j]
+            callback(stop, _progress_state(stop, xl, xu, xs[stop - 1], fs[stop - 1], best_x, best_f))
+
+    # Mejor valor acumulado: una muestra reemplaza al mejor solo si lo supera estrictamente
+    running = np.fmax.accumulate(fs)
+    improves = np.empty(max_iter, dtype=bool)
+    improves[:1] = True
+    improves[1:] = fs[1:] > running[:-1]
+    best_so_far = np.maximum.accumulate(np.where(improves, np.arange(max_iter), 0))
+    best_idx = int(best_so_far[-1]) if max_iter else 0
+
+    record = IterationTrace(COLUMNS, mode=trace, capacity=max_iter)
+    if trace == "none":
+        record.skip(max_iter)
+    else:
+        record.extend({
+            "Iter": np.arange(1, max_iter + 1),
+            "xi": xs,
+            "f(xi)": fs,
+            "x_best": xs[best_so_far],
+            "f(x_best)": fs[best_so_far],
+        })
+
+    return RandomSearchResult(x_best=xs[best_idx], f_best=fs[best_idx], iterations=max_iter, trace=record,
+                              **eval_stats(t_start, counted))
+
+
+def _random_search_stream(f, counted, t_start, xl, xu, max_iter, chunk_size, trace, callback):
+    """
+    Búsqueda aleatoria por bloques: memoria O(chunk_size) sin importar max_iter.
+    Con la misma semilla da el mismo óptimo que el modo normal (los bloques
+    consumen el mismo flujo de números aleatorios).
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size debe ser >= 1.")
+    record = IterationTrace(COLUMNS, mode=trace, capacity=64)
+    keep_rows = trace != "none"
+    state = None
+
+    for start, xs, fs, idx, state in _stream_blocks(f, xl, xu, max_iter, chunk_size):
+        if keep_rows and idx.size:
+            record.extend({
+                "Iter": start + idx + 1,
+                "xi": xs[idx], "f(xi)": fs[idx],
+                "x_best": xs[idx], "f(x_best)": fs[idx],
+            })
+        if callback is not None:
+            callback(state.iter, state)
+
+    best_x, best_f = (state.row[3], state.row[4]) if state is not None else (np.nan, -np.inf)
+    # Última muestra para que la curva de progreso llegue hasta max_iter
+    if keep_rows and max_iter and (len(record) == 0 or record.column("Iter")[-1] != max_iter):
+        record.append(*state.row)
+
+    return RandomSearchResult(x_best=best_x, f_best=best_f, iterations=max_iter, trace=record,
+                              **eval_stats(t_start, counted))
+
+
+def _stream_blocks(f, xl, xu, max_iter, chunk_size):
+    """
+    Núcleo del modo streaming: por bloque devuelve (inicio, xs, fs, índices que
+    mejoran el óptimo, IterationState con el mejor acumulado).
+    """
+    best_x, best_f = np.nan, -np.inf
+    for start in range(0, max_iter, chunk_size):
+        n = min(chunk_size, max_iter - start)
+        xs = np.random.uniform(xl, xu, n)
+        fs = evaluate_array(f, xs)
+
+        # Muestras que superan estrictamente al mejor acumulado (incluidos bloques previos)
+        previous = np.empty(n)
+        previous[0] = best_f
+        previous[1:] = np.fmax(np.fmax.accumulate(fs)[:-1], best_f)
+        improves = fs > previous
+        if start == 0:
+            improves[0] = True
+        idx = np.flatnonzero(improves)
+        if idx.size:
+            best_x, best_f = xs[idx[-1]], fs[idx[-1]]
+        yield start, xs, fs, idx, _progress_state(start + n, xl, xu, xs[-1], fs[-1], best_x, best_f)
+
+
+def _progress_state(n, xl, xu, x_last, f_last, best_x, best_f) -> IterationState:
+    # Fila = última muestra evaluada; la búsqueda aleatoria no tiene error por iteración
+    return make_state((n, best_x, np.nan, (xl, xu), (n, x_last, f_last, best_x, best_f)))
+
+
+def random_search_steps(func_expr: str, xl: float, xu: float, max_iter: int = 50, seed: int = None,
+                        chunk_size: int = STREAM_CHUNK) -> Iterator[IterationState]:
+    """
+    Búsqueda aleatoria paso a paso: un IterationState por bloque de chunk_size
+    muestras (iter = muestras evaluadas, x = mejor punto hasta ahí, error = NaN).
+    Consume el mismo flujo aleatorio que random_search con chunk_size.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size debe ser >= 1.")
+    _, _, f = compile_expression(func_expr, 0)
+    if seed is not None:
+        np.random.seed(seed)
+    return (state for *_, state in _stream_blocks(f, xl, xu, max_iter, int(chunk_size)))
+
+
+def _search_blocks(func_expr, xl, xu, entropy, block_ids, chunk_size, max_iter):
+    """
+    Trabajo de un proceso: evalúa los bloques indicados. El bloque k usa su propio
+    Generator, hijo k de SeedSequence(entropy), así el resultado no depende de qué
+    proceso lo ejecute. Devuelve por bloque sus récords internos (índice global, x, f).
+    """
+    _, _, f = compile_expression(func_expr, 0)
+    counted = CountedFunction(f)
+    out = []
+    for k in block_ids:
+        start = k * chunk_size
+        n = min(chunk_size, max_iter - start)
+        rng = np.random.default_rng(np.random.SeedSequence(entropy, spawn_key=(k,)))
+        xs = rng.uniform(xl, xu, n)
+        fs = evaluate_array(counted, xs)
+
+        improves = np.empty(n, dtype=bool)
+        improves[0] = True
+        improves[1:] = fs[1:] > np.fmax.accumulate(fs)[:-1]
+        idx = np.flatnonzero(improves)
+        out.append((k, start + idx, xs[idx], fs[idx]))
+    return out, counted.calls, counted.elapsed
+
+
+def random_search_parallel(func_expr: str, xl: float, xu: float, max_iter: int = 50, seed: int = None,
+                           workers: int = None, chunk_size: int = STREAM_CHUNK,
+                           trace: str = "dataframe", callback=None) -> RandomSearchResult:
+    """
+    Búsqueda aleatoria en paralelo sobre un ProcessPoolExecutor.
+
+    Las muestras se dividen en bloques de chunk_size; el bloque k se genera con
+    numpy.random.Generator a partir del hijo k de una única SeedSequence(seed).
+    Como los bloques (y no los procesos) fijan los flujos aleatorios y la fusión
+    recorre los bloques en orden (gana el primer máximo), la misma semilla da el
+    mismo resultado con cualquier número de procesos. No toca el estado global
+    de np.random.
+
+    workers: procesos (por defecto, núcleos); con 1 se ejecuta en el proceso actual.
+    La tabla guarda solo las muestras que mejoran el óptimo (más la última).
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size debe ser >= 1.")
+    compile_expression(func_expr, 0)  # valida la expresión antes de lanzar procesos
+    t_start = perf_counter()
+    entropy = np.random.SeedSequence(seed).entropy
+    n_blocks = -(-max_iter // chunk_size)
+    workers = max(1, min(workers or os.cpu_count() or 1, n_blocks or 1))
+
+    # Varios bloques por tarea para amortizar el envío entre procesos
+    per_task = max(1, n_blocks // (workers * 4))
+    tasks = [range(i, min(i + per_task, n_blocks)) for i in range(0, n_blocks, per_task)]
+    args = (func_expr, xl, xu, entropy)
+
+    blocks, n_evals, eval_time, done = [], 0, 0.0, 0
+    seen_x, seen_f = np.nan, -np.inf   # mejor visto hasta ahora, solo para informar progreso
+    def collect(out):
+        nonlocal n_evals, eval_time, done, seen_x, seen_f
+        block_rows, calls, elapsed = out
+        blocks.extend(block_rows)
+        n_evals += calls
+        eval_time += elapsed
+        done += calls
+        if callback is not None:
+            for _, _, xs, fs in block_rows:
+                if np.isfinite(fs).any() and np.nanmax(fs) > seen_f:
+                    j = int(np.nanargmax(fs))
+                    seen_x, seen_f = xs[j], fs[j]
+            callback(done, _progress_state(done, xl, xu, np.nan, np.nan, seen_x, seen_f))
+
+    if workers == 1:
+        for ids in tasks:
+            collect(_search_blocks(*args, ids, chunk_size, max_iter))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_search_blocks, *args, ids, chunk_size, max_iter) for ids in tasks]
+            try:
+                for future in as_completed(futures):
+                    collect(future.result())
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
 
-    data = []
-    best_idx = 0
-    for i in range(max_iter):
-        if fs[i] > fs[best_idx]:
-            best_idx = i
-        data.append([i + 1, xs[i], fs[i], xs[best_idx], fs[best_idx]])
+    # Fusión determinista: bloques en orden, solo récords que superan al mejor global
+    record = IterationTrace(COLUMNS, mode=trace, capacity=64)
+    keep_rows = trace != "none"
+    best_x, best_f = np.nan, -np.inf
+    for k, idx, xs, fs in sorted(blocks, key=lambda b: b[0]):
+        previous = np.fmax(np.concatenate(([best_f], np.fmax.accumulate(fs)[:-1])), best_f)
+        improves = fs > previous
+        if k == 0:
+            improves[0] = True
+        sel = np.flatnonzero(improves)
+        if sel.size:
+            if keep_rows:
+                record.extend({"Iter": idx[sel] + 1, "xi": xs[sel], "f(xi)": fs[sel],
+                               "x_best": xs[sel], "f(x_best)": fs[sel]})
+            best_x, best_f = xs[sel[-1]], fs[sel[-1]]
+    if keep_rows and max_iter and (len(record) == 0 or record.column("Iter")[-1] != max_iter):
+        record.append(max_iter, np.nan, np.nan, best_x, best_f)
 
-    table = pd.DataFrame(data, columns=["Iter", "xi", "f(xi)", "x_best", "f(x_best)"])
-    return xs[best_idx], fs[best_idx], table
+    return RandomSearchResult(x_best=best_x, f_best=best_f, iterations=max_iter, trace=record,
+                              n_f_evals=n_evals, eval_time=eval_time, iter_time=perf_counter() - t_start)
@@ -0,0 +1,199 @@
+# optimization_methods/sampling.py
+from dataclasses import dataclass
+from typing import Callable, Optional, Tuple
+import numpy as np
+
+from optimization_methods.utils import evaluate_array
+
+# Valores por defecto para "Graficar función"
+INITIAL_POINTS = 129      # malla uniforme inicial
+MAX_EVALS = 4000          # tope total de evaluaciones de f
+MAX_DEPTH = 12            # subdivisiones máximas de un intervalo de la malla inicial
+CURVATURE_TOL = 2e-3      # desviación de la recta, relativa a la escala en y (~1 píxel)
+JUMP_FRAC = 0.5           # salto |Δy| (relativo a la escala en y) que se refina como posible polo
+MAX_POINTS = 1200         # puntos a dibujar; más que esto se reduce con LTTB
+
+
+@dataclass
+class SampledFunction:
+    xs: np.ndarray                      # con NaN en y para cortar la línea en polos y huecos
+    ys: np.ndarray
+    poles: np.ndarray                   # posiciones aproximadas de polos/saltos detectados
+    n_evals: int
+    ylim: Optional[Tuple[float, float]] = None   # rango sugerido en y si hay polos
+
+
+def _evaluate(f: Callable, xs: np.ndarray) -> np.ndarray:
+    with np.errstate(all="ignore"):
+        return evaluate_array(f, xs)
+
+
+def _y_window(ys: np.ndarray) -> Tuple[float, float, float]:
+    """
+    Escala robusta en y (percentiles 2–98 de los valores finitos) y la ventana
+    [lo, hi] fuera de la cual los valores no se distinguen en la gráfica.
+    """
+    finite = ys[np.isfinite(ys)]
+    if finite.size == 0:
+        return 1.0, -1.0, 1.0
+    p_lo, p_hi = np.percentile(finite, [2, 98])
+    scale = p_hi - p_lo
+    if not scale > 0:
+        scale = max(float(np.abs(finite).max()), 1.0)
+    return scale, p_lo - 2 * scale, p_hi + 2 * scale
+
+
+def _interval_scores(xs: np.ndarray, ys: np.ndarray, scale: float,
+                     tol: float, jump_frac: float) -> np.ndarray:
+    """
+    Prioridad de refinar cada intervalo [xs[i], xs[i+1]] (0 = no refinar):
+      - curvatura: desviación de ys[i] respecto de la recta entre sus vecinos
+      - saltos grandes en y (incluye cambios de signo grandes): infinito
+      - borde entre valores definidos y NaN (fuera del dominio): infinito
+    ys llega recortado a la ventana visible, así cerca de un polo solo cuenta el
+    intervalo que lo cruza y no los valores enormes (pero continuos) a su lado.
+    """
+    scores = np.zeros(xs.size - 1)
+    with np.errstate(all="ignore"):
+        t = (xs[1:-1] - xs[:-2]) / (xs[2:] - xs[:-2])
+        dev = np.abs(ys[1:-1] - (ys[:-2] + (ys[2:] - ys[:-2]) * t)) / scale
+    dev = np.where(np.isfinite(dev) & (dev > tol), dev, 0.0)
+    scores[:-1] = np.maximum(scores[:-1], dev)
+    scores[1:] = np.maximum(scores[1:], dev)
+
+    with np.errstate(invalid="ignore"):
+        big_jump = np.abs(np.diff(ys)) > jump_frac * scale
+    finite = np.isfinite(ys)
+    scores[big_jump | (finite[:-1] != finite[1:])] = np.inf
+    return scores
+
+
+def sample_function(f: Callable, a: float, b: float,
+                    n_initial: int = INITIAL_POINTS, max_evals: int = MAX_EVALS,
+                    max_depth: int = MAX_DEPTH, tol: float = CURVATURE_TOL,
+                    jump_frac: float = JUMP_FRAC, max_points: int = MAX_POINTS) -> SampledFunction:
+    """
+    Muestreo adaptativo de f en [a, b] para graficar.
+
+    Parte de una malla uniforme y, por niveles, agrega el punto medio de los
+    intervalos con curvatura apreciable, saltos grandes (cambios de signo, polos)
+    o bordes del dominio (NaN), hasta que no quede nada que
+    refinar, se llegue a la profundidad máxima o se agote max_evals (entonces se
+    refinan primero los intervalos con mayor prioridad). Cada nivel evalúa f
+    vectorizada sobre todos los puntos nuevos.
+
+    Los saltos que siguen grandes al final se toman como polos: la línea se corta
+    ahí (NaN). Si quedan más de max_points puntos se reducen con LTTB por tramo.
+    """
+    a, b = float(min(a, b)), float(max(a, b))
+    if not (np.isfinite(a) and np.isfinite(b)) or a == b:
+        raise ValueError("El intervalo de graficación debe ser finito y no vacío.")
+    n_initial = max(int(n_initial), 3)
+    max_evals = max(int(max_evals), n_initial)
+
+    xs = np.linspace(a, b, n_initial)
+    ys = _evaluate(f, xs)
+    n_evals = n_initial
+    # Escala, ventana y rango sugerido salen de la malla uniforme (sin sesgo hacia los polos)
+    scale, lo, hi = _y_window(ys)
+    uniform_ys = ys
+    min_width = (b - a) / (n_initial - 1) / 2 ** max_depth
+
+    while n_evals < max_evals:
+        scores = _interval_scores(xs, np.clip(ys, lo, hi), scale, tol, jump_frac)
+        scores[np.diff(xs) <= min_width * 1.01] = 0.0
+        idx = np.flatnonzero(scores > 0)
+        if idx.size == 0:
+            break
+        budget = max_evals - n_evals
+        if idx.size > budget:
+            idx = np.sort(idx[np.argsort(-scores[idx], kind="stable")[:budget]])
+        mids = 0.5 * (xs[idx] + xs[idx + 1])
+        ys_mid = _evaluate(f, mids)
+        n_evals += idx.size
+        xs = np.insert(xs, idx + 1, mids)
+        ys = np.insert(ys, idx + 1, ys_mid)
+
+    # Polos: infinitos, o saltos grandes que no se resolvieron al refinar (o que
+    # el tope de evaluaciones dejó a medias, si van de un extremo al otro)
+    clipped = np.clip(ys, lo, hi)
+    with np.errstate(invalid="ignore"):
+        jump = np.abs(np.diff(clipped)) > jump_frac * scale
+        outside = (clipped < lo + 1.5 * scale) | (clipped > hi - 1.5 * scale)
+        across = outside[:-1] & outside[1:] & (np.sign(ys[:-1]) != np.sign(ys[1:]))
+    unresolved = np.diff(xs) <= min_width * 1.01
+    breaks = np.flatnonzero(jump & (unresolved | across))
+    poles = np.concatenate([0.5 * (xs[breaks] + xs[breaks + 1]), xs[np.isinf(ys)]])
+    poles.sort()
+    if poles.size:
+        # Un mismo polo puede aparecer como punto infinito y como salto a su lado
+        poles = poles[np.concatenate(([True], np.diff(poles) > 2 * min_width))]
+
+    ys = np.where(np.isfinite(ys), ys, np.nan)
+    xs = np.insert(xs, breaks + 1, 0.5 * (xs[breaks] + xs[breaks + 1]))
+    ys = np.insert(ys, breaks + 1, np.nan)
+
+    if xs.size > max_points:
+        xs, ys = lttb_segments(xs, ys, max_points)
+
+    ylim = None
+    if poles.size:
+        finite = uniform_ys[np.isfinite(uniform_ys)]
+        if finite.size:
+            lo, hi = np.percentile(finite, [5, 95])
+            pad = 0.25 * (hi - lo) if hi > lo else 1.0
+            ylim = (float(lo - pad), float(hi + pad))
+
+    return SampledFunction(xs=xs, ys=ys, poles=poles, n_evals=n_evals, ylim=ylim)
+
+
+def lttb(xs: np.ndarray, ys: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets: índices de n_out puntos que conservan la forma
+    de la curva (siempre incluye el primero y el último). xs debe estar ordenado.
+    """
+    n = xs.size
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    out = np.empty(n_out, dtype=int)
+    out[0], out[-1] = 0, n - 1
+    prev = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], max(edges[i + 1], edges[i] + 1)
+        # Vértice siguiente del triángulo: promedio del próximo bucket (o el último punto)
+        if i + 2 < edges.size:
+            nlo, nhi = edges[i + 1], max(edges[i + 2], edges[i + 1] + 1)
+            cx, cy = xs[nlo:nhi].mean(), ys[nlo:nhi].mean()
+        else:
+            cx, cy = xs[-1], ys[-1]
+        ax, ay = xs[prev], ys[prev]
+        area = np.abs((ax - cx) * (ys[lo:hi] - ay) - (ax - xs[lo:hi]) * (cy - ay))
+        prev = lo + int(np.argmax(area))
+        out[i + 1] = prev
+    return out
+
+
+def lttb_segments(xs: np.ndarray, ys: np.ndarray, n_out: int):
+    """
+    LTTB por tramos finitos: los NaN que cortan la línea se conservan y cada tramo
+    recibe puntos en proporción a su tamaño.
+    """
+    finite = np.isfinite(ys)
+    total = int(finite.sum())
+    if total <= n_out:
+        return xs, ys
+    # Inicio y fin de cada tramo consecutivo de valores finitos
+    padded = np.concatenate(([False], finite, [False]))
+    starts = np.flatnonzero(~padded[:-1] & padded[1:])
+    stops = np.flatnonzero(padded[:-1] & ~padded[1:])
+
+    out_x, out_y = [], []
+    for k, (s, e) in enumerate(zip(starts, stops)):
+        keep = lttb(xs[s:e], ys[s:e], max(2, round(n_out * (e - s) / total)))
+        out_x.append(xs[s:e][keep])
+        out_y.append(ys[s:e][keep])
+        if k + 1 < starts.size:
+            out_x.append([0.5 * (xs[e - 1] + xs[starts[k + 1]])])
+            out_y.append([np.nan])
+    return np.concatenate(out_x), np.concatenate(out_y)
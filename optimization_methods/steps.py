@@ -0,0 +1,28 @@
+# optimization_methods/steps.py
+from typing import NamedTuple, Optional, Tuple
+
+
+class IterationState(NamedTuple):
+    """
+    Estado liviano de una iteración, producido por los generadores *_steps de cada
+    método (y pasado como segundo argumento a callback(iter, state)):
+      - iter:    número de iteración (en búsqueda aleatoria, muestras evaluadas)
+      - x:       estimación actual (raíz, punto óptimo o mejor muestra)
+      - error:   error de la iteración según el criterio del método (NaN si no aplica)
+      - bracket: intervalo vigente tras la iteración, o None en métodos abiertos
+      - row:     fila completa de la tabla de iteraciones (columnas COLUMNS del método)
+
+    callback(iter, state), opcional en cada método, se llama en el hilo del cálculo
+    tras cada iteración (en búsqueda aleatoria, tras cada bloque). Si lanza una
+    excepción (p. ej. la cancelación desde la GUI) el método se detiene y la propaga.
+    """
+    iter: int
+    x: float
+    error: float
+    bracket: Optional[Tuple[float, float]] = None
+    row: tuple = ()
+
+
+# Constructor rápido para los bucles internos: recibe la tupla completa (sin
+# argumentos por nombre), cerca de la mitad del costo de IterationState(...)
+make_state = IterationState._make
@@ -0,0 +1,98 @@
+# optimization_methods/trace.py
+from typing import Dict, List, Optional, Sequence
+import numpy as np
+import pandas as pd
+
+TRACE_MODES = ("none", "arrays", "dataframe")
+
+# Columnas que se muestran como enteros en la tabla
+_INT_COLUMNS = {"iter", "Iter"}
+
+
+class IterationTrace:
+    """
+    Registro de las iteraciones de un método, con tres modos:
+      - "none":      solo cuenta iteraciones; no guarda filas.
+      - "arrays":    buffers columnares de NumPy preasignados (capacidad = max_iter).
+      - "dataframe": guarda filas y construye el DataFrame al primer acceso a .table.
+    Cada método recibe el modo como trace= y devuelve el registro en result.trace;
+    con "none" solo quedan el resultado y los contadores (result.errors queda vacío).
+    """
+
+    def __init__(self, columns: Sequence[str], mode: str = "dataframe", capacity: int = 0):
+        if mode not in TRACE_MODES:
+            raise ValueError(f"trace debe ser uno de {TRACE_MODES}, no {mode!r}.")
+        self.columns: List[str] = list(columns)
+        self.mode = mode
+        self._length = 0
+        self._rows: List[Sequence[float]] = []
+        self._buffers: Optional[np.ndarray] = None
+        self._table: Optional[pd.DataFrame] = None
+        if mode == "arrays":
+            self._buffers = np.empty((len(self.columns), max(int(capacity), 1)))
+
+    def __len__(self) -> int:
+        return self._length
+
+    def _reserve(self, n: int):
+        needed = self._length + n
+        if needed > self._buffers.shape[1]:
+            grown = np.empty((len(self.columns), max(needed, 2 * self._buffers.shape[1])))
+            grown[:, :self._length] = self._buffers[:, :self._length]
+            self._buffers = grown
+
+    def append(self, *values: float):
+        """Registra una iteración; los valores siguen el orden de `columns`."""
+        if self.mode == "arrays":
+            self._reserve(1)
+            self._buffers[:, self._length] = values
+        elif self.mode == "dataframe":
+            self._rows.append(values)
+            self._table = None
+        self._length += 1
+
+    def extend(self, columns: Dict[str, np.ndarray]):
+        """Registra varias iteraciones a la vez a partir de arreglos por columna."""
+        n = len(next(iter(columns.values())))
+        if self.mode == "arrays":
+            self._reserve(n)
+            for j, name in enumerate(self.columns):
+                self._buffers[j, self._length:self._length + n] = columns[name]
+        elif self.mode == "dataframe":
+            self._rows.extend(np.column_stack([columns[name] for name in self.columns]).tolist())
+            self._table = None
+        self._length += n
+
+    def skip(self, n: int):
+        """Cuenta n iteraciones sin datos; solo válido en modo "none"."""
+        if self.mode != "none":
+            raise ValueError('skip() solo aplica al modo trace="none".')
+        self._length += n
+
+    def column(self, name: str) -> np.ndarray:
+        """Valores de una columna como arreglo (vacío en modo "none")."""
+        j = self.columns.index(name)
+        if self.mode == "arrays":
+            return self._buffers[j, :self._length]
+        if self.mode == "dataframe":
+            return np.array([row[j] for row in self._rows], dtype=float)
+        return np.empty(0)
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.column(name)
+
+    def arrays(self) -> Dict[str, np.ndarray]:
+        return {name: self.column(name) for name in self.columns}
+
+    @property
+    def table(self) -> pd.DataFrame:
+        """DataFrame de iteraciones, construido una sola vez al primer acceso."""
+        if self._table is None:
+            if self.mode == "dataframe":
+                table = pd.DataFrame(self._rows, columns=self.columns)
+            else:
+                table = pd.DataFrame(self.arrays(), columns=self.columns)
+            for name in _INT_COLUMNS.intersection(self.columns):
+                table[name] = table[name].astype(int)
+            self._table = table
+        return self._table
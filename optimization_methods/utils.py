@@ -1,5 +1,11 @@
 # optimization_methods/utils.py
-from sympy import symbols, sympify, lambdify
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import NamedTuple
+import builtins
+import threading
+
+from sympy import symbols, sympify, lambdify, diff
 import numpy as np
 
 # Permitimos funciones matemáticas comunes de SymPy (evitamos eval inseguro)
@@ -23,18 +29,222 @@ ALLOWED = {
     "abs": __import__("sympy").Abs,
 }
 
+class ExpressionCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class _LRUCache:
+    """
+    Caché LRU acotada y segura entre hilos. Los fallos de la fábrica no se guardan.
+    La fábrica corre fuera del candado, así una compilación lenta en un hilo no
+    frena las consultas de los demás (p. ej. el hilo de Tk); quien pide una clave
+    que ya se está construyendo espera ese mismo resultado en vez de repetirlo.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._building = {}     # clave -> Future de la entrada en construcción
+        self._lock = threading.Lock()
+
+    def get_or_create(self, key, factory):
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+            future = self._building.get(key)
+            owner = future is None
+            if owner:
+                self.misses += 1
+                future = self._building[key] = Future()
+            else:
+                self.hits += 1
+        if not owner:
+            return future.result()   # relanza el error si la construcción falló
+
+        try:
+            value = factory()
+        except BaseException as e:
+            with self._lock:
+                del self._building[key]
+            future.set_exception(e)
+            raise
+        with self._lock:
+            del self._building[key]
+            self._data[key] = value
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+        future.set_result(value)
+        return value
+
+    def info(self) -> ExpressionCacheInfo:
+        with self._lock:
+            return ExpressionCacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+# Fallas numéricas con las que el backend `math` se rinde y se reintenta con NumPy
+# (ej. math.log(-1), math.exp(1000) o 1/sin(0); NumPy da nan/inf como antes).
+# Cualquier otro error es un problema de la expresión y se propaga
+_SCALAR_ERRORS = (ArithmeticError, ValueError)
+_SCALAR_TYPES = frozenset((float, int, np.float64))
+
+
+def dual_backend(scalar, vector, fused: bool = False):
+    """
+    Función compilada con dos backends, elegidos según el tipo de la entrada:
+      - float/int: `scalar`, lambdificada con `math` (sin el costo de los ufuncs
+        de NumPy); es la que usan los bucles iterativos de los métodos.
+      - cualquier otra cosa (arreglos, listas...): `vector`, lambdificada con
+        NumPy, para gráficas, búsqueda aleatoria y modos por lotes.
+    Si `scalar` tiene una falla numérica (dominio, desborde, división por cero) o
+    no da un número real se evalúa con NumPy, así el resultado es el mismo de
+    siempre (nan, inf, etc.); los demás errores se propagan. Con fused=True cada backend devuelve
+    una lista de valores. Ambas versiones quedan en .scalar y .vector.
+    Es una clausura y no una clase: __call__ en Python cuesta más que el ahorro.
+    """
+    if scalar is None:
+        scalar = vector
+
+    if fused:
+        def f(x):
+            if type(x) in _SCALAR_TYPES:
+                try:
+                    values = scalar(x)
+                except _SCALAR_ERRORS:
+                    return vector(x)
+                for v in values:
+                    if type(v) not in _SCALAR_TYPES:
+                        return vector(x)
+                return values
+            return vector(x)
+    else:
+        def f(x):
+            if type(x) in _SCALAR_TYPES:
+                try:
+                    value = scalar(x)
+                except _SCALAR_ERRORS:
+                    return vector(x)
+                if type(value) in _SCALAR_TYPES:
+                    return value
+            return vector(x)
+
+    f.scalar = scalar
+    f.vector = vector
+    return f
+
+
+def _lambdify_dual(expr, fused: bool = False, **kwargs):
+    try:
+        scalar = lambdify(_x, expr, modules="math", **kwargs)
+    except Exception:
+        # Algo que `math` no sabe imprimir: solo queda el backend NumPy
+        scalar = None
+    else:
+        # Funciones que `math` imprime pero no tiene (ej. re): solo queda NumPy
+        names = scalar.__globals__
+        if any(n not in names and not hasattr(builtins, n) for n in scalar.__code__.co_names):
+            scalar = None
+    return dual_backend(scalar, lambdify(_x, expr, modules="numpy", **kwargs), fused)
+
+
+# Caché compartida por todos los métodos: (expresión normalizada, orden) -> (expr, f numérica)
+EXPRESSION_CACHE_SIZE = 128
+_expression_cache = _LRUCache(EXPRESSION_CACHE_SIZE)
+_x = symbols("x")
+
+
+def normalize_expression(func_str: str) -> str:
+    """
+    Clave de caché: la expresión sin espacios en los extremos. Los espacios
+    internos se conservan porque cambian el significado ("sin x" es inválida,
+    no "sinx"); la misma cadena es la que se pasa a sympify.
+    """
+    return str(func_str).strip()
+
+
+def _build_entry(key: str, order: int):
+    if order == 0:
+        try:
+            expr = sympify(key, locals=ALLOWED)
+        except Exception as e:
+            raise ValueError(f"Función inválida: {e}")
+    else:
+        prev_expr, _ = _compiled(key, order - 1)
+        expr = diff(prev_expr, _x)
+    return expr, _lambdify_dual(expr)
+
+
+def _compiled(key: str, order: int):
+    return _expression_cache.get_or_create((key, order), lambda: _build_entry(key, order))
+
+
+def compile_expression(func_str: str, order: int = 0):
+    """
+    Devuelve (x, expr, f_numérica) para la derivada de orden `order` de func_str
+    (order=0 es la función misma). sympify/diff/lambdify se hacen una sola vez
+    por expresión y orden; las llamadas siguientes salen de la caché LRU.
+    Lanza ValueError si la expresión no es válida.
+    """
+    if order < 0:
+        raise ValueError("El orden de la derivada debe ser >= 0.")
+    expr, f_numeric = _compiled(normalize_expression(func_str), order)
+    return _x, expr, f_numeric
+
+
+def _build_fused(key: str, orders):
+    exprs = [_compiled(key, k)[0] for k in orders]
+    return _lambdify_dual(exprs, fused=True, cse=True)
+
+
+def compile_fused(func_str: str, orders=(0, 1, 2)):
+    """
+    Devuelve g(x) -> [f^(k)(x) para cada k de `orders`] en una sola pasada:
+    lambdify(cse=True) calcula una vez las subexpresiones comunes de f, f', f''...
+    (ej. sin(x)/cos(x) compartidos). También sale de la caché de expresiones.
+    """
+    key = normalize_expression(func_str)
+    orders = tuple(int(k) for k in orders)
+    if not orders or min(orders) < 0:
+        raise ValueError("orders debe contener órdenes de derivada >= 0.")
+    return _expression_cache.get_or_create((key, "fused", orders), lambda: _build_fused(key, orders))
+
+
+def expression_cache_info() -> ExpressionCacheInfo:
+    """Aciertos, fallos, tamaño máximo y actual de la caché de expresiones."""
+    return _expression_cache.info()
+
+
+def clear_expression_cache():
+    _expression_cache.clear()
+
+
 def make_numeric_function(func_str):
     """
     Convierte una cadena como 'x**3 - x - 2' en:
       - expr (Sympy)
-      - f(x) numérica (Numpy) para evaluar en arrays o escalares
+      - f(x) numérica (dual_backend): `math` para escalares y NumPy para arrays
     Lanza ValueError si la expresión no es válida.
+    El resultado se toma de la caché compartida de expresiones.
     """
-    x = symbols("x")
-    try:
-        expr = sympify(func_str, locals=ALLOWED)
-    except Exception as e:
-        raise ValueError(f"Función inválida: {e}")
+    return compile_expression(func_str, 0)
 
-    f_numeric = lambdify(x, expr, modules="numpy")
-    return x, expr, f_numeric
+def evaluate_array(f, xs):
+    """
+    Evalúa f sobre un arreglo y garantiza un ndarray float con la misma forma.
+    Las expresiones constantes (ej. '5') lambdificadas devuelven un escalar,
+    por eso se expande al tamaño de xs.
+    """
+    xs = np.asarray(xs, dtype=float)
+    return np.broadcast_to(np.asarray(f(xs), dtype=float), xs.shape).copy()
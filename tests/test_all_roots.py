@@ -0,0 +1,54 @@
+# tests/test_all_roots.py
+import numpy as np
+import pytest
+
+from optimization_methods.all_roots import find_all_roots
+
+PI = np.pi
+
+
+def test_sign_changes_and_exact_grid_zero():
+    result = find_all_roots("sin(x)", -1, 10)
+    np.testing.assert_allclose(result.roots, [0.0, PI, 2 * PI, 3 * PI], atol=1e-10)
+    assert result.converged.all()
+    assert result.poles.size == 0
+
+
+def test_poles_of_tan_are_rejected():
+    result = find_all_roots("tan(x)", 0.5, 10)
+    np.testing.assert_allclose(result.roots, [PI, 2 * PI, 3 * PI], atol=1e-10)
+    np.testing.assert_allclose(result.poles, [PI / 2, 3 * PI / 2, 5 * PI / 2], atol=1e-8)
+    assert np.abs(result.f_roots).max() < 1e-8
+
+
+@pytest.mark.parametrize("expr, a, b, roots, poles", [
+    ("1/x", -1, 2, [], [0.0]),
+    ("1/(x - 1) + 1", -3, 3, [0.0], [1.0]),
+])
+def test_pole_only_sign_changes_are_not_roots(expr, a, b, roots, poles):
+    result = find_all_roots(expr, a, b)
+    np.testing.assert_allclose(result.roots, roots, atol=1e-10)
+    # Posición del polo: como mucho a un paso de la malla
+    np.testing.assert_allclose(result.poles, poles, atol=(b - a) / 4000)
+
+
+def test_double_root_is_found_as_touch():
+    result = find_all_roots("(x - 1)**2*(x + 2)", -3, 3)
+    np.testing.assert_allclose(result.roots, [-2.0, 1.0], atol=1e-6)
+    assert result.kinds == ["cambio de signo", "toque"]
+
+
+@pytest.mark.parametrize("expr", ["x**2 + 1", "5"])
+def test_no_roots(expr):
+    result = find_all_roots(expr, -2, 2)
+    assert result.roots.size == 0 and result.kinds == []
+
+
+def test_close_roots_are_kept_apart():
+    result = find_all_roots("(x - 1)*(x - 1.001)", 0, 2)
+    np.testing.assert_allclose(result.roots, [1.0, 1.001], atol=1e-10)
+
+
+def test_empty_interval_is_rejected():
+    with pytest.raises(ValueError):
+        find_all_roots("x", 1.0, 1.0)
@@ -0,0 +1,55 @@
+# tests/test_backends.py
+import numpy as np
+import pytest
+
+from benchmarks.corpus import ROOT_PROBLEMS, OPTIMUM_PROBLEMS
+from optimization_methods.utils import compile_expression, compile_fused, dual_backend
+
+PROBLEMS = ROOT_PROBLEMS + OPTIMUM_PROBLEMS
+
+
+@pytest.mark.parametrize("problem", PROBLEMS, ids=lambda p: p.name)
+@pytest.mark.parametrize("order", [0, 1, 2])
+def test_scalar_matches_vector(problem, order):
+    f = compile_expression(problem.expr, order)[2]
+    a, b = problem.bracket
+    xs = np.linspace(a, b, 25)
+    scalar = np.array([f(float(x)) for x in xs])
+    assert f.scalar is not f.vector
+    np.testing.assert_allclose(scalar, f(xs), rtol=1e-12, atol=1e-12)
+
+
+@pytest.mark.parametrize("problem", PROBLEMS, ids=lambda p: p.name)
+def test_fused_scalar_matches_vector(problem):
+    g = compile_fused(problem.expr, (0, 1, 2))
+    xs = np.linspace(*problem.bracket, 9)
+    # Una derivada constante sale como escalar también con arreglos
+    vector = [np.broadcast_to(v, xs.shape) for v in g(xs)]
+    for i, x in enumerate(xs):
+        np.testing.assert_allclose(g(float(x)), [v[i] for v in vector], rtol=1e-12, atol=1e-12)
+
+
+@pytest.mark.parametrize("expr, x", [("log(x)", -1.0), ("exp(x)", 1000.0),
+                                     ("1/sin(x)", 0.0), ("sqrt(x)", -4.0)])
+def test_numeric_failures_fall_back_to_numpy(expr, x):
+    f = compile_expression(expr, 0)[2]
+    with np.errstate(all="ignore"):
+        expected = f.vector(np.array([x]))[0]
+        value = f(x)
+    np.testing.assert_equal(value, expected)
+
+
+def test_other_errors_propagate():
+    def scalar(x):
+        raise TypeError("error de programación")
+
+    f = dual_backend(scalar, lambda x: np.zeros_like(x))
+    with pytest.raises(TypeError):
+        f(1.0)
+    assert f(np.ones(3)).tolist() == [0.0, 0.0, 0.0]
+
+
+def test_functions_missing_from_math_use_numpy():
+    f = compile_expression("re(x)", 0)[2]
+    assert f.scalar is f.vector
+    assert f(2.5) == 2.5
@@ -0,0 +1,116 @@
+# tests/test_batch.py
+import io
+import json
+
+import pytest
+
+from optimization_methods.batch import METHODS, main, read_problems, run_batch, solve_problem
+
+CHAPRA = "2*sin(x) - x**2/10"
+CHAPRA_MAX = 1.4275517787645941
+SQRT2 = 2 ** 0.5
+
+PROBLEMS = {
+    "bisection": ({"expr": "x**2 - 2", "xl": 0, "xu": 2, "tol": 1e-10, "max_iter": 100}, SQRT2),
+    "false_position": ({"expr": "x**2 - 2", "xl": 0, "xu": 2, "tol": 1e-12, "variant": "illinois"}, SQRT2),
+    "brent_root": ({"expr": "x**2 - 2", "xl": 0, "xu": 2, "tol": 1e-12}, SQRT2),
+    "newton_raphson": ({"expr": "x**2 - 2", "x0": 1, "tol": 1e-12}, SQRT2),
+    "golden_ratio": ({"expr": CHAPRA, "xl": 0, "xu": 4, "tol": 1e-8, "max_iter": 100}, CHAPRA_MAX),
+    "brent_optimize": ({"expr": CHAPRA, "xl": 0, "xu": 4, "tol": 1e-8}, CHAPRA_MAX),
+    "newton": ({"expr": CHAPRA, "x0": 2.5, "tol": 1e-10}, CHAPRA_MAX),
+    "quadratic_interpolation": ({"expr": CHAPRA, "x0": 0, "x1": 1, "x2": 4, "tol": 1e-6}, CHAPRA_MAX),
+    "random_search": ({"expr": CHAPRA, "xl": 0, "xu": 4, "max_iter": 20000, "seed": 1}, CHAPRA_MAX),
+}
+
+
+def test_every_method_is_covered():
+    assert set(PROBLEMS) == set(METHODS)
+
+
+@pytest.mark.parametrize("method", sorted(PROBLEMS))
+def test_solve_problem_per_method(method):
+    problem, solution = PROBLEMS[method]
+    out = solve_problem(4, dict(problem, method=method, id="p"))
+    assert out["ok"], out.get("error")
+    assert (out["index"], out["id"], out["method"]) == (4, "p", method)
+    assert out["x"] == pytest.approx(solution, abs=1e-3)
+    assert out["n_evals"] > 0
+    json.dumps(out)
+
+
+def test_csv_fields_are_converted():
+    # Desde CSV todo llega como texto; las celdas vacías se ignoran
+    row = {"method": "newton_raphson", "expr": "x**2 - 2", "x0": "1", "xl": "", "tol": "1e-12",
+           "max_iter": "50.0"}
+    out = solve_problem(0, row)
+    assert out["ok"] and out["x"] == pytest.approx(SQRT2)
+
+
+@pytest.mark.parametrize("problem", [{"method": "simplex", "expr": "x"},
+                                     {"method": "bisection", "expr": "x +* 2", "xl": 0, "xu": 1},
+                                     {"method": "bisection", "expr": "x**2 + 1", "xl": -1, "xu": 1}])
+def test_errors_are_reported_not_raised(problem):
+    out = solve_problem(0, problem)
+    assert out["ok"] is False and out["error"]
+
+
+def test_run_batch_writes_one_line_per_problem():
+    problems = [dict(PROBLEMS["bisection"][0], method="bisection", id=str(i)) for i in range(5)]
+    problems.append({"method": "simplex", "expr": "x"})
+    out = io.StringIO()
+    solved, failed = run_batch(problems, workers=2, chunksize=2, out=out)
+    lines = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert (solved, failed) == (5, 1)
+    assert sorted(line["index"] for line in lines) == list(range(6))
+
+
+def test_main_reads_jsonl_and_writes_output(tmp_path):
+    source = tmp_path / "problemas.jsonl"
+    source.write_text("\n".join(json.dumps(dict(p, method=m)) for m, (p, _) in PROBLEMS.items()) + "\n",
+                      encoding="utf-8")
+    target = tmp_path / "resultados.jsonl"
+    assert main([str(source), "-o", str(target), "--workers", "1"]) == 0
+    assert len(target.read_text(encoding="utf-8").splitlines()) == len(PROBLEMS)
+
+
+def test_unreadable_lines_are_reported_in_place(tmp_path):
+    source = tmp_path / "problemas.jsonl"
+    valid = json.dumps(dict(PROBLEMS["bisection"][0], method="bisection"))
+    source.write_text("\n".join([valid, "{bad json", "", "[1, 2]", valid]) + "\n", encoding="utf-8")
+    out = io.StringIO()
+    assert run_batch(read_problems(str(source)), workers=1, out=out) == (2, 2)
+    lines = {line["index"]: line for line in map(json.loads, out.getvalue().splitlines())}
+    assert [lines[i]["ok"] for i in range(4)] == [True, False, False, True]
+    assert "línea 2" in lines[1]["error"] and "línea 4" in lines[2]["error"].lower()
+
+
+def test_unreadable_csv_row_is_reported_in_place(tmp_path):
+    source = tmp_path / "problemas.csv"
+    source.write_text("method,expr,xl,xu\nbisection,x - 1,0,2\nbisection,\"" + "x" * 200000
+                      + "\",0,2\nbisection,x - 1.5,0,2\n", encoding="utf-8")
+    results = [solve_problem(i, p) for i, p in enumerate(read_problems(str(source)))]
+    assert [r["ok"] for r in results] == [True, False, True]
+
+
+@pytest.mark.filterwarnings("ignore::RuntimeWarning")
+def test_non_finite_values_are_written_as_null():
+    out = solve_problem(0, {"method": "random_search", "expr": "log(x)", "xl": -2, "xu": -1,
+                            "max_iter": 10, "seed": 1})
+    assert out["ok"] and out["f"] is None
+    text = io.StringIO()
+    run_batch([{"method": "random_search", "expr": "log(x)", "xl": -2, "xu": -1, "max_iter": 10}],
+              workers=1, out=text)
+
+    def reject(constant):
+        raise AssertionError(f"{constant} no es JSON válido")
+
+    assert json.loads(text.getvalue(), parse_constant=reject)["f"] is None
+
+
+def test_results_are_written_as_each_problem_finishes():
+    slow = {"method": "random_search", "expr": "sin(x)*cos(x)", "xl": 0, "xu": 1, "max_iter": 3000000}
+    fast = {"method": "bisection", "expr": "x - 1", "xl": 0, "xu": 2}
+    out = io.StringIO()
+    run_batch([slow, fast], workers=2, out=out)
+    # Con bloques de un problema, el rápido no espera al lento
+    assert [json.loads(line)["index"] for line in out.getvalue().splitlines()] == [1, 0]
@@ -0,0 +1,46 @@
+# tests/test_batch_solvers.py
+import numpy as np
+import pytest
+
+from optimization_methods.utils import compile_expression
+from optimization_methods.bisection import bisection, bisection_batch
+from optimization_methods.false_position import false_position, false_position_batch
+
+BRACKETS = (np.array([0.0, 1.0, 1.2, -3.0]), np.array([2.0, 1.5, 3.0, 0.0]))
+
+
+@pytest.fixture
+def f():
+    return compile_expression("x**2 - 2", 0)[2]
+
+
+def test_bisection_batch_matches_scalar_solver(f):
+    batch = bisection_batch(f, *BRACKETS, max_iter=100, tol=1e-10)
+    for i, (xl, xu) in enumerate(zip(*BRACKETS)):
+        single = bisection(f, xl, xu, max_iter=100, tol=1e-10)
+        assert batch.roots[i] == pytest.approx(single.root, abs=1e-12)
+        assert batch.iterations[i] == single.iterations
+    assert batch.converged.all()
+    np.testing.assert_allclose(np.abs(batch.roots), 2 ** 0.5, atol=1e-8)
+
+
+def test_false_position_batch_matches_scalar_solver(f):
+    batch = false_position_batch(f, *BRACKETS, max_iter=500, tol=1e-10)
+    for i, (xl, xu) in enumerate(zip(*BRACKETS)):
+        single = false_position(f, xl, xu, max_iter=500, tol=1e-10)
+        assert batch.roots[i] == pytest.approx(single.root, abs=1e-12)
+        assert batch.iterations[i] == single.iterations
+    np.testing.assert_allclose(np.abs(batch.roots), 2 ** 0.5, atol=1e-8)
+
+
+def test_batch_keeps_the_input_shape(f):
+    xl = np.zeros((2, 3))
+    batch = bisection_batch(f, xl, 2.0, tol=1e-8)
+    assert batch.roots.shape == batch.iterations.shape == (2, 3)
+    assert batch.n_f_evals == 6 * (batch.iterations[0, 0] + 2)
+
+
+@pytest.mark.parametrize("solver", [bisection_batch, false_position_batch])
+def test_bracket_without_sign_change_is_rejected(f, solver):
+    with pytest.raises(ValueError):
+        solver(f, np.array([0.0, 2.0]), np.array([2.0, 3.0]))
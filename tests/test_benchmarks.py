@@ -0,0 +1,33 @@
+# tests/test_benchmarks.py
+import copy
+
+import pytest
+
+from benchmarks.runner import METHODS, compare, run_suite
+
+
+@pytest.fixture(scope="module")
+def report():
+    return run_suite(repeats=1, trace="none")
+
+
+def test_every_method_runs_on_its_corpus(report):
+    failed = [(r["method"], r["problem"], r.get("error")) for r in report["results"] if not r["ok"]]
+    assert failed == []
+    assert {r["method"] for r in report["results"]} == set(METHODS)
+
+
+def test_bracketing_methods_reach_the_known_solution(report):
+    exact = {"bisection", "false_position_illinois", "false_position_pegasus",
+             "false_position_anderson_bjorck", "brent_root", "newton_raphson",
+             "newton_raphson_safeguarded", "golden_ratio", "brent_optimize", "newton"}
+    errors = {(r["method"], r["problem"]): r["abs_error"] for r in report["results"] if r["method"] in exact}
+    assert max(errors.values()) < 1e-6, max(errors, key=errors.get)
+
+
+def test_compare_flags_more_evaluations(report):
+    baseline = copy.deepcopy(report)
+    assert all(row["n_evals"] == row["n_evals_base"] for row in compare(report, baseline))
+    worse = copy.deepcopy(report)
+    worse["results"][0]["n_evals"] += 1
+    assert compare(worse, baseline)[0]["regression"]
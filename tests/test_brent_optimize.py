@@ -0,0 +1,49 @@
+# tests/test_brent_optimize.py
+import numpy as np
+import pytest
+
+from benchmarks.corpus import OPTIMUM_PROBLEMS
+from optimization_methods.utils import compile_expression
+from optimization_methods.evaluation import CountedFunction
+from optimization_methods.brent_optimize import brent_optimize, brent_optimize_steps
+
+CHAPRA = "2*sin(x) - x**2/10"
+
+
+def numeric(problem):
+    return compile_expression(problem.expr, 0)[2]
+
+
+@pytest.mark.parametrize("problem", OPTIMUM_PROBLEMS, ids=lambda p: p.name)
+def test_finds_known_maximum(problem):
+    result = brent_optimize(numeric(problem), *problem.bracket, max_iter=200, tol=1e-10)
+    assert result.point == pytest.approx(problem.solution, abs=1e-6)
+    assert result.n_parabolic + result.n_golden == result.iterations
+
+
+@pytest.mark.parametrize("problem", OPTIMUM_PROBLEMS, ids=lambda p: p.name)
+def test_minimum_of_negated_function(problem):
+    f = numeric(problem)
+    result = brent_optimize(lambda x: -f(x), *problem.bracket, max_iter=200, tol=1e-10, goal="min")
+    assert result.point == pytest.approx(problem.solution, abs=1e-6)
+
+
+def test_unknown_goal_is_rejected():
+    with pytest.raises(ValueError):
+        brent_optimize_steps(lambda x: x, 0.0, 1.0, goal="maximo")
+
+
+def test_steps_yield_the_table_rows():
+    f = compile_expression(CHAPRA, 0)[2]
+    result = brent_optimize(f, 0.0, 4.0, tol=1e-8)
+    rows = [state.row for state in brent_optimize_steps(f, 0.0, 4.0, tol=1e-8)]
+    np.testing.assert_array_equal(np.array(rows, dtype=float), result.table.to_numpy(dtype=float))
+
+
+def test_counts_every_evaluation():
+    counted = CountedFunction(compile_expression(CHAPRA, 0)[2])
+    result = brent_optimize(counted, 0.0, 4.0, tol=1e-8)
+    # Un punto inicial y una evaluación nueva por iteración
+    assert result.n_f_evals == result.n_evals == counted.calls == result.iterations + 1
+    with pytest.raises(AttributeError):
+        result.n_evals = 0
@@ -0,0 +1,26 @@
+# tests/test_brent_root.py
+import numpy as np
+import pytest
+
+from benchmarks.corpus import ROOT_PROBLEMS
+from optimization_methods.utils import compile_expression
+from optimization_methods.brent_root import brent_root, brent_root_steps
+
+
+@pytest.mark.parametrize("problem", ROOT_PROBLEMS, ids=lambda p: p.name)
+def test_finds_known_root(problem):
+    f = compile_expression(problem.expr, 0)[2]
+    result = brent_root(f, *problem.bracket, tol=1e-12)
+    assert result.root == pytest.approx(problem.solution, abs=1e-10)
+
+
+def test_steps_yield_the_table_rows():
+    f = compile_expression("cos(x) - x", 0)[2]
+    result = brent_root(f, 0.0, 1.0, tol=1e-10)
+    rows = [state.row for state in brent_root_steps(f, 0.0, 1.0, tol=1e-10)]
+    np.testing.assert_array_equal(np.array(rows, dtype=float), result.table.to_numpy(dtype=float))
+
+
+def test_bracket_without_sign_change_is_rejected():
+    with pytest.raises(ValueError):
+        brent_root(compile_expression("x**2 + 1", 0)[2], -1.0, 1.0)
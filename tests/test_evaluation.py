@@ -0,0 +1,94 @@
+# tests/test_evaluation.py
+import math
+
+import numpy as np
+import pytest
+
+from optimization_methods.evaluation import CountedFunction, MemoizedFunction, eval_stats
+from optimization_methods.quadratic_interpolation import quadratic_interpolation_method
+from optimization_methods.brent_optimize import brent_optimize
+from optimization_methods.newton_raphson import newton_raphson
+
+
+def test_counted_counts_array_elements():
+    counted = CountedFunction(np.sin)
+    counted(0.5)
+    counted(np.linspace(0, 1, 10))
+    assert counted.calls == 11
+    assert eval_stats(0.0, counted)["n_f_evals"] == 11
+
+
+def test_hits_do_not_count_as_evaluations():
+    counted = CountedFunction(math.exp)
+    memo = MemoizedFunction(counted)
+    for _ in range(5):
+        memo(1.5)
+    assert (counted.calls, memo.hits) == (1, 4)
+
+
+def test_signed_zeros_are_kept_apart():
+    counted = CountedFunction(lambda x: math.copysign(1.0, x))
+    memo = MemoizedFunction(counted)
+    assert memo(0.0) == 1.0
+    assert memo(-0.0) == -1.0
+    assert memo(0.0) == 1.0 and memo(-0.0) == -1.0
+    assert counted.calls == 2
+
+
+def test_int_and_numpy_scalars_share_the_float_entry():
+    counted = CountedFunction(lambda x: x * x)
+    memo = MemoizedFunction(counted)
+    memo(2)
+    memo(2.0)
+    memo(np.float64(2.0))
+    assert counted.calls == 1
+    memo(0)
+    memo(0.0)
+    assert counted.calls == 2
+
+
+def test_arrays_pass_through():
+    counted = CountedFunction(np.cos)
+    memo = MemoizedFunction(counted)
+    xs = np.array([0.0, 1.0])
+    memo(xs)
+    memo(xs)
+    assert counted.calls == 4 and memo.hits == 0
+
+
+def test_oldest_entry_is_evicted():
+    counted = CountedFunction(lambda x: x)
+    memo = MemoizedFunction(counted, maxsize=2)
+    memo(1.0), memo(2.0), memo(3.0)
+    memo(1.0)
+    assert counted.calls == 4
+
+
+def test_snapshot_round_trip():
+    memo = MemoizedFunction(lambda x: 2 * x)
+    memo(-0.0), memo(0.0), memo(3.0)
+    counted = CountedFunction(lambda x: 2 * x)
+    again = MemoizedFunction(counted, initial=memo.snapshot())
+    again(-0.0), again(0.0), again(3.0)
+    assert counted.calls == 0
+    # También acepta claves float sueltas
+    assert MemoizedFunction(counted, initial={1.0: "uno"})(1) == "uno"
+
+
+@pytest.mark.parametrize("points", [(0, 1, 4), (0.0, 1.0, 4.0)])
+def test_quadratic_interpolation_evaluates_each_point_once(points):
+    # Tres evaluaciones iniciales y una por iteración, también con x0 = 0
+    result = quadratic_interpolation_method("x*exp(-x)", *points, max_iter=100)
+    assert result.point == pytest.approx(1.0, abs=1e-4)
+    assert result.n_f_evals == result.iterations + 3
+
+
+def test_brent_optimize_one_evaluation_per_iteration():
+    result = brent_optimize(lambda x: -(x - 0.3) ** 2, 0, 1)
+    assert result.n_f_evals == result.iterations + 1
+
+
+def test_newton_raphson_cycle_reuses_cached_points():
+    # x**3 - 2x + 2 desde 0 cicla entre 0 y 1: solo dos puntos distintos
+    result = newton_raphson("x**3 - 2*x + 2", 0.0, max_iter=20)
+    assert result.n_f_evals == 2
@@ -0,0 +1,123 @@
+# tests/test_expression_cache.py
+import threading
+import time
+
+import pytest
+
+from optimization_methods.utils import (_LRUCache, compile_expression, compile_fused, clear_expression_cache,
+                                        expression_cache_info, make_numeric_function)
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    clear_expression_cache()
+    yield
+    clear_expression_cache()
+
+
+def test_second_compile_is_a_hit():
+    first = compile_expression("x**2 - 2", 0)
+    info = expression_cache_info()
+    assert (info.hits, info.misses) == (0, 1)
+
+    again = compile_expression("x**2 - 2", 0)
+    info = expression_cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+    assert again[2] is first[2]
+
+
+def test_derivative_reuses_lower_orders():
+    compile_expression("sin(x)*x", 2)
+    assert expression_cache_info().currsize == 3          # órdenes 0, 1 y 2
+    _, expr, f1 = compile_expression("sin(x)*x", 1)
+    assert expression_cache_info().hits == 1
+    assert f1(0.0) == pytest.approx(0.0)
+
+
+def test_surrounding_whitespace_shares_the_entry():
+    f = compile_expression("x**3 - 1", 0)[2]
+    assert compile_expression("  x**3 - 1\n", 0)[2] is f
+
+
+def test_fused_matches_separate_derivatives():
+    fused = compile_fused("exp(x)*sin(x)", (0, 1, 2))
+    values = fused(0.7)
+    for k, v in enumerate(values):
+        assert v == pytest.approx(compile_expression("exp(x)*sin(x)", k)[2](0.7))
+
+
+@pytest.mark.parametrize("text", ["1 2", "x 2", "sin x"])
+def test_inner_whitespace_is_not_removed(text):
+    # Como en la versión original: sympify las rechaza, no se convierten en 12, x2 o sinx
+    with pytest.raises(ValueError):
+        make_numeric_function(text)
+
+
+def test_invalid_expression_is_not_cached():
+    with pytest.raises(ValueError):
+        compile_expression("x +* 2", 0)
+    assert expression_cache_info().currsize == 0
+
+
+def test_negative_order_rejected():
+    with pytest.raises(ValueError):
+        compile_expression("x", -1)
+
+
+def test_slow_build_does_not_block_other_lookups():
+    cache = _LRUCache(8)
+    cache.get_or_create("listo", lambda: 1)
+    started, release = threading.Event(), threading.Event()
+
+    def slow():
+        started.set()
+        release.wait(5)
+        return 2
+
+    worker = threading.Thread(target=cache.get_or_create, args=("lento", slow))
+    worker.start()
+    try:
+        assert started.wait(5)
+        # Acierto y fallo de otra clave mientras "lento" se construye, sin esperarlo
+        t0 = time.perf_counter()
+        assert cache.get_or_create("listo", lambda: None) == 1
+        assert cache.get_or_create("otro", lambda: 3) == 3
+        assert time.perf_counter() - t0 < 1.0
+    finally:
+        release.set()
+        worker.join(5)
+    assert cache.get_or_create("lento", lambda: None) == 2
+
+
+def test_same_key_is_built_once_and_failures_are_shared_not_cached():
+    cache = _LRUCache(8)
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def failing():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        raise ValueError("Función inválida")
+
+    errors = []
+
+    def lookup():
+        try:
+            cache.get_or_create("k", failing)
+        except ValueError as e:
+            errors.append(e)
+
+    first = threading.Thread(target=lookup)
+    first.start()
+    assert started.wait(5)
+    second = threading.Thread(target=lookup)
+    second.start()
+    deadline = time.perf_counter() + 5
+    while cache.info().hits == 0 and time.perf_counter() < deadline:
+        time.sleep(0.001)                # hasta que el segundo espere la misma construcción
+    release.set()
+    first.join(5), second.join(5)
+    assert len(calls) == 1 and len(errors) == 2
+    assert cache.info().currsize == 0
+    assert cache.get_or_create("k", lambda: "ok") == "ok"
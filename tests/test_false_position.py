@@ -0,0 +1,58 @@
+# tests/test_false_position.py
+import numpy as np
+import pytest
+
+from benchmarks.corpus import ROOT_PROBLEMS
+from optimization_methods.utils import compile_expression
+from optimization_methods.false_position import (VARIANTS, false_position, false_position_steps,
+                                                 false_position_batch)
+
+BRACKETS = (np.array([0.0, 1.0, 1.2, -3.0]), np.array([2.0, 1.5, 3.0, 0.0]))
+MODIFIED = [variant for variant in VARIANTS if variant != "standard"]
+# Pendiente grande: |f| < tol no se alcanza en punto flotante, el intervalo sí se cierra
+STEEP = "1e9*(exp(x) - 3)"
+
+
+@pytest.mark.parametrize("variant", list(VARIANTS))
+@pytest.mark.parametrize("problem", ROOT_PROBLEMS, ids=lambda p: p.name)
+def test_every_variant_finds_known_root(problem, variant):
+    f = compile_expression(problem.expr, 0)[2]
+    result = false_position(f, *problem.bracket, max_iter=2000, tol=1e-10, variant=variant)
+    assert result.root == pytest.approx(problem.solution, abs=1e-8)
+
+
+@pytest.mark.parametrize("variant", list(VARIANTS))
+def test_batch_matches_scalar_solver(variant):
+    f = compile_expression("x**2 - 2", 0)[2]
+    batch = false_position_batch(f, *BRACKETS, max_iter=500, tol=1e-10, variant=variant)
+    for i, (xl, xu) in enumerate(zip(*BRACKETS)):
+        single = false_position(f, xl, xu, max_iter=500, tol=1e-10, variant=variant)
+        assert batch.roots[i] == pytest.approx(single.root, abs=1e-12)
+        assert batch.iterations[i] == single.iterations
+    np.testing.assert_allclose(np.abs(batch.roots), 2 ** 0.5, atol=1e-8)
+
+
+@pytest.mark.parametrize("variant", MODIFIED)
+def test_modified_variants_stop_on_interval_width_by_default(variant):
+    f = compile_expression(STEEP, 0)[2]
+    states = list(false_position_steps(f, 0.0, 2.0, max_iter=200, tol=1e-8, variant=variant))
+    xl, xu = states[-1].bracket
+    assert states[-1].error >= 1e-8 and abs(xu - xl) < 1e-8
+    assert states[-1].x == pytest.approx(np.log(3), abs=1e-8)
+
+    batch = false_position_batch(f, [0.0], [2.0], max_iter=200, tol=1e-8, variant=variant)
+    assert batch.converged[0] and batch.iterations[0] == len(states)
+
+
+@pytest.mark.parametrize("variant", MODIFIED)
+def test_zero_xtol_keeps_the_residual_criterion_only(variant):
+    f = compile_expression(STEEP, 0)[2]
+    default = false_position(f, 0.0, 2.0, max_iter=200, tol=1e-8, variant=variant)
+    residual = false_position(f, 0.0, 2.0, max_iter=200, tol=1e-8, variant=variant, xtol=0.0)
+    assert default.iterations < 20 and residual.iterations == 200
+
+
+def test_standard_variant_has_no_default_interval_criterion():
+    f = compile_expression(STEEP, 0)[2]
+    result = false_position(f, 0.0, 2.0, max_iter=50, tol=1e-8)
+    assert result.iterations == 50
@@ -0,0 +1,42 @@
+# tests/test_golden_ratio.py
+import pytest
+
+from benchmarks.corpus import OPTIMUM_PROBLEMS
+from optimization_methods.utils import compile_expression
+from optimization_methods.evaluation import CountedFunction
+from optimization_methods.golden_ratio import golden_ratio
+
+CHAPRA = "2*sin(x) - x**2/10"
+
+
+@pytest.mark.parametrize("problem", OPTIMUM_PROBLEMS, ids=lambda p: p.name)
+def test_finds_known_maximum(problem):
+    f = compile_expression(problem.expr, 0)[2]
+    result = golden_ratio(f, *problem.bracket, max_iter=200, tol=1e-10)
+    assert result.point == pytest.approx(problem.solution, abs=1e-6)
+
+
+def test_one_evaluation_per_iteration():
+    counted = CountedFunction(compile_expression(CHAPRA, 0)[2])
+    result = golden_ratio(counted, 0, 4, max_iter=100, tol=1e-8)
+    # Dos puntos interiores al inicio, uno nuevo por iteración y el punto devuelto
+    assert result.n_f_evals == counted.calls == result.iterations + 2
+
+
+@pytest.mark.parametrize("max_evals", [3, 4, 10, 11])
+def test_budget_is_respected_exactly(max_evals):
+    f = compile_expression(CHAPRA, 0)[2]
+    result = golden_ratio(f, 0, 4, max_iter=100, tol=1e-12, max_evals=max_evals)
+    assert result.n_f_evals == max_evals
+
+
+def test_budget_below_three_is_rejected():
+    with pytest.raises(ValueError):
+        golden_ratio(lambda x: x, 0, 1, max_evals=2)
+
+
+def test_n_evals_is_a_read_only_alias():
+    result = golden_ratio(compile_expression(CHAPRA, 0)[2], 0, 4)
+    assert result.n_evals == result.n_f_evals
+    with pytest.raises(AttributeError):
+        result.n_evals = 0
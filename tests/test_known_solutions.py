@@ -0,0 +1,67 @@
+# tests/test_known_solutions.py
+import pytest
+
+from benchmarks.corpus import ROOT_PROBLEMS, OPTIMUM_PROBLEMS
+from optimization_methods.utils import compile_expression
+from optimization_methods.bisection import bisection
+from optimization_methods.false_position import false_position
+from optimization_methods.newton_raphson import newton_raphson
+from optimization_methods.newton import newton_optimize
+from optimization_methods.quadratic_interpolation import quadratic_interpolation_method
+from optimization_methods.random_search import random_search
+
+CHAPRA = "2*sin(x) - x**2/10"
+CHAPRA_MAX = 1.4275517787645941
+
+
+def by_name(problem):
+    return problem.name
+
+
+def numeric(problem):
+    return compile_expression(problem.expr, 0)[2]
+
+
+@pytest.mark.parametrize("problem", ROOT_PROBLEMS, ids=by_name)
+def test_bisection(problem):
+    result = bisection(numeric(problem), *problem.bracket, max_iter=200, tol=1e-10)
+    assert result.root == pytest.approx(problem.solution, abs=1e-8)
+
+
+@pytest.mark.parametrize("problem", ROOT_PROBLEMS, ids=by_name)
+def test_false_position(problem):
+    result = false_position(numeric(problem), *problem.bracket, max_iter=2000, tol=1e-10)
+    assert result.root == pytest.approx(problem.solution, abs=1e-8)
+
+
+@pytest.mark.parametrize("problem", ROOT_PROBLEMS, ids=by_name)
+def test_newton_raphson(problem):
+    result = newton_raphson(problem.expr, problem.x0, tol=1e-12, max_iter=100)
+    assert result.root == pytest.approx(problem.solution, abs=1e-10)
+
+
+@pytest.mark.parametrize("problem", OPTIMUM_PROBLEMS, ids=by_name)
+def test_newton_optimize(problem):
+    result = newton_optimize(problem.expr, problem.x0, tol=1e-12, max_iter=100)
+    assert result.x_opt == pytest.approx(problem.solution, abs=1e-8)
+
+
+@pytest.mark.parametrize("expr, points, solution", [
+    (CHAPRA, (0, 1, 4), CHAPRA_MAX),
+    ("x*exp(-x)", (0, 1, 4), 1.0),
+    ("-(x - 2)**2 + 1", (0, 1, 5), 2.0),
+])
+def test_quadratic_interpolation(expr, points, solution):
+    result = quadratic_interpolation_method(expr, *points, tol=1e-6, max_iter=100)
+    assert result.point == pytest.approx(solution, abs=1e-5)
+
+
+def test_random_search():
+    result = random_search(CHAPRA, 0, 4, max_iter=20000, seed=1)
+    assert result.x_best == pytest.approx(CHAPRA_MAX, abs=1e-3)
+
+
+@pytest.mark.parametrize("solver", [bisection, false_position])
+def test_bracket_without_sign_change_is_rejected(solver):
+    with pytest.raises(ValueError):
+        solver(compile_expression("x**2 + 1", 0)[2], -1.0, 1.0)
@@ -0,0 +1,15 @@
+# tests/test_main.py
+import pytest
+
+tk = pytest.importorskip("tkinter")
+
+import main
+
+
+@pytest.mark.parametrize("name", list(main.METHODS))
+def test_every_menu_entry_loads_its_window(name):
+    # Solo importa el módulo de la ventana; no hace falta pantalla
+    func_name = main.METHODS[name][1]
+    opener = main.load_method(name)
+    assert callable(opener) and opener.__name__ == func_name
+    assert main.load_method(name) is opener
@@ -0,0 +1,30 @@
+# tests/test_newton_multistart.py
+import numpy as np
+import pytest
+
+from optimization_methods.newton import newton_optimize, newton_optimize_multistart
+
+QUARTIC = "-x**4 + 2*x**2"
+
+
+def test_classifies_stationary_points():
+    result = newton_optimize_multistart(QUARTIC, np.linspace(-2, 2, 9), tol=1e-12)
+    np.testing.assert_allclose(result.points, [-1.0, 0.0, 1.0], atol=1e-8)
+    assert result.kinds == ["máximo", "mínimo", "máximo"]
+    assert result.counts.tolist() == [4, 1, 4]
+
+
+def test_each_start_matches_scalar_newton():
+    x0s = np.linspace(-2, 2, 9)
+    result = newton_optimize_multistart(QUARTIC, x0s, tol=1e-12)
+    for i, x0 in enumerate(x0s):
+        single = newton_optimize(QUARTIC, x0, tol=1e-12)
+        assert result.x_final[i] == pytest.approx(single.x_opt, abs=1e-12)
+        assert result.iterations[i] == single.iterations
+    assert result.converged.all()
+
+
+def test_non_finite_starts_are_frozen():
+    result = newton_optimize_multistart(QUARTIC, [np.nan, 0.9], tol=1e-12)
+    assert not result.converged[0] and result.iterations[0] == 0
+    np.testing.assert_allclose(result.points, [1.0])
@@ -0,0 +1,56 @@
+# tests/test_random_search.py
+import numpy as np
+import pandas as pd
+import pytest
+
+from optimization_methods.random_search import random_search, random_search_parallel
+
+EXPR = "2*sin(x) - x**2/10"
+
+
+def test_same_seed_same_result():
+    a = random_search(EXPR, 0, 4, max_iter=5000, seed=7)
+    b = random_search(EXPR, 0, 4, max_iter=5000, seed=7)
+    assert (a.x_best, a.f_best) == (b.x_best, b.f_best)
+    pd.testing.assert_frame_equal(a.table, b.table)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 777, 100000])
+def test_streaming_matches_full_run(chunk_size):
+    full = random_search(EXPR, 0, 4, max_iter=10000, seed=3)
+    stream = random_search(EXPR, 0, 4, max_iter=10000, seed=3, chunk_size=chunk_size)
+    assert (stream.x_best, stream.f_best) == (full.x_best, full.f_best)
+    assert stream.n_f_evals == full.n_f_evals == 10000
+    # La tabla en streaming solo guarda las mejoras y la última muestra
+    assert stream.table["Iter"].iloc[-1] == 10000
+    assert stream.table["f(x_best)"].is_monotonic_increasing
+
+
+def test_streaming_trace_stays_small():
+    # Un millón de muestras: la traza solo crece con las mejoras, no con las muestras
+    result = random_search(EXPR, 0, 4, max_iter=1_000_000, seed=1, chunk_size=65536, trace="arrays")
+    assert result.n_f_evals == 1_000_000
+    assert len(result.trace) < 100
+
+
+@pytest.mark.parametrize("workers", [2, 3])
+def test_parallel_is_bit_identical_across_worker_counts(workers):
+    kwargs = dict(max_iter=20000, seed=2024, chunk_size=1500)
+    single = random_search_parallel(EXPR, 0, 4, workers=1, **kwargs)
+    multi = random_search_parallel(EXPR, 0, 4, workers=workers, **kwargs)
+    assert multi.x_best == single.x_best and multi.f_best == single.f_best
+    pd.testing.assert_frame_equal(multi.table, single.table)
+    assert multi.n_f_evals == single.n_f_evals == 20000
+
+
+def test_parallel_does_not_touch_global_random_state():
+    np.random.seed(5)
+    expected = np.random.random()
+    np.random.seed(5)
+    random_search_parallel(EXPR, 0, 4, max_iter=1000, seed=1, workers=1)
+    assert np.random.random() == expected
+
+
+def test_parallel_rejects_empty_chunks():
+    with pytest.raises(ValueError):
+        random_search_parallel(EXPR, 0, 4, max_iter=10, seed=1, chunk_size=0)
@@ -0,0 +1,67 @@
+# tests/test_resume.py
+import pickle
+
+import pandas as pd
+import pytest
+
+from optimization_methods.golden_ratio import golden_ratio, golden_ratio_steps
+from optimization_methods.newton_raphson import newton_raphson, newton_raphson_steps
+from optimization_methods.utils import compile_expression
+
+CHAPRA = "2*sin(x) - x**2/10"
+
+
+def test_golden_ratio_split_run_matches_single_run():
+    g = compile_expression(CHAPRA, 0)[2]
+    full = golden_ratio(g, 0, 4, max_iter=40, tol=1e-10)
+    first = golden_ratio(g, 0, 4, max_iter=15, tol=1e-10)
+    checkpoint = pickle.loads(pickle.dumps(first.checkpoint))
+    second = golden_ratio(g, None, None, max_iter=25, tol=1e-10, resume=checkpoint)
+
+    assert second.point == full.point
+    assert second.checkpoint.iterations == full.iterations == 40
+    pd.testing.assert_frame_equal(pd.concat([first.table, second.table], ignore_index=True), full.table)
+    # Solo se repite la evaluación final del punto devuelto por la primera parte
+    assert first.n_f_evals + second.n_f_evals == full.n_f_evals + 1
+    # El checkpoint recibido no cambia
+    assert checkpoint == first.checkpoint
+
+
+def test_golden_ratio_steps_update_checkpoint_on_break():
+    g = compile_expression(CHAPRA, 0)[2]
+    reference = golden_ratio(g, 0, 4, max_iter=15, tol=1e-10).checkpoint
+    checkpoint = golden_ratio(g, 0, 4, max_iter=0).checkpoint
+    for state in golden_ratio_steps(g, 0, 4, tol=1e-10, resume=checkpoint):
+        if state.iter == 15:
+            break
+    assert (checkpoint.xl, checkpoint.xu, checkpoint.iterations) == (reference.xl, reference.xu, 15)
+
+
+@pytest.mark.parametrize("safeguard", [False, True])
+def test_newton_raphson_split_run_matches_single_run(safeguard):
+    expr = "x**3 - 2*x - 5"
+    full = newton_raphson(expr, 20.0, tol=1e-12, safeguard=safeguard)
+    first = newton_raphson(expr, 20.0, tol=1e-12, max_iter=3, safeguard=safeguard)
+    checkpoint = pickle.loads(pickle.dumps(first.checkpoint))
+    second = newton_raphson(expr, 0.0, tol=1e-12, resume=checkpoint)
+
+    assert second.root == full.root
+    assert first.iterations + second.iterations == full.iterations
+    assert first.n_f_evals + second.n_f_evals == full.n_f_evals
+    pd.testing.assert_frame_equal(pd.concat([first.table, second.table], ignore_index=True), full.table)
+
+
+@pytest.mark.parametrize("same", [" x**2 - 2 ", "x**2-2", "x*x - 2", "-2 + x**2"])
+def test_newton_raphson_accepts_the_same_function_written_differently(same):
+    first = newton_raphson("x**2 - 2", 1.0, tol=1e-14, max_iter=2)
+    second = newton_raphson(same, 0.0, tol=1e-14, resume=first.checkpoint)
+    assert second.root == pytest.approx(2 ** 0.5, abs=1e-14)
+    assert next(newton_raphson_steps(same, 0.0, tol=1e-14, resume=first.checkpoint)).iter == 3
+
+
+def test_newton_raphson_rejects_another_function():
+    first = newton_raphson("x**2 - 2", 1.0, max_iter=2)
+    with pytest.raises(ValueError):
+        newton_raphson("x**2 - 3", 1.0, resume=first.checkpoint)
+    with pytest.raises(ValueError):
+        newton_raphson_steps("x**2 - 3", 1.0, resume=first.checkpoint)
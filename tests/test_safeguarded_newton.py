@@ -0,0 +1,45 @@
+# tests/test_safeguarded_newton.py
+import math
+
+import pytest
+
+from benchmarks.corpus import ROOT_PROBLEMS
+from optimization_methods.batch import solve_problem
+from optimization_methods.newton_raphson import newton_raphson, newton_raphson_steps
+
+CYCLE = "x**3 - 2*x + 2"        # Newton puro cicla entre 0 y 1 desde x0 = 0
+CYCLE_ROOT = -1.7692923542386314
+
+
+@pytest.mark.parametrize("problem", ROOT_PROBLEMS, ids=lambda p: p.name)
+def test_stays_in_bracket(problem):
+    result = newton_raphson(problem.expr, problem.x0, tol=1e-12, max_iter=200, bracket=problem.bracket)
+    assert result.root == pytest.approx(problem.solution, abs=1e-10)
+    assert result.n_newton + result.n_bisection == result.iterations
+
+
+def test_escapes_cycle():
+    result = newton_raphson(CYCLE, 0.0, tol=1e-12, max_iter=200, safeguard=True)
+    assert result.root == pytest.approx(CYCLE_ROOT, abs=1e-10)
+
+
+def test_sign_change_from_the_starting_point_forms_the_bracket():
+    # El paso de Newton desde 3 cae en -9.5 (cambio de signo, residuo mayor): el
+    # intervalo es (-9.5, 3) sin buscar otro alrededor de x0
+    result = newton_raphson("atan(x)", 3.0, tol=1e-12, safeguard=True)
+    assert result.root == pytest.approx(0.0, abs=1e-12)
+    assert result.n_f_evals <= 8
+    newton_step = 3.0 - math.atan(3.0) * 10.0
+    first = next(newton_raphson_steps("atan(x)", 3.0, tol=1e-12, safeguard=True))
+    assert first.x == pytest.approx(0.5 * (newton_step + 3.0))
+
+
+def test_bracket_without_sign_change_is_rejected():
+    with pytest.raises(ValueError):
+        newton_raphson("x**2 + 1", 0.0, bracket=(-1.0, 1.0))
+
+
+def test_batch_bracket_enables_safeguarded_mode():
+    out = solve_problem(0, {"method": "newton_raphson", "expr": CYCLE, "x0": 0,
+                            "xl": -3, "xu": 0, "tol": 1e-12})
+    assert out["ok"] and out["x"] == pytest.approx(CYCLE_ROOT)
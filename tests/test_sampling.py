@@ -0,0 +1,64 @@
+# tests/test_sampling.py
+import numpy as np
+import pytest
+
+from optimization_methods.sampling import lttb, lttb_segments, sample_function
+from optimization_methods.utils import compile_expression
+
+
+def test_smooth_function_within_budget():
+    f = compile_expression("sin(x)", 0)[2]
+    sampled = sample_function(f, 0, 10, max_evals=2000)
+    assert sampled.n_evals <= 2000
+    assert sampled.xs[0] == 0 and sampled.xs[-1] == 10
+    assert np.all(np.diff(sampled.xs) > 0)
+    np.testing.assert_allclose(sampled.ys, np.sin(sampled.xs))
+    assert sampled.poles.size == 0 and sampled.ylim is None
+
+
+def test_poles_cut_the_line():
+    f = compile_expression("tan(x)", 0)[2]
+    sampled = sample_function(f, 0, 5)
+    np.testing.assert_allclose(sampled.poles, [np.pi / 2, 3 * np.pi / 2], atol=1e-3)
+    assert np.isnan(sampled.ys).sum() >= 2
+    assert sampled.ylim is not None
+
+
+def test_empty_interval_is_rejected():
+    with pytest.raises(ValueError):
+        sample_function(np.sin, 2.0, 2.0)
+
+
+def test_lttb_keeps_endpoints_and_size():
+    xs = np.linspace(0, 1, 1000)
+    ys = np.sin(20 * xs)
+    keep = lttb(xs, ys, 50)
+    assert keep.size == 50 and keep[0] == 0 and keep[-1] == 999
+    assert np.all(np.diff(keep) > 0)
+
+
+def test_lttb_segments_keep_gaps():
+    xs = np.linspace(0, 1, 1000)
+    ys = np.sin(20 * xs)
+    ys[500] = np.nan
+    out_x, out_y = lttb_segments(xs, ys, 100)
+    assert np.isnan(out_y).sum() == 1
+    assert out_x.size <= 103
+
+
+def test_plot_after_poles_rescales_y():
+    pytest.importorskip("tkinter")
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+    from gui.plotting import PlotPanel
+
+    # Sin ventana de Tk: el mismo panel sobre un canvas Agg
+    panel = PlotPanel.__new__(PlotPanel)
+    panel.fig = Figure()
+    panel._setup(FigureCanvasAgg(panel.fig))
+    tan = sample_function(compile_expression("tan(x)", 0)[2], 0, 5)
+    panel.plot_function(tan.xs, tan.ys, "tan", ylim=tan.ylim)
+    sin = sample_function(compile_expression("sin(x)", 0)[2], 0, 5)
+    panel.plot_function(sin.xs, sin.ys, "sin")
+    low, high = panel.ax.get_ylim()
+    assert -1.2 < low < -0.9 and 0.9 < high < 1.2
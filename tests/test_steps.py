@@ -0,0 +1,39 @@
+# tests/test_steps.py
+import numpy as np
+import pytest
+
+from optimization_methods.utils import compile_expression
+from optimization_methods.bisection import bisection, bisection_steps
+from optimization_methods.false_position import false_position, false_position_steps
+from optimization_methods.golden_ratio import golden_ratio, golden_ratio_steps
+from optimization_methods.random_search import random_search, random_search_steps
+
+EXPR = "2*sin(x) - x**2/10"
+
+
+def table_of(steps):
+    return np.array([state.row for state in steps], dtype=float)
+
+
+@pytest.mark.parametrize("solver, steps", [(bisection, bisection_steps),
+                                           (false_position, false_position_steps)])
+def test_root_steps_yield_the_table_rows(solver, steps):
+    f = compile_expression("cos(x) - x", 0)[2]
+    result = solver(f, 0.0, 1.0, tol=1e-10)
+    np.testing.assert_array_equal(table_of(steps(f, 0.0, 1.0, tol=1e-10)),
+                                  result.table.to_numpy(dtype=float))
+
+
+def test_golden_ratio_steps_yield_the_table_rows():
+    f = compile_expression(EXPR, 0)[2]
+    result = golden_ratio(f, 0.0, 4.0, tol=1e-8)
+    np.testing.assert_array_equal(table_of(golden_ratio_steps(f, 0.0, 4.0, tol=1e-8)),
+                                  result.table.to_numpy(dtype=float))
+
+
+def test_random_search_steps_end_at_the_same_best():
+    full = random_search(EXPR, 0, 4, max_iter=3000, seed=11)
+    last = None
+    for last in random_search_steps(EXPR, 0, 4, max_iter=3000, seed=11, chunk_size=500):
+        pass
+    assert last.x == full.x_best
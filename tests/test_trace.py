@@ -0,0 +1,86 @@
+# tests/test_trace.py
+import numpy as np
+import pandas as pd
+import pytest
+
+from optimization_methods.trace import IterationTrace
+from optimization_methods.utils import compile_expression
+from optimization_methods.bisection import bisection
+from optimization_methods.golden_ratio import golden_ratio
+from optimization_methods.newton_raphson import newton_raphson
+
+
+def test_arrays_grow_past_capacity():
+    trace = IterationTrace(["iter", "x"], mode="arrays", capacity=2)
+    for i in range(5):
+        trace.append(i, i / 2)
+    trace.extend({"iter": np.array([5, 6]), "x": np.array([2.5, 3.0])})
+    assert len(trace) == 7
+    np.testing.assert_array_equal(trace["x"], np.arange(7) / 2)
+    assert trace.table["iter"].dtype.kind == "i"
+
+
+def test_none_only_counts():
+    trace = IterationTrace(["iter", "x"], mode="none")
+    trace.append(1, 0.5)
+    trace.skip(3)
+    assert len(trace) == 4 and trace["x"].size == 0
+    with pytest.raises(ValueError):
+        IterationTrace(["x"], mode="dataframe").skip(1)
+
+
+def test_unknown_mode_is_rejected():
+    with pytest.raises(ValueError):
+        IterationTrace(["x"], mode="lista")
+
+
+def run_bisection(trace, callback=None):
+    f = compile_expression("x**3 - x - 2", 0)[2]
+    return bisection(f, 1.0, 2.0, tol=1e-10, trace=trace, callback=callback)
+
+
+def run_golden(trace, callback=None):
+    f = compile_expression("2*sin(x) - x**2/10", 0)[2]
+    return golden_ratio(f, 0.0, 4.0, tol=1e-8, trace=trace, callback=callback)
+
+
+def run_newton_raphson(trace, callback=None):
+    return newton_raphson("cos(x) - x", 0.5, tol=1e-12, trace=trace, callback=callback)
+
+
+RUNS = [run_bisection, run_golden, run_newton_raphson]
+
+
+def estimate(result):
+    return getattr(result, "root", getattr(result, "point", None))
+
+
+@pytest.mark.parametrize("run", RUNS)
+def test_trace_modes_give_the_same_result(run):
+    full = run("dataframe")
+    arrays = run("arrays")
+    bare = run("none")
+    assert estimate(full) == estimate(arrays) == estimate(bare)
+    assert full.iterations == arrays.iterations == bare.iterations == len(bare.trace)
+    pd.testing.assert_frame_equal(arrays.table, full.table)
+    assert bare.errors == [] and len(full.errors) == full.iterations
+
+
+@pytest.mark.parametrize("run", RUNS)
+def test_callback_sees_every_iteration(run):
+    seen = []
+    result = run("none", callback=lambda it, state: seen.append((it, state.x)))
+    assert [it for it, _ in seen] == list(range(1, result.iterations + 1))
+    assert seen[-1][1] == estimate(result)
+
+
+def test_callback_exception_stops_the_method():
+    class Cancel(Exception):
+        pass
+
+    def cancel(it, state):
+        if it == 3:
+            raise Cancel
+
+    with pytest.raises(Cancel):
+        run_bisection("dataframe", callback=cancel)